@@ -1,9 +1,28 @@
+import os
+import time
 import pytest
 import yaml
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from webdriver_manager.chrome import ChromeDriverManager
+
+from pages.base_page import BasePage
+from pages.components.select import MuiSelect
+from utils.browser_pool import BrowserPool
+from utils.data_source import iter_rows, worker_shard
+from utils.cleanup import CleanupLedger
+from utils.browser_profiles import get_profile, build_chrome_options, apply_runtime_settings
+from utils.driver_cache import resolve_chromedriver
+from utils.http_client import close_http_sessions
+from utils.locator_stats import LocatorStats
+from utils.option_catalog import OptionCatalog
+from utils.resource_seeder import ResourceSeeder
+from utils.session_state import SessionStore
+from utils.timings import TimingLog
+from utils.wait_policy import WaitPolicy
+from utils.worker import get_data_namespace
+
+
+pytest_plugins = ["utils.sharding"]
 
 
 def load_config():
@@ -12,37 +31,294 @@ def load_config():
         return yaml.safe_load(file)
 
 
-@pytest.fixture(scope="function")
-def driver():
-    """Setup and teardown for WebDriver"""
-    config = load_config()
-    
-    # Chrome options
-    chrome_options = ChromeOptions()
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-notifications")
-    # Uncomment below for headless mode
-    # chrome_options.add_argument("--headless")
-    
-    # Initialize driver
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests", "data")
+
+# CleanupLedger of this session (None if cleanup is disabled); handed to
+# the creators that need it through the cleanup_ledger fixture
+_cleanup_ledger = None
+
+
+def pytest_configure(config):
+    """Apply page-object settings from config.yaml"""
+    config.addinivalue_line(
+        "markers",
+        "data_source(path, limit=None): parametrize the 'case' argument with rows of a CSV/JSONL file in tests/data",
+    )
+    settle_config = load_config().get("settle", {})
+    BasePage.configure_settle(
+        timeout=settle_config.get("timeout_secs"),
+        quiet_ms=settle_config.get("quiet_ms"),
+    )
+
+    stats_config = load_config().get("locator_stats", {})
+    if stats_config.get("enabled", True):
+        BasePage.locator_stats = LocatorStats(
+            half_life_secs=stats_config.get("half_life_days", 7) * 86400
+        )
+
+    global _cleanup_ledger
+    cleanup_config = load_config().get("cleanup", {})
+    if cleanup_config.get("enabled", True):
+        _cleanup_ledger = CleanupLedger(load_config()["api"], cleanup_config)
+
+    catalog_config = load_config().get("option_catalog", {})
+    if catalog_config.get("enabled", True):
+        MuiSelect.catalog = OptionCatalog(
+            load_config()["base_url"],
+            ttl_secs=catalog_config.get("ttl_secs", 86400),
+        )
+
+
+def pytest_sessionfinish(session):
+    """Persist what this worker learned about locators and start cleanup"""
+    if BasePage.locator_stats is not None:
+        BasePage.locator_stats.save()
+    # Deletes run in the background while pytest writes its reports
+    if _cleanup_ledger is not None:
+        _cleanup_ledger.start()
+
+
+def pytest_unconfigure(config):
+    """Wait briefly for cleanup; anything not deleted is retried by the next run"""
+    global _cleanup_ledger
+    if _cleanup_ledger is not None:
+        _cleanup_ledger.finish(load_config().get("cleanup", {}).get("join_timeout_secs", 5))
+        _cleanup_ledger = None
+    # After cleanup, which deletes through the pooled sessions
+    close_http_sessions()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--offline-driver",
+        action="store_true",
+        default=False,
+        help="Never download chromedriver; only use drivers already cached on disk",
+    )
+    parser.addoption(
+        "--data-offset",
+        action="store",
+        type=int,
+        default=0,
+        help="Resume data-driven tests from this row of their data file",
+    )
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default=None,
+        help="Browser profile from config.yaml browser_profiles (e.g. debug, ci-fast, perf-measure)",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize ``case`` from the test's data_source marker
+
+    Each row becomes one test item, so the sharding plugin spreads rows
+    across workers like any other tests. For very large files, stream
+    rows inside the test with the data_rows fixture instead.
+    """
+    marker = metafunc.definition.get_closest_marker("data_source")
+    if marker is None or "case" not in metafunc.fixturenames:
+        return
+    # pytest needs every parameter set up front, so collection holds the rows
+    rows = list(iter_rows(
+        os.path.join(DATA_DIR, marker.args[0]),
+        start=metafunc.config.getoption("--data-offset"),
+        limit=marker.kwargs.get("limit"),
+    ))
+    metafunc.parametrize("case", rows, ids=lambda row: f"row{row.number}")
+
+
+def create_driver(config, driver_path, profile):
+    """Launch a new Chrome WebDriver session for a browser profile"""
     driver = webdriver.Chrome(
-        service=ChromeService(ChromeDriverManager().install()),
-        options=chrome_options
-    )
-    
-    # Set implicit wait from config
-    driver.implicitly_wait(config.get("implicit_wait", 5))
-    
-    # Navigate to base URL
-    driver.get(config["base_url"])
-    
+        service=ChromeService(driver_path),
+        options=build_chrome_options(profile)
+    )
+    apply_runtime_settings(driver, profile)
+    BasePage.install_settle_hooks(driver)
+    # Async page scripts (settle wait, locator race) poll inside the browser
+    driver.set_script_timeout(max(BasePage.settle_timeout + 5, 60))
+
+    # Implicit waits would stack on top of every explicit, budgeted wait,
+    # so they are switched off while the wait policy is enabled
+    if config.get("wait_policy", {}).get("enabled", True):
+        driver.implicitly_wait(0)
+    else:
+        driver.implicitly_wait(config.get("implicit_wait", 5))
+    return driver
+
+
+@pytest.fixture(scope="session")
+def chromedriver_path(pytestconfig):
+    """Resolve chromedriver once per worker through the on-disk cache"""
+    driver_config = load_config().get("chromedriver", {})
+    offline = (
+        pytestconfig.getoption("--offline-driver")
+        or driver_config.get("offline", False)
+        or os.environ.get("CHROMEDRIVER_OFFLINE") == "1"
+    )
+    return resolve_chromedriver(
+        offline=offline,
+        recheck_browser_secs=driver_config.get("recheck_browser_secs", 3600),
+    )
+
+
+@pytest.fixture(scope="session")
+def browser_profile(pytestconfig):
+    """Browser profile selected with --browser-profile or config.yaml"""
+    return get_profile(load_config(), pytestconfig.getoption("--browser-profile"))
+
+
+@pytest.fixture(scope="session")
+def browser_pool(chromedriver_path, browser_profile):
+    """Pool of warm browsers shared by all tests of this worker"""
+    config = load_config()
+    pool_config = config.get("browser_pool", {})
+    startup_log = TimingLog("browser_startup")
+
+    def launch():
+        start = time.perf_counter()
+        driver = create_driver(config, chromedriver_path, browser_profile)
+        startup_log.record(browser_profile["name"], time.perf_counter() - start)
+        return driver
+
+    pool = BrowserPool(
+        factory=launch,
+        base_url=config["base_url"],
+        size=pool_config.get("size", 1),
+        max_reuse=pool_config.get("max_reuse", 25),
+        max_age=pool_config.get("max_age_secs", 900),
+    )
+    pool.prewarm()
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def driver(browser_pool):
+    """Borrow a reset WebDriver session from the pool"""
+    driver = browser_pool.acquire()
+
     yield driver
-    
-    # Teardown
-    driver.quit()
+
+    # Teardown - reset and return the session instead of quitting it
+    browser_pool.release(driver)
+
+
+@pytest.fixture(scope="function")
+def logged_in_driver(driver, config):
+    """Borrow a browser that is already logged in to the application"""
+    from pages.login_page import LoginPage
+
+    session_config = config.get("session_cache", {})
+    store = SessionStore(config["base_url"])
+    if not session_config.get("enabled", True):
+        store.invalidate()
+
+    logged_in = LoginPage(driver).ensure_logged_in(
+        config.get("email", "test@example.com"),
+        config.get("otp", "1234"),
+        store,
+        config["base_url"],
+        max_age=session_config.get("max_age_secs", 3600),
+        api_config=config.get("api"),
+        auth_config=config.get("auth"),
+    )
+    if not logged_in:
+        pytest.fail("Login failed - could not reach the application")
+    return driver
+
+
+@pytest.fixture(scope="function")
+def resource_seeder(logged_in_driver, config, cleanup_ledger):
+    """Create resources over the API with the logged-in browser's credentials"""
+    return ResourceSeeder.from_driver(logged_in_driver, config, ledger=cleanup_ledger)
+
+
+@pytest.fixture(scope="session")
+def cleanup_ledger():
+    """CleanupLedger deleting recorded entities at session end (None if disabled)"""
+    return _cleanup_ledger
+
+
+@pytest.fixture(scope="session")
+def option_catalog():
+    """Known dropdown options for validating test data up front (None if disabled)"""
+    return MuiSelect.catalog
+
+
+@pytest.fixture(scope="session")
+def data_namespace():
+    """Namespace unique to this run and worker for test data"""
+    return get_data_namespace()
+
+
+@pytest.fixture(scope="session")
+def data_rows(pytestconfig):
+    """Stream this worker's rows of a tests/data file inside a test
+
+    Returns ``rows(name, limit=None)``, an iterator over the rows from
+    --data-offset on. Under the sharding plugin each worker only gets
+    its own share of the rows.
+
+    Usage:
+        for row in data_rows("resources.csv"):
+            ...
+    """
+    def rows(name, limit=None):
+        return iter_rows(
+            os.path.join(DATA_DIR, name),
+            start=pytestconfig.getoption("--data-offset"),
+            shard=worker_shard(),
+            limit=limit,
+        )
+    return rows
+
+
+@pytest.fixture(scope="function", autouse=True)
+def wait_policy():
+    """Give each test a wait budget that every page-object wait draws from"""
+    policy_config = load_config().get("wait_policy", {})
+    if not policy_config.get("enabled", True):
+        yield None
+        return
+
+    WaitPolicy.current = WaitPolicy(
+        test_budget=policy_config.get("test_budget_secs", 300),
+        step_budget=policy_config.get("step_budget_secs"),
+    )
+    yield WaitPolicy.current
+    WaitPolicy.current = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach the wait budget breakdown to failing tests"""
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed and report.when == "call" and WaitPolicy.current is not None:
+        report.sections.append(("wait budget", WaitPolicy.current.report()))
 
 
 @pytest.fixture(scope="function")
 def config():
     """Load and return configuration"""
     return load_config()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report browser startup and dropdown selection times"""
+    for log_name, title in (("browser_startup", "browser startup"), ("dropdowns", "dropdown selection")):
+        timing_log = TimingLog(log_name)
+        rows = [(name, timing_log.summary(name)) for name in sorted(timing_log.samples())]
+        if not rows:
+            continue
+        terminalreporter.section(title)
+        for name, stats in rows:
+            terminalreporter.write_line(
+                f"{name:<18} last={stats['last']:.2f}s median={stats['median']:.2f}s "
+                f"p90={stats['p90']:.2f}s (n={stats['count']})"
+            )
@@ -1,41 +1,354 @@
+import sys
+import time
+from contextlib import nullcontext
+
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+
+from pages.browser_scripts import (
+    SETTLE_INSTRUMENTATION, SETTLE_SCRIPT, CACHED_ELEMENT_SCRIPT, FIND_FIRST_SCRIPT, FILL_FORM_SCRIPT,
+    SNAPSHOT_SCRIPT, ACT_SCRIPT,
+)
+from utils.wait_policy import WaitPolicy, BudgetedWait
 
 
 class BasePage:
+    # Ceiling and quiet window for wait_until_settled (see settle in config.yaml)
+    settle_timeout = 10
+    settle_quiet_ms = 150
+    # Shared LocatorStats used to rank fallback candidates (set from conftest)
+    locator_stats = None
+    # Element handles by (session, condition, locator) -> (DOM epoch, element)
+    _handles = {}
+    max_cached_handles = 256
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
 
+    # ==================== Wait budget ====================
+
+    def budget(self, timeout):
+        """Cap a wait's timeout by what is left of the test/step budget"""
+        policy = WaitPolicy.current
+        return policy.timeout(timeout) if policy else timeout
+
+    def waiter(self, timeout):
+        """WebDriverWait for ``timeout`` seconds, capped and charged by the wait policy"""
+        label = f"{type(self).__name__}.{sys._getframe(1).f_code.co_name}"
+        return BudgetedWait(self.driver, self.budget(timeout), label, WaitPolicy.current)
+
+    def step(self, name, budget=None):
+        """Context manager running a block as a named, budgeted step"""
+        policy = WaitPolicy.current
+        return policy.step(name, budget) if policy else nullcontext()
+
+    def _charge(self, label, start):
+        if WaitPolicy.current:
+            WaitPolicy.current.charge(f"{type(self).__name__}.{label}", time.monotonic() - start)
+
+    # ==================== Settle / locator race ====================
+
+    @classmethod
+    def configure_settle(cls, timeout=None, quiet_ms=None):
+        """Set the default ceiling and quiet window for wait_until_settled"""
+        if timeout is not None:
+            cls.settle_timeout = timeout
+        if quiet_ms is not None:
+            cls.settle_quiet_ms = quiet_ms
+
+    @staticmethod
+    def install_settle_hooks(driver):
+        """Inject the settle instrumentation into every new document (Chrome)"""
+        driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": SETTLE_INSTRUMENTATION}
+        )
+
+    def wait_until_settled(self, timeout=None, quiet_ms=None):
+        """Wait until the DOM stops mutating, no fetch/XHR is pending and
+        no CSS transitions/animations are running
+
+        Args:
+            timeout: Ceiling in seconds (defaults to settle_timeout)
+            quiet_ms: How long the DOM must stay unchanged (defaults to settle_quiet_ms)
+
+        Returns:
+            True if the page settled before the ceiling
+        """
+        timeout = self.budget(self.settle_timeout if timeout is None else timeout)
+        quiet_ms = self.settle_quiet_ms if quiet_ms is None else quiet_ms
+        start = time.monotonic()
+        try:
+            result = self.driver.execute_async_script(SETTLE_SCRIPT, quiet_ms, int(timeout * 1000))
+        except WebDriverException as e:
+            # Navigation in progress or script timeout - nothing to poll
+            print(f"[WARNING] Settle wait interrupted: {e.__class__.__name__}")
+            return False
+        finally:
+            self._charge("wait_until_settled", start)
+        if not result["settled"]:
+            print(f"[WARNING] Page not settled after {result['waited']}ms "
+                  f"(pending requests: {result['pending']}, animations: {result['animations']})")
+        return result["settled"]
+
+    def find_first(self, locators, timeout=5, condition="clickable", key=None):
+        """Race a list of fallback locators in a single browser call
+
+        All candidates are polled together inside the page, so a fallback
+        chain costs one wait instead of one wait per candidate. When several
+        match in the same poll the earliest (most specific) one wins. When
+        ``key`` is given, candidates that keep failing are demoted by
+        locator_stats and the outcome is recorded there.
+
+        Args:
+            locators: List of (By, value) tuples in preference order
+            timeout: Seconds to wait for any candidate to match
+            condition: "present", "visible" or "clickable" (visible and enabled)
+            key: Stats key, e.g. "ManagePage.click_manage_menu"
+
+        Returns:
+            (element, index) of the first matching candidate, where index
+            refers to the original ``locators`` list
+
+        Raises:
+            TimeoutException: If no candidate matched in time
+        """
+        stats = self.locator_stats if key else None
+        order = stats.rank(key, locators) if stats else list(range(len(locators)))
+        ordered = [locators[index] for index in order]
+
+        timeout = self.budget(timeout)
+        start = time.monotonic()
+        result = self.driver.execute_async_script(
+            FIND_FIRST_SCRIPT, [list(loc) for loc in ordered], condition, int(timeout * 1000)
+        )
+        self._charge(key or "find_first", start)
+        if stats:
+            stats.record(key, ordered, result[1] if result else None, time.monotonic() - start)
+        if not result:
+            raise TimeoutException(f"None of {len(locators)} locators became {condition} within {timeout}s")
+        return result[0], order[result[1]]
+
+    def click_first(self, locators, timeout=5, key=None):
+        """Click whichever fallback locator becomes clickable first
+
+        Returns:
+            Index of the candidate clicked, or None if none matched
+        """
+        try:
+            element, index = self.find_first(locators, timeout, key=key)
+        except TimeoutException:
+            return None
+        try:
+            element.click()
+        except WebDriverException:
+            # Covered by an overlay or mid-transition - click inside the page
+            self.driver.execute_script("arguments[0].click();", element)
+        return index
+
+    def act(self, locators, action="click", timeout=5, trusted=False, key=None):
+        """Scroll to, check and act on an element in a single browser call
+
+        The first candidate that is visible, enabled and not covered by a
+        backdrop or overlay is scrolled into view and acted on inside the
+        page. Only with ``trusted=True`` is a native WebDriver click used,
+        for widgets that ignore synthetic events.
+
+        Args:
+            locators: (By, value) tuple or list of fallback tuples
+            action: "click", "focus" or "scroll"
+            timeout: Seconds to wait for a candidate to become actionable
+            trusted: Use a native click instead of a scripted click/focus
+            key: Stats key, e.g. "ManagePage.click_employment_tab"
+
+        Returns:
+            Index of the candidate acted on, or None if none became actionable
+        """
+        candidates = _candidates(locators)
+        stats = self.locator_stats if key else None
+        order = stats.rank(key, candidates) if stats else list(range(len(candidates)))
+        ordered = [candidates[index] for index in order]
+
+        timeout = self.budget(timeout)
+        start = time.monotonic()
+        result = self.driver.execute_async_script(
+            ACT_SCRIPT, [list(loc) for loc in ordered], action, int(timeout * 1000), not trusted
+        )
+        self._charge(key or "act", start)
+        winner = result["index"] if result["index"] != -1 else None
+        if stats:
+            stats.record(key, ordered, winner, time.monotonic() - start)
+        if winner is None:
+            print(f"[WARNING] Could not {action} {candidates[0][1]}: {result['reason']}")
+            return None
+
+        if not result["done"]:
+            # Trusted interaction: a real click (which also focuses)
+            result["element"].click()
+        return order[winner]
+
+    def snapshot(self, locators, child_depth=1):
+        """Read the state of many elements in a single browser call
+
+        Each entry is a plain dict: found, tag, text, visible, enabled,
+        value (inputs only), selected (selected/checked/aria state) and
+        children - the same fields for child elements, ``child_depth``
+        levels deep. Missing elements are ``{"found": False}``.
+
+        Args:
+            locators: List of (By, value) tuples, or {name: (By, value)}
+            child_depth: How many levels of children to include
+
+        Returns:
+            List of dicts in locator order, or {name: dict} for a mapping
+        """
+        named = isinstance(locators, dict)
+        ordered = list(locators.values()) if named else list(locators)
+        states = self.driver.execute_script(SNAPSHOT_SCRIPT, [list(loc) for loc in ordered], child_depth)
+        return dict(zip(locators, states)) if named else states
+
+    def fill_form(self, fields, keystrokes=()):
+        """Fill many React/MUI inputs in one browser call
+
+        Values are set with the native value setter plus bubbling
+        input/change events and read back in the same call. Fields listed
+        in ``keystrokes``, and any field whose value did not stick, are
+        typed with real key presses instead.
+
+        Args:
+            fields: {locator: value}; a key may also be a tuple of
+                fallback locators for the same field
+            keystrokes: Keys of ``fields`` that need real key presses
+
+        Returns:
+            True if every field ended up with its expected value
+        """
+        scripted = [(key, value) for key, value in fields.items() if key not in keystrokes]
+        retry = [key for key in fields if key in keystrokes]
+
+        if scripted:
+            payload = [[[list(loc) for loc in _candidates(key)], str(value)] for key, value in scripted]
+            results = self.driver.execute_script(FILL_FORM_SCRIPT, payload)
+            for (key, value), result in zip(scripted, results):
+                if not result["found"] or _normalize(result["value"]) != _normalize(str(value)):
+                    print(f"[WARNING] Scripted fill did not stick for {_candidates(key)[0]}, typing instead")
+                    retry.append(key)
+
+        ok = True
+        for key in retry:
+            ok = self._type_into(_candidates(key), str(fields[key])) and ok
+        return ok
+
+    def _type_into(self, candidates, value):
+        """Type ``value`` into the first clickable candidate with real key presses"""
+        try:
+            element, _ = self.find_first(candidates, timeout=3)
+            element.click()
+            element.send_keys(Keys.CONTROL + "a")
+            element.send_keys(value)
+            return True
+        except WebDriverException as e:
+            print(f"[WARNING] Could not type into {candidates[0]}: {e.__class__.__name__}")
+            return False
+
+    # ==================== Element handle cache ====================
+
+    def cached_element(self, locator, condition, lookup):
+        """Return the handle found for ``locator`` earlier if it still matches, else ``lookup()``
+
+        A cached handle is validated in a single script call
+        (CACHED_ELEMENT_SCRIPT): still attached, still the element the
+        locator resolves to whenever the DOM epoch moved, and for
+        "clickable" still visible and enabled. That replaces the wait
+        plus displayed/enabled round-trips of a fresh lookup.
+
+        Args:
+            locator: (By, value) tuple
+            condition: What ``lookup`` checks, "present" or "clickable"
+            lookup: Callable that finds the element when the cache misses
+        """
+        key = (self.driver.session_id, condition, tuple(locator))
+        cached = self._handles.get(key)
+        if cached is not None:
+            epoch, element = cached
+            try:
+                check = self.driver.execute_script(
+                    CACHED_ELEMENT_SCRIPT, element, locator[0], locator[1], condition, epoch
+                )
+            except WebDriverException:
+                # Stale handle, or the page is navigating
+                check = {"valid": False}
+            if check["valid"]:
+                self._handles[key] = (check["epoch"], element)
+                return element
+            self._handles.pop(key, None)
+
+        element = lookup()
+        if len(self._handles) >= self.max_cached_handles:
+            self._handles.clear()
+        # No epoch yet: the first reuse re-runs the locator in the page
+        self._handles[key] = (None, element)
+        return element
+
+    def forget_element(self, locator, condition):
+        """Drop the cached handle of ``locator``"""
+        self._handles.pop((self.driver.session_id, condition, tuple(locator)), None)
+
+    def _with_element(self, locator, condition, lookup, action):
+        """Run ``action(element)`` on the cached handle, re-finding once if it went stale"""
+        try:
+            return action(self.cached_element(locator, condition, lookup))
+        except StaleElementReferenceException:
+            self.forget_element(locator, condition)
+            return action(self.cached_element(locator, condition, lookup))
+
     def find_element(self, locator):
         """Find element with explicit wait"""
-        return self.wait.until(EC.presence_of_element_located(locator))
+        wait = self.waiter(10)
+        return self.cached_element(
+            locator, "present", lambda: wait.until(EC.presence_of_element_located(locator))
+        )
 
     def find_clickable_element(self, locator):
         """Find clickable element with explicit wait"""
-        return self.wait.until(EC.element_to_be_clickable(locator))
+        wait = self.waiter(10)
+        return self.cached_element(
+            locator, "clickable", lambda: wait.until(EC.element_to_be_clickable(locator))
+        )
 
     def click(self, locator):
-        """Click on an element"""
-        element = self.find_clickable_element(locator)
-        element.click()
+        """Click on an element (a native WebDriver click, also for cached handles)"""
+        wait = self.waiter(10)
+        self._with_element(
+            locator, "clickable", lambda: wait.until(EC.element_to_be_clickable(locator)),
+            lambda element: element.click(),
+        )
 
     def enter_text(self, locator, text):
         """Enter text into an input field"""
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+
+        wait = self.waiter(10)
+        self._with_element(
+            locator, "present", lambda: wait.until(EC.presence_of_element_located(locator)), type_text
+        )
 
     def get_text(self, locator):
         """Get text from an element"""
-        element = self.find_element(locator)
-        return element.text
+        wait = self.waiter(10)
+        return self._with_element(
+            locator, "present", lambda: wait.until(EC.presence_of_element_located(locator)),
+            lambda element: element.text,
+        )
 
     def is_element_visible(self, locator, timeout=10):
         """Check if element is visible"""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self.waiter(timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             return True
@@ -44,6 +357,16 @@ class BasePage:
 
     def wait_for_url_contains(self, text, timeout=10):
         """Wait for URL to contain specific text"""
-        return WebDriverWait(self.driver, timeout).until(
+        return self.waiter(timeout).until(
             EC.url_contains(text)
         )
+
+
+def _candidates(key):
+    """Normalise a fill_form key to a list of (By, value) locators"""
+    return list(key) if isinstance(key[0], tuple) else [key]
+
+
+def _normalize(value):
+    """Compare values ignoring the spacing/punctuation inputs add when formatting"""
+    return "".join(ch for ch in (value or "") if ch not in " -()")
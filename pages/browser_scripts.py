@@ -0,0 +1,387 @@
+# JavaScript executed in the page by BasePage. Kept here so the page
+# objects stay readable and scripts can share helpers.
+
+# lookup(by, value) resolves a Selenium (By, value) pair to the first
+# matching element; isVisible(el) mirrors Selenium's displayed check.
+LOOKUP_HELPERS = """
+function lookup(by, value) {
+    switch (by) {
+        case 'xpath':
+            return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'css selector': return document.querySelector(value);
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'link text':
+        case 'partial link text':
+            return Array.prototype.find.call(document.links, function (a) {
+                var text = a.textContent.trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            }) || null;
+    }
+    return null;
+}
+function isVisible(el) {
+    var style = window.getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+}
+"""
+
+# Installed into every document (and lazily re-installed if missing). Tracks
+# the time of the last DOM mutation and the number of started and in-flight
+# fetch/XHR requests so the page can be polled for "settled". epoch counts
+# mutation batches; together with the per-document id it tells whether
+# anything changed since an element handle was validated.
+SETTLE_INSTRUMENTATION = """
+(function () {
+    if (window.__settle) { return; }
+    var state = window.__settle = {
+        lastMutation: Date.now(), pending: 0, started: 0,
+        epoch: 0, id: Math.random().toString(36).slice(2)
+    };
+    function observe() {
+        new MutationObserver(function () { state.lastMutation = Date.now(); state.epoch++; })
+            .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    }
+    if (document.documentElement) { observe(); }
+    else { document.addEventListener('DOMContentLoaded', observe); }
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            state.pending++;
+            state.started++;
+            return originalFetch.apply(this, arguments).finally(function () { state.pending--; });
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.pending++;
+        state.started++;
+        this.addEventListener('loadend', function () { state.pending--; });
+        return originalSend.apply(this, arguments);
+    };
+})();
+"""
+
+# Validates a cached element handle in one call. The handle must still be
+# attached; if the DOM changed since its last validation ("<document
+# id>:<mutation epoch>" token) the locator must still resolve to this very
+# element, so a re-rendered list cannot hand back a different row. For
+# "clickable" it must also be visible and enabled. Returns {valid, epoch}.
+CACHED_ELEMENT_SCRIPT = LOOKUP_HELPERS + """
+var el = arguments[0], by = arguments[1], value = arguments[2], condition = arguments[3], epoch = arguments[4];
+var state = window.__settle, now = state && state.id ? state.id + ':' + state.epoch : null;
+function result(valid) { return {valid: valid, epoch: now}; }
+if (!el || !el.isConnected) { return result(false); }
+if (now === null || now !== epoch) {
+    var found;
+    try { found = lookup(by, value); } catch (e) { found = null; }
+    if (found !== el) { return result(false); }
+}
+if (condition === 'clickable' && (!isVisible(el) || el.disabled)) { return result(false); }
+return result(true);
+"""
+
+SETTLE_SCRIPT = SETTLE_INSTRUMENTATION + """
+var quietMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var state = window.__settle, start = Date.now();
+function runningAnimations() {
+    if (!document.getAnimations) { return 0; }
+    return document.getAnimations().filter(function (a) {
+        var timing = a.effect && a.effect.getComputedTiming ? a.effect.getComputedTiming() : {};
+        return a.playState === 'running' && timing.endTime !== Infinity;
+    }).length;
+}
+(function poll() {
+    var now = Date.now(), animations = runningAnimations();
+    var settled = document.readyState !== 'loading' && state.pending <= 0 && animations === 0
+        && now - state.lastMutation >= quietMs;
+    if (settled || now - start >= timeoutMs) {
+        done({settled: settled, waited: now - start, pending: state.pending, animations: animations});
+    } else {
+        setTimeout(poll, 50);
+    }
+})();
+"""
+
+# Evaluates every candidate locator in the page on each poll and returns
+# [element, index] for the first one meeting the condition, or null.
+FIND_FIRST_SCRIPT = LOOKUP_HELPERS + """
+var candidates = arguments[0], condition = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1], start = Date.now();
+function matches(el) {
+    if (!el) { return false; }
+    if (condition === 'present') { return true; }
+    if (!isVisible(el)) { return false; }
+    return condition === 'visible' || !(el.disabled || el.getAttribute('aria-disabled') === 'true');
+}
+(function poll() {
+    for (var i = 0; i < candidates.length; i++) {
+        var el;
+        try { el = lookup(candidates[i][0], candidates[i][1]); } catch (e) { el = null; }
+        if (matches(el)) { done([el, i]); return; }
+    }
+    if (Date.now() - start >= timeoutMs) { done(null); } else { setTimeout(poll, 50); }
+})();
+"""
+
+# Sets many inputs at once through the native value setter and bubbling
+# input/change events (so React/MUI state updates), then reads the values
+# back. Each field is [candidates, value]; returns [{found, value}].
+FILL_FORM_SCRIPT = LOOKUP_HELPERS + """
+var fields = arguments[0], results = [];
+function nativeSetter(el) {
+    var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    return Object.getOwnPropertyDescriptor(proto, 'value').set;
+}
+fields.forEach(function (field) {
+    var el = null;
+    for (var i = 0; i < field[0].length && !el; i++) {
+        try { el = lookup(field[0][i][0], field[0][i][1]); } catch (e) { el = null; }
+    }
+    if (!el) { results.push({found: false, value: null}); return; }
+    el.focus();
+    nativeSetter(el).call(el, field[1]);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+    results.push({found: true, value: null, el: el});
+});
+// Read back after every field has been set, so re-renders are included
+return results.map(function (r) { return {found: r.found, value: r.el ? r.el.value : null}; });
+"""
+
+# Waits for an open MUI listbox, reads every option (data-value + label) and
+# clicks the best match: exact value, exact label, then label containing the
+# wanted text (all case/space-insensitive). Returns {options, chosen}.
+SELECT_OPTION_SCRIPT = LOOKUP_HELPERS + """
+var wanted = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1], start = Date.now();
+function norm(text) { return (text || '').replace(/\\s+/g, ' ').trim().toLowerCase(); }
+function readOptions() {
+    var nodes = document.querySelectorAll("[role='listbox'] [role='option'], ul[role='listbox'] > li");
+    return Array.prototype.filter.call(nodes, isVisible).map(function (el) {
+        return {el: el, value: el.getAttribute('data-value'), label: (el.innerText || '').split('\\n')[0].trim()};
+    });
+}
+function pick(options) {
+    var target = norm(wanted);
+    if (!target) { return -1; }
+    var tests = [
+        function (o) { return norm(o.value) === target; },
+        function (o) { return norm(o.label) === target; },
+        function (o) { return norm(o.label).indexOf(target) !== -1; }
+    ];
+    for (var t = 0; t < tests.length; t++) {
+        for (var i = 0; i < options.length; i++) { if (tests[t](options[i])) { return i; } }
+    }
+    return -1;
+}
+(function poll() {
+    var options = readOptions();
+    if (!options.length && Date.now() - start < timeoutMs) { setTimeout(poll, 50); return; }
+    var chosen = pick(options);
+    if (chosen !== -1) {
+        options[chosen].el.scrollIntoView({block: 'nearest'});
+        options[chosen].el.click();
+    }
+    done({
+        chosen: chosen,
+        options: options.map(function (o) { return {value: o.value, label: o.label}; })
+    });
+})();
+"""
+
+# Waits for typeahead results typed just before the call to stabilise, then
+# clicks the best match. Results count as current once a search request has
+# started and finished after typing (or no request started within the
+# debounce window) and the option list has not changed for quietMs. An exact
+# value/label match already on screen is taken as soon as it is stable.
+# Returns {options, chosen, exact, fallback, waited}.
+TYPEAHEAD_SCRIPT = SETTLE_INSTRUMENTATION + LOOKUP_HELPERS + """
+var wanted = arguments[0], debounceMs = arguments[1], quietMs = arguments[2];
+var timeoutMs = arguments[3], fallbackFirst = arguments[4];
+var done = arguments[arguments.length - 1], start = Date.now();
+var state = window.__settle, baseline = state.started;
+var signature = null, changedAt = start;
+function norm(text) { return (text || '').replace(/\\s+/g, ' ').trim().toLowerCase(); }
+function readOptions() {
+    var nodes = document.querySelectorAll("[role='listbox'] [role='option'], ul[role='listbox'] > li");
+    return Array.prototype.filter.call(nodes, isVisible).map(function (el) {
+        return {el: el, value: el.getAttribute('data-value'), label: (el.innerText || '').split('\\n')[0].trim()};
+    });
+}
+function find(options, exactOnly) {
+    var target = norm(wanted);
+    for (var i = 0; i < options.length; i++) {
+        if (norm(options[i].value) === target || norm(options[i].label) === target) { return i; }
+    }
+    if (exactOnly) { return -1; }
+    for (var j = 0; j < options.length; j++) {
+        if (norm(options[j].label).indexOf(target) !== -1) { return j; }
+    }
+    return -1;
+}
+function finish(options, chosen, exact, fallback) {
+    if (chosen !== -1) {
+        options[chosen].el.scrollIntoView({block: 'nearest'});
+        options[chosen].el.click();
+    }
+    done({
+        chosen: chosen,
+        exact: exact,
+        fallback: !!fallback,
+        waited: Date.now() - start,
+        options: options.map(function (o) { return {value: o.value, label: o.label}; })
+    });
+}
+(function poll() {
+    var now = Date.now(), options = readOptions();
+    var current = options.map(function (o) { return o.label; }).join('\\n');
+    if (current !== signature) { signature = current; changedAt = now; }
+    var quiet = now - Math.max(changedAt, state.lastMutation) >= quietMs;
+    var stable = state.pending <= 0 && quiet;
+    var requested = state.started > baseline;
+
+    if (stable && options.length) {
+        var exact = find(options, true);
+        if (exact !== -1) { finish(options, exact, true); return; }
+    }
+    var searched = requested || (now - start >= debounceMs && options.length);
+    if ((stable && searched) || now - start >= timeoutMs) {
+        var chosen = find(options, false);
+        if (chosen === -1 && fallbackFirst && options.length) { finish(options, 0, false, true); return; }
+        finish(options, chosen, false);
+        return;
+    }
+    setTimeout(poll, 50);
+})();
+"""
+
+# Fills split OTP boxes (ids prefix0..prefixN) in one call: first by pasting
+# the whole code into the first box, then, if the boxes do not show the
+# code, by setting each box through the native setter with bubbling events.
+# Returns {found, mode, value} where value is the combined box contents.
+OTP_FILL_SCRIPT = """
+var code = arguments[0], prefix = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1], start = Date.now();
+var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+function boxes() {
+    var found = [];
+    for (var i = 0; i < code.length; i++) { found.push(document.getElementById(prefix + i)); }
+    return found;
+}
+function combined() {
+    return boxes().map(function (el) { return el ? el.value : ''; }).join('');
+}
+function paste(first) {
+    first.focus();
+    var data = new DataTransfer();
+    data.setData('text/plain', code);
+    first.dispatchEvent(new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true}));
+}
+function setEach(inputs) {
+    inputs.forEach(function (el, i) {
+        el.focus();
+        setter.call(el, code[i]);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    });
+    inputs[inputs.length - 1].blur();
+}
+// Let the app re-render before reading the boxes back
+function verify(mode, next) {
+    setTimeout(function () {
+        if (combined() === code || !next) { done({found: true, mode: mode, value: combined()}); }
+        else { next(); }
+    }, 50);
+}
+(function poll() {
+    var inputs = boxes();
+    if (inputs.some(function (el) { return !el; })) {
+        if (Date.now() - start >= timeoutMs) { done({found: false, mode: null, value: null}); }
+        else { setTimeout(poll, 50); }
+        return;
+    }
+    try { paste(inputs[0]); } catch (e) { /* ClipboardEvent unsupported */ }
+    verify('paste', function () {
+        setEach(boxes());
+        verify('setter', null);
+    });
+})();
+"""
+
+# Reads the state of many locators (first match each) and of their child
+# elements in one call. Returns one plain object per locator.
+SNAPSHOT_SCRIPT = LOOKUP_HELPERS + """
+var locators = arguments[0], childDepth = arguments[1];
+function state(el) {
+    return {
+        tag: el.tagName.toLowerCase(),
+        text: (el.innerText || el.textContent || '').trim(),
+        visible: isVisible(el),
+        enabled: !(el.disabled || el.getAttribute('aria-disabled') === 'true'),
+        value: 'value' in el && typeof el.value === 'string' ? el.value : null,
+        selected: !!(el.selected || el.checked || el.getAttribute('aria-selected') === 'true'
+            || el.getAttribute('aria-checked') === 'true')
+    };
+}
+function children(el, depth) {
+    if (depth <= 0) { return []; }
+    return Array.prototype.map.call(el.children, function (child) {
+        var item = state(child);
+        item.children = children(child, depth - 1);
+        return item;
+    });
+}
+return locators.map(function (loc) {
+    var el;
+    try { el = lookup(loc[0], loc[1]); } catch (e) { el = null; }
+    if (!el) { return {found: false}; }
+    var item = state(el);
+    item.found = true;
+    item.children = children(el, childDepth);
+    return item;
+});
+"""
+
+# Scrolls each candidate into view and checks it is actionable - visible,
+# enabled and the topmost element at its centre (not under a backdrop or
+# overlay) - then performs the action in the page. Returns {index, element,
+# done, reason}; with perform=false the element is returned for a native
+# (trusted) interaction instead.
+ACT_SCRIPT = LOOKUP_HELPERS + """
+var candidates = arguments[0], action = arguments[1], timeoutMs = arguments[2], perform = arguments[3];
+var done = arguments[arguments.length - 1], start = Date.now(), reason = 'not found';
+function describe(el) {
+    return el.tagName.toLowerCase() + (el.className && typeof el.className === 'string'
+        ? '.' + el.className.trim().split(/\\s+/).slice(0, 2).join('.') : '');
+}
+function actionable(el) {
+    if (!isVisible(el)) { reason = 'not visible'; return false; }
+    if (el.disabled || el.getAttribute('aria-disabled') === 'true') { reason = 'disabled'; return false; }
+    el.scrollIntoView({block: 'center', inline: 'center'});
+    if (action === 'scroll') { return true; }
+    var rect = el.getBoundingClientRect();
+    var hit = document.elementFromPoint(rect.left + rect.width / 2, rect.top + rect.height / 2);
+    if (hit && hit !== el && !el.contains(hit)) { reason = 'covered by ' + describe(hit); return false; }
+    return true;
+}
+(function poll() {
+    for (var i = 0; i < candidates.length; i++) {
+        var el;
+        try { el = lookup(candidates[i][0], candidates[i][1]); } catch (e) { el = null; }
+        if (!el || !actionable(el)) { continue; }
+        if (perform) {
+            if (action === 'click') { el.click(); }
+            else if (action === 'focus') { el.focus(); }
+        }
+        done({index: i, element: el, done: perform || action === 'scroll', reason: null});
+        return;
+    }
+    if (Date.now() - start >= timeoutMs) { done({index: -1, element: null, done: false, reason: reason}); }
+    else { setTimeout(poll, 50); }
+})();
+"""
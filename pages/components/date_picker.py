@@ -0,0 +1,151 @@
+from datetime import date
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pages.base_page import BasePage
+
+
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December"]
+
+
+class DatePicker(BasePage):
+    """Driver for MUI date pickers that reaches any date in a fixed number of actions
+
+    Two strategies are supported:
+        keyboard:  type DD/MM/YYYY into the field and validate the value
+        year-view: open the calendar, jump through the year (and month)
+                   views, then click the day
+
+    The strategy that works is detected once per browser session and
+    reused for every later date.
+    """
+
+    INPUT = [
+        (By.XPATH, "//input[@placeholder='DD/MM/YYYY']"),
+        (By.XPATH, "//input[contains(@class,'MuiInputBase-inputAdornedEnd')]"),
+    ]
+    OPEN_BUTTON = [
+        (By.XPATH, "//button[@aria-label='Choose date']"),
+        (By.XPATH, "//svg[@data-testid='CalendarIcon']/parent::button"),
+        (By.XPATH, "//button[contains(@class,'MuiIconButton')]//svg[@data-testid='CalendarIcon']"),
+    ]
+    SWITCH_VIEW_BUTTON = [
+        (By.XPATH, "//button[contains(@class,'MuiPickersCalendarHeader-switchViewButton')]"),
+        (By.XPATH, "//div[contains(@class,'MuiPickersCalendarHeader-label')]"),
+    ]
+    HEADER_LABEL = (By.XPATH, "//div[contains(@class,'MuiPickersCalendarHeader-label')]")
+    PREVIOUS_MONTH = [(By.XPATH, "//button[@title='Previous month' or @aria-label='Previous month']")]
+    NEXT_MONTH = [(By.XPATH, "//button[@title='Next month' or @aria-label='Next month']")]
+
+    # Picker strategy per browser session id
+    _variants = {}
+
+    def __init__(self, driver, input_locators=None):
+        super().__init__(driver)
+        if input_locators:
+            self.INPUT = input_locators
+
+    def select(self, day, month, year):
+        """Select a date, e.g. select(14, 7, 2022)
+
+        Returns:
+            True if the field shows the requested date afterwards
+        """
+        target = date(year, month, day)
+        variant = self._variants.get(self.driver.session_id)
+
+        if variant in (None, "keyboard") and self._type_date(target):
+            self._variants[self.driver.session_id] = "keyboard"
+            print(f"[OK] Entered date: {target:%d/%m/%Y}")
+            return True
+
+        if self._pick_from_calendar(target):
+            self._variants[self.driver.session_id] = "year-view"
+            print(f"[OK] Selected date: {target:%d/%m/%Y}")
+            return True
+
+        print(f"[WARNING] Could not select date {target:%d/%m/%Y}")
+        return False
+
+    # ==================== Keyboard entry ====================
+
+    def _type_date(self, target):
+        expected = f"{target:%d/%m/%Y}"
+        try:
+            field, _ = self.find_first(self.INPUT, timeout=3, key="DatePicker.input")
+            field.click()
+            field.send_keys(Keys.CONTROL + "a")
+            # Sectioned fields (MUI X v6+) take digits only; masked ones accept both
+            field.send_keys(f"{target:%d%m%Y}")
+            if field.get_attribute("value") != expected:
+                field.send_keys(Keys.CONTROL + "a")
+                field.send_keys(expected)
+            field.send_keys(Keys.TAB)
+            return field.get_attribute("value") == expected
+        except WebDriverException:
+            return False
+
+    # ==================== Calendar views ====================
+
+    def _pick_from_calendar(self, target):
+        try:
+            if self.click_first(self.OPEN_BUTTON, timeout=3, key="DatePicker.open") is None:
+                return False
+            self.wait_until_settled()
+
+            # Year view: one click on the header, one on the year
+            self.click_first(self.SWITCH_VIEW_BUTTON, timeout=3, key="DatePicker.switch_view")
+            self.wait_until_settled()
+            year_button = [
+                (By.XPATH, f"//button[contains(@class,'yearButton')][normalize-space()='{target.year}']"),
+                (By.XPATH, f"//div[contains(@class,'MuiYearCalendar') or contains(@class,'MuiYearPicker')]"
+                           f"//*[normalize-space()='{target.year}']"),
+            ]
+            if self.click_first(year_button, timeout=3) is None:
+                return False
+            self.wait_until_settled()
+
+            # Month view if the picker has one, else at most 11 month steps
+            month_button = [
+                (By.XPATH, f"//button[contains(@class,'monthButton')][normalize-space()='{MONTH_NAMES[target.month - 1][:3]}']"),
+                (By.XPATH, f"//button[contains(@class,'monthButton')][normalize-space()='{MONTH_NAMES[target.month - 1]}']"),
+            ]
+            if self.click_first(month_button, timeout=0.5) is not None:
+                self.wait_until_settled()
+            else:
+                self._step_to_month(target)
+
+            day_button = [
+                (By.XPATH, f"//button[contains(@class,'MuiPickersDay-root')][not(contains(@class,'dayOutsideMonth'))]"
+                           f"[normalize-space()='{target.day}']"),
+                (By.XPATH, f"//div[@role='grid']//button[normalize-space()='{target.day}']"),
+            ]
+            if self.click_first(day_button, timeout=3, key="DatePicker.day") is None:
+                return False
+            self.wait_until_settled()
+            return self._field_value() == f"{target:%d/%m/%Y}"
+        except (TimeoutException, WebDriverException) as e:
+            print(f"[WARNING] Calendar navigation failed: {e.__class__.__name__}")
+            return False
+
+    def _step_to_month(self, target):
+        """Walk within the already selected year - never more than 11 clicks"""
+        header, _ = self.find_first([self.HEADER_LABEL], timeout=2, condition="visible",
+                                    key="DatePicker.header_label")
+        label = header.text
+        shown = MONTH_NAMES.index(label.split()[0]) + 1
+        steps = target.month - shown
+        buttons = self.NEXT_MONTH if steps > 0 else self.PREVIOUS_MONTH
+        for _ in range(abs(steps)):
+            self.click_first(buttons, timeout=2)
+            self.wait_until_settled()
+
+    def _field_value(self):
+        try:
+            field, _ = self.find_first(self.INPUT, timeout=1, condition="present")
+            return field.get_attribute("value")
+        except TimeoutException:
+            return ""
@@ -0,0 +1,123 @@
+import time
+
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+
+from pages.base_page import BasePage
+from pages.browser_scripts import SELECT_OPTION_SCRIPT
+from utils.option_catalog import UnknownOption, match_option
+from utils.timings import TimingLog
+
+
+class MuiSelect(BasePage):
+    """Driver for MUI Select / Menu dropdowns
+
+    One select costs two browser calls after the trigger is found: a
+    native click to open the menu (MUI opens on a trusted mousedown) and
+    one script that waits for the options, reads them all, matches and
+    clicks. Options are matched by data-value, then by normalised label,
+    then by label containing the wanted text.
+
+    When a catalog is installed, option lists read from the page are
+    stored in it, and a value that is not in a fresh list is checked
+    against the menu once more before UnknownOption is raised.
+
+    Usage:
+        MuiSelect(driver, "company", triggers).select("GigLabz")
+    """
+
+    timings = TimingLog("dropdowns")
+    # OptionCatalog shared by all dropdowns, installed by conftest
+    catalog = None
+
+    def __init__(self, driver, name, triggers):
+        """
+        Args:
+            driver: WebDriver
+            name: Short name used in logs and timing stats, e.g. "company"
+            triggers: Fallback locators for the element that opens the menu
+        """
+        super().__init__(driver)
+        self.name = name
+        self.triggers = triggers
+        self.options = []
+
+    def open(self, timeout=5):
+        """Open the dropdown
+
+        Returns:
+            Index of the trigger clicked (0 is the primary one), or None
+        """
+        return self.click_first(self.triggers, timeout=timeout, key=f"MuiSelect.{self.name}")
+
+    def choose(self, wanted, timeout=3):
+        """Pick ``wanted`` from the already open menu
+
+        Returns:
+            Label of the selected option, or None if nothing matched
+        """
+        result = self.driver.execute_async_script(
+            SELECT_OPTION_SCRIPT, str(wanted), int(self.budget(timeout) * 1000)
+        )
+        self.options = result["options"]
+        if result["chosen"] == -1:
+            # Close the menu so it does not cover the next field
+            ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+            return None
+        return self.options[result["chosen"]]["label"]
+
+    def harvest(self):
+        """Open the dropdown, read its options without choosing, and close it
+
+        Returns:
+            List of {"value", "label"} dicts (empty if the menu did not open)
+        """
+        trigger = self.open()
+        if trigger is not None:
+            self.choose("")
+            self._remember(trigger, chosen=False)
+        return self.options
+
+    def select(self, wanted):
+        """Open the dropdown and select ``wanted``
+
+        Returns:
+            Label of the selected option, or None on a miss
+
+        Raises:
+            UnknownOption: ``wanted`` is in neither the catalog nor the re-read menu
+        """
+        if self.catalog is not None:
+            try:
+                self.catalog.resolve(self.name, wanted)
+            except UnknownOption:
+                # The stored list may predate the option - re-read it before failing
+                if match_option(self.harvest(), wanted) == -1:
+                    available = ", ".join(option["label"] for option in self.options) or "menu did not open"
+                    raise UnknownOption(f"'{wanted}' is not a valid {self.name}; options on the page: {available}")
+
+        start = time.monotonic()
+        trigger = self.open()
+        label = self.choose(wanted) if trigger is not None else None
+        elapsed = time.monotonic() - start
+        self._remember(trigger, chosen=label is not None)
+
+        if label is None:
+            self.timings.record(f"{self.name} (miss)", elapsed)
+            available = ", ".join(option["label"] for option in self.options) or "menu did not open"
+            print(f"[WARNING] Could not select {self.name}: {wanted} (available: {available})")
+            return None
+
+        self.timings.record(self.name, elapsed)
+        print(f"[OK] Selected {self.name}: {label} ({elapsed:.2f}s)")
+        return label
+
+    def _remember(self, trigger, chosen):
+        """Store the options just read in the catalog
+
+        A menu opened by a generic fallback trigger may belong to another
+        field, so its options are only stored when the primary trigger
+        opened it or the wanted option was found in it.
+        """
+        if self.catalog is not None and trigger is not None and (trigger == 0 or chosen):
+            self.catalog.update(self.name, self.options)
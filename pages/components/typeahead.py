@@ -0,0 +1,90 @@
+import time
+
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pages.base_page import BasePage
+from pages.browser_scripts import TYPEAHEAD_SCRIPT
+from pages.components.select import MuiSelect
+
+
+class Typeahead(BasePage):
+    """Driver for search-as-you-type (MUI Autocomplete) inputs
+
+    The query is typed with real key events, then one script waits until
+    the results are current - the search request fired by the debounce
+    has finished (or none started within ``debounce_ms``) and the option
+    list has stopped changing - and clicks the best match. An exact match
+    already on screen is taken as soon as the list is stable.
+
+    The option picked for each wanted value is remembered for the rest of
+    the session, so later lookups type the full label and match exactly.
+
+    Usage:
+        Typeahead(driver, "reporting manager", inputs).select("Madhu")
+    """
+
+    # (name, wanted) -> label chosen earlier in this session
+    _resolved = {}
+
+    def __init__(self, driver, name, inputs, debounce_ms=600, quiet_ms=200):
+        """
+        Args:
+            driver: WebDriver
+            name: Short name used in logs and timing stats
+            inputs: Fallback locators for the search input
+            debounce_ms: Longest delay between typing and the search request
+            quiet_ms: How long the result list must be unchanged to count as stable
+        """
+        super().__init__(driver)
+        self.name = name
+        self.inputs = inputs
+        self.debounce_ms = debounce_ms
+        self.quiet_ms = quiet_ms
+        self.options = []
+
+    def select(self, wanted, timeout=8, fallback_first=False):
+        """Search for ``wanted`` and click the matching result
+
+        Args:
+            wanted: Text to search for and match (value, label, or part of a label)
+            timeout: Seconds to wait for results
+            fallback_first: Click the first result when nothing matches
+
+        Returns:
+            Label of the selected option, or None if nothing was selected
+        """
+        key = (self.name, wanted.strip().lower())
+        query = self._resolved.get(key, wanted)
+        start = time.monotonic()
+
+        try:
+            field, _ = self.find_first(self.inputs, timeout=5, key=f"Typeahead.{self.name}")
+            field.click()
+            field.send_keys(Keys.CONTROL + "a")
+            field.send_keys(query)
+            result = self.driver.execute_async_script(
+                TYPEAHEAD_SCRIPT, query, self.debounce_ms, self.quiet_ms,
+                int(self.budget(timeout) * 1000), fallback_first,
+            )
+        except (TimeoutException, WebDriverException) as e:
+            print(f"[WARNING] Could not search {self.name}: {e.__class__.__name__}")
+            return None
+
+        elapsed = time.monotonic() - start
+        self.options = result["options"]
+        if result["chosen"] == -1:
+            MuiSelect.timings.record(f"{self.name} (miss)", elapsed)
+            available = ", ".join(option["label"] for option in self.options) or "no results"
+            print(f"[WARNING] Could not select {self.name}: {wanted} (results: {available})")
+            return None
+
+        label = self.options[result["chosen"]]["label"]
+        MuiSelect.timings.record(self.name, elapsed)
+        if result["fallback"]:
+            print(f"[WARNING] {wanted} not found, selected first {self.name}: {label}")
+            return label
+
+        self._resolved[key] = label
+        print(f"[OK] Selected {self.name}: {label} ({elapsed:.2f}s)")
+        return label
@@ -1,10 +1,13 @@
 from selenium.webdriver.common.by import By
-from conftest import driver
 from pages.base_page import BasePage
+from pages.browser_scripts import OTP_FILL_SCRIPT
 import time
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException
+from urllib.parse import urlparse
+from utils.http_client import get_http_session, api_url, dig
+from utils.session_state import SessionSnapshot
 
 class LoginPage(BasePage):
     """Page Object for the GTaskZ Login Page"""
@@ -53,51 +56,46 @@ class LoginPage(BasePage):
     
     def enter_otp(self, otp_code: str):
         """Enter OTP into all OTP input boxes.
+
+        All boxes are filled and verified in one browser call; typing digit
+        by digit is only used when the page does not accept that.
     
         Args:
             otp_code (str): OTP value, e.g. "1234"
         """
-        # Wait for OTP inputs to be present
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.ID, "otp-input-0"))
+        result = self.driver.execute_async_script(
+            OTP_FILL_SCRIPT, otp_code, "otp-input-", int(self.budget(10) * 1000)
         )
-        
-        # Enter each digit into individual OTP input boxes by their specific ID
+        if not result["found"]:
+            raise TimeoutException("OTP input boxes not found")
+        if result["value"] == otp_code:
+            print(f"[OK] Entered OTP ({result['mode']})")
+            return
+
+        print(f"[WARNING] OTP boxes show '{result['value']}' after {result['mode']}, typing digits")
+        self.enter_otp_by_keys(otp_code)
+
+    def enter_otp_by_keys(self, otp_code):
+        """Type the OTP one box at a time with real key events"""
         for i, digit in enumerate(otp_code):
             otp_input_id = f"otp-input-{i}"
             try:
                 # Wait for the specific input to be clickable
-                otp_box = WebDriverWait(self.driver, 5).until(
+                otp_box = self.waiter(5).until(
                     EC.element_to_be_clickable((By.ID, otp_input_id))
                 )
                 
                 # Click on the input to focus it
                 otp_box.click()
-                time.sleep(0.1)
                 
                 # Clear existing value and enter the digit
                 otp_box.send_keys(Keys.CONTROL + "a")
                 otp_box.send_keys(Keys.DELETE)
                 otp_box.send_keys(digit)
-                time.sleep(0.3)
                 
             except Exception as e:
                 print(f"Error entering digit {digit} in {otp_input_id}: {e}")
-                # Fallback: Try using JavaScript to set value
-                self.driver.execute_script(
-                    f"document.getElementById('{otp_input_id}').value = '{digit}';"
-                )
-                # Trigger input event for React/MUI to recognize the change
-                self.driver.execute_script(
-                    f"""
-                    var input = document.getElementById('{otp_input_id}');
-                    var nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-                    nativeInputValueSetter.call(input, '{digit}');
-                    var event = new Event('input', {{ bubbles: true }});
-                    input.dispatchEvent(event);
-                    """
-                )
-                time.sleep(0.2)
+        self.wait_until_settled()
 
     
     def click_login(self):
@@ -149,6 +147,119 @@ class LoginPage(BasePage):
                 print(f"Please enter OTP manually within {manual_otp_wait} seconds...")
                 time.sleep(manual_otp_wait)
 
+    def is_logged_in(self, timeout=10):
+        """Check that the application shell (profile dropdown) is displayed"""
+        if "/otp" in self.driver.current_url:
+            return False
+        return self.is_element_visible(self.PROFILE_CLICK, timeout=timeout)
+
+    def login_via_ui(self, email, otp_code):
+        """Log in through the email + OTP screens and wait for the app shell
+
+        Returns:
+            True if the application was reached after login
+        """
+        self.login_with_email(email)
+        if not self.is_otp_page_displayed():
+            return False
+        self.complete_otp_login(otp_code)
+        return self.is_logged_in(timeout=20)
+
+    def login_via_api(self, email, otp_code, base_url, api_config, auth_config):
+        """Log in over HTTP and seed the browser with the resulting credentials
+
+        Performs the email + OTP exchange with the pooled HTTP session
+        (skipping the send-OTP call when ``send_otp_path`` is empty), then
+        copies the auth token into localStorage and the response cookies
+        into the browser, so the login and OTP screens are never rendered.
+
+        Returns:
+            True if the application accepted the seeded credentials
+        """
+        session = get_http_session(pool_maxsize=api_config.get("pool_maxsize", 10))
+        timeout = api_config.get("timeout_secs", 15)
+        try:
+            if auth_config.get("send_otp_path"):
+                session.post(
+                    api_url(api_config, auth_config["send_otp_path"]),
+                    json={"email": email},
+                    timeout=timeout,
+                ).raise_for_status()
+            response = session.post(
+                api_url(api_config, auth_config["verify_otp_path"]),
+                json={"email": email, "otp": otp_code},
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            token = dig(response.json(), auth_config.get("token_field", "token"))
+        except Exception as e:
+            print(f"[WARNING] API login failed: {e}")
+            return False
+
+        if not token and not response.cookies:
+            print("[WARNING] API login returned no token or cookies")
+            return False
+
+        # Cookies and storage can only be set for the origin currently loaded
+        if not self.driver.current_url.startswith(base_url):
+            self.driver.get(base_url)
+        app_host = urlparse(base_url).hostname
+        for cookie in response.cookies:
+            if cookie.domain and not app_host.endswith(cookie.domain.lstrip(".")):
+                continue
+            self.driver.add_cookie({"name": cookie.name, "value": cookie.value, "path": cookie.path or "/"})
+        if token:
+            self.driver.execute_script(
+                "window.localStorage.setItem(arguments[0], arguments[1]);",
+                auth_config.get("token_storage_key", "token"),
+                token,
+            )
+        self.driver.get(base_url)
+        return self.is_logged_in(timeout=10)
+
+    def ensure_logged_in(self, email, otp_code, store, base_url, max_age=3600,
+                         api_config=None, auth_config=None):
+        """Authenticate, restoring a cached session snapshot when possible
+
+        Tries the cached snapshot first, then the HTTP login fast path (when
+        ``auth_config["api_login"]`` and ``verify_otp_path`` are set) and
+        finally a real UI login.
+        Whatever succeeds is cached for the next test.
+
+        Args:
+            email: Email address or phone number
+            otp_code: 4-digit OTP code
+            store: SessionStore for this worker and base URL
+            base_url: Application URL the snapshot belongs to
+            max_age: Seconds a fresh snapshot is trusted
+            api_config: ``api`` section of the config
+            auth_config: ``auth`` section of the config
+        """
+        snapshot = store.load()
+        if snapshot is not None:
+            snapshot.restore(self.driver, base_url)
+            if self.is_logged_in(timeout=5):
+                print("[OK] Restored cached login session")
+                return True
+            print("[WARNING] Cached session rejected, logging in again")
+            store.invalidate()
+            self.driver.delete_all_cookies()
+            self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            self.driver.get(base_url)
+
+        if auth_config and auth_config.get("api_login") and auth_config.get("verify_otp_path"):
+            if self.login_via_api(email, otp_code, base_url, api_config, auth_config):
+                store.save(SessionSnapshot.capture(self.driver, max_age=max_age))
+                print("[OK] Logged in via API and cached session")
+                return True
+            print("[WARNING] API login rejected, falling back to UI login")
+
+        if not self.login_via_ui(email, otp_code):
+            return False
+        store.save(SessionSnapshot.capture(self.driver, max_age=max_age))
+        print("[OK] Logged in and cached session")
+        return True
+
 
     def logout(self):
         """Logout from the application"""
@@ -158,11 +269,11 @@ class LoginPage(BasePage):
             sys.stdout.flush()
             
             # Wait for page to be stable
-            time.sleep(2)
+            self.wait_until_settled()
             
             # Click profile dropdown (img with alt="down")
             try:
-                profile_elem = WebDriverWait(self.driver, 10).until(
+                profile_elem = self.waiter(10).until(
                     EC.element_to_be_clickable(self.PROFILE_CLICK)
                 )
                 profile_elem.click()
@@ -173,11 +284,11 @@ class LoginPage(BasePage):
                 sys.stdout.flush()
                 return
             
-            time.sleep(1)  # Wait for dropdown menu to appear
+            self.wait_until_settled()  # Wait for dropdown menu to appear
             
             # Click Logout (p element with text "Logout")
             try:
-                logout_elem = WebDriverWait(self.driver, 5).until(
+                logout_elem = self.waiter(5).until(
                     EC.element_to_be_clickable(self.LOGOUT)
                 )
                 logout_elem.click()
@@ -192,18 +303,15 @@ class LoginPage(BasePage):
                     logout_elem.click()
                     sys.stdout.write("[OK] Clicked Logout (alternative)\n")
                     sys.stdout.flush()
-                except:
+                except Exception:
                     sys.stdout.write("[WARNING] Logout element not found\n")
                     sys.stdout.flush()
                     return
             
-            time.sleep(2)
+            self.wait_until_settled()
             sys.stdout.write("[OK] Logout completed\n")
             sys.stdout.flush()
             
         except Exception as e:
             sys.stdout.write(f"[WARNING] Logout failed: {e}\n")
             sys.stdout.flush()
-
-
-
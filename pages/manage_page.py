@@ -1,13 +1,10 @@
 from asyncio import wait
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
 from pages.base_page import BasePage
-import random
-import string
+from pages.page_spec import load_page
+from utils.data_factory import DataFactory
 import time
-from datetime import datetime
 from selenium.common.exceptions import TimeoutException, WebDriverException
 import pytest
 
@@ -46,516 +43,127 @@ class ManagePage(BasePage):
     # Add Resource Button (in modal)
     ADD_RESOURCE_SUBMIT = (By.XPATH, "//button[contains(text(),'Add Resource') and contains(@class,'MuiButton-contained')]")
     
+    # Unique test data generator, created on first use
+    _data_factory = None
+
     def __init__(self, driver):
         super().__init__(driver)
+        # Add Resource modal fields, compiled from pages/specs/resource_form.yaml
+        self.form = load_page("resource_form")(driver)
     
     # ==================== Navigation ====================
     
     def click_manage_menu(self):
         """Click on Manage menu in sidebar"""
-        time.sleep(1)
+        self.wait_until_settled()
         locators = [
             (By.XPATH, "//span[text()='Manage']"),
             (By.XPATH, "//*[contains(text(),'Manage')]"),
         ]
-        for loc in locators:
-            try:
-                element = WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(loc))
-                element.click()
-                print("[OK] Clicked Manage menu")
-                return
-            except:
-                continue
+        if self.click_first(locators, timeout=5, key="ManagePage.click_manage_menu") is not None:
+            print("[OK] Clicked Manage menu")
     
     def click_resource_management_tab(self):
         """Click on Resource Management tab"""
-        time.sleep(1)
+        self.wait_until_settled()
         locators = [
             (By.XPATH, "//button[contains(.,'Resource Management')]"),
             (By.XPATH, "//*[contains(text(),'Resource Management')]"),
         ]
-        for loc in locators:
-            try:
-                element = WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(loc))
-                element.click()
-                print("[OK] Clicked Resource Management tab")
-                return
-            except:
-                continue
+        if self.click_first(locators, timeout=5, key="ManagePage.click_resource_management_tab") is not None:
+            print("[OK] Clicked Resource Management tab")
     
     # ==================== Add Resource Flow ====================
     
     def click_add_resource_button(self):
         """Click the + Add Resource button"""
-        time.sleep(1)
+        self.wait_until_settled()
         locators = [
             (By.XPATH, "//button[contains(text(),'Add Resource')]"),
             (By.XPATH, "//button[contains(@class,'MuiButton')]//span[contains(text(),'Add Resource')]"),
             (By.XPATH, "//button[contains(@class,'MuiButton-containedPrimary')]"),
         ]
-        for loc in locators:
-            try:
-                element = WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(loc))
-                element.click()
-                print("[OK] Clicked Add Resource button")
-                time.sleep(2)  # Wait for modal to open
-                return
-            except:
-                continue
+        if self.click_first(locators, timeout=5, key="ManagePage.click_add_resource_button") is not None:
+            print("[OK] Clicked Add Resource button")
+            self.wait_until_settled()  # Wait for modal to open
     
+    def fill_basic_info(self, first_name, last_name, email, phone):
+        """Fill first name, last name, email and phone in one browser call
+
+        The phone input (react-tel-input) keeps its +91 prefix, so the full
+        international number is set. Falls back to typing for any field
+        the app did not accept.
+        """
+        values = {"first_name": first_name, "last_name": last_name, "email": email, "phone": phone}
+        if self.form.fill(values):
+            print(f"[OK] Filled basic info: {first_name} {last_name}, {email}, +91 {phone}")
+        else:
+            print("[WARNING] Some basic info fields could not be filled")
+
     def enter_first_name(self, first_name):
         """Enter first name - First text input in the modal"""
-        time.sleep(0.5)
-        locators = [
-            (By.XPATH, "//p[contains(text(),'First Name')]/ancestor::div[contains(@class,'MuiGrid-item')]//input"),
-            (By.XPATH, "(//div[@role='dialog']//input[contains(@class,'MuiOutlinedInput-input')])[1]"),
-        ]
-        for loc in locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(loc))
-                element.click()
-                element.send_keys(Keys.CONTROL + "a")
-                element.send_keys(first_name)
-                print(f"[OK] Entered first name: {first_name}")
-                return
-            except:
-                continue
+        return self.form.set_first_name(first_name)
     
     def enter_last_name(self, last_name):
         """Enter last name - Second text input in the modal"""
-        time.sleep(0.5)
-        locators = [
-            (By.XPATH, "//p[contains(text(),'Last Name')]/ancestor::div[contains(@class,'MuiGrid-item')]//input"),
-            (By.XPATH, "(//div[@role='dialog']//input[contains(@class,'MuiOutlinedInput-input')])[2]"),
-        ]
-        for loc in locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(loc))
-                element.click()
-                element.send_keys(Keys.CONTROL + "a")
-                element.send_keys(last_name)
-                print(f"[OK] Entered last name: {last_name}")
-                return
-            except:
-                continue
+        return self.form.set_last_name(last_name)
     
     def enter_email(self, email):
         """Enter email - Third text input in the modal"""
-        time.sleep(0.5)
-        locators = [
-            (By.XPATH, "//p[contains(text(),'Email')]/ancestor::div[contains(@class,'MuiGrid-item')]//input"),
-            (By.XPATH, "(//div[@role='dialog']//input[contains(@class,'MuiOutlinedInput-input')])[3]"),
-        ]
-        for loc in locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(loc))
-                element.click()
-                element.send_keys(Keys.CONTROL + "a")
-                element.send_keys(email)
-                print(f"[OK] Entered email: {email}")
-                return
-            except:
-                continue
+        return self.form.set_email(email)
     
     def enter_phone(self, phone):
-        """Enter phone number - uses react-tel-input component
-        
-        The component already has India (+91) as default.
-        We should NOT clear the field as it will remove the country code.
-        Just click after the +91 and type the number.
-        """
-        time.sleep(0.5)
-        locators = [
-            (By.CSS_SELECTOR, "input.form-control[type='tel']"),
-            (By.XPATH, "//div[contains(@class,'react-tel-input')]//input[@type='tel']"),
-            (By.XPATH, "//input[contains(@placeholder,'123-4567')]"),
-            (By.CSS_SELECTOR, "div.react-tel-input input.form-control"),
-        ]
-        for loc in locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(loc))
-                # Click at the end of the input (after +91)
-                element.click()
-                time.sleep(0.3)
-                
-                # Move cursor to end and type the phone number
-                # Don't clear - just append to existing +91
-                element.send_keys(Keys.END)
-                element.send_keys(phone)
-                print(f"[OK] Entered phone: +91 {phone}")
-                return
-            except:
-                continue
+        """Enter phone number - uses react-tel-input component (+91 is kept)"""
+        return self.form.set_phone(phone)
     
     def select_date_of_joining(self, day, month, year):
-        """Select date of joining using calendar picker - e.g., 14th July 2022"""
-        time.sleep(0.5)
-        
-        # Click on the calendar icon button to open date picker
-        cal_button_locators = [
-            (By.XPATH, "//button[@aria-label='Choose date']"),
-            (By.XPATH, "//svg[@data-testid='CalendarIcon']/parent::button"),
-            (By.XPATH, "//button[contains(@class,'MuiIconButton')]//svg[@data-testid='CalendarIcon']"),
-        ]
-        
-        for loc in cal_button_locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(loc))
-                element.click()
-                print("[OK] Opened date picker")
-                time.sleep(1)
-                break
-            except:
-                continue
-        
-        # Navigate to the correct month/year
-        # First, click on the month/year header to switch to year view
-        try:
-            month_year_button = WebDriverWait(self.driver, 3).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(@class,'MuiPickersCalendarHeader-switchViewButton')]"))
-            )
-            
-            # Get current displayed month/year
-            current_label = self.driver.find_element(By.XPATH, "//div[contains(@class,'MuiPickersCalendarHeader-label')]").text
-            print(f"Current calendar shows: {current_label}")
-            
-            # Navigate backwards to July 2022
-            # Click previous month button multiple times
-            months_map = {'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
-                         'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12}
-            
-            target_date = datetime(year, month, day)
-            current_date = datetime.now()
-            
-            # Calculate months to go back
-            months_diff = (current_date.year - target_date.year) * 12 + (current_date.month - target_date.month)
-            
-            prev_button = (By.XPATH, "//button[@title='Previous month']")
-            for _ in range(months_diff):
-                try:
-                    prev_btn = WebDriverWait(self.driver, 2).until(EC.element_to_be_clickable(prev_button))
-                    prev_btn.click()
-                    time.sleep(0.3)
-                except:
-                    break
-            
-            time.sleep(0.5)
-            
-            # Now click on the day - try multiple locators
-            day_locators = [
-                (By.XPATH, f"//button[contains(@class,'MuiPickersDay') and text()='{day}']"),
-                (By.XPATH, f"//button[contains(@class,'MuiPickersDay-root')][text()='{day}']"),
-                (By.XPATH, f"//button[contains(@class,'MuiButtonBase-root')][text()='{day}']"),
-                (By.XPATH, f"//div[contains(@class,'MuiPickersSlideTransition')]//button[text()='{day}']"),
-                (By.XPATH, f"//button[not(@disabled)][text()='{day}']"),
-            ]
-            
-            for day_loc in day_locators:
-                try:
-                    day_elem = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(day_loc))
-                    day_elem.click()
-                    print(f"[OK] Selected date: {day:02d}/{month:02d}/{year}")
-                    time.sleep(0.5)
-                    return
-                except:
-                    continue
-            
-            # If clicking doesn't work, try JavaScript click
-            try:
-                day_elem = self.driver.find_element(By.XPATH, f"//button[text()='{day}']")
-                self.driver.execute_script("arguments[0].click();", day_elem)
-                print(f"[OK] Selected date via JS: {day:02d}/{month:02d}/{year}")
-                time.sleep(0.5)
-                return
-            except:
-                pass
-            
-        except Exception as e:
-            print(f"Calendar navigation failed: {e}")
-        
-        # Fallback: Try direct input
-        date_input_locators = [
-            (By.XPATH, "//input[@placeholder='DD/MM/YYYY']"),
-            (By.XPATH, "//input[contains(@class,'MuiInputBase-inputAdornedEnd')]"),
-        ]
-        
-        for loc in date_input_locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.presence_of_element_located(loc))
-                element.click()
-                time.sleep(0.3)
-                element.clear()
-                element.send_keys(f"{day:02d}/{month:02d}/{year}")
-                element.send_keys(Keys.TAB)
-                print(f"[OK] Entered date directly: {day:02d}/{month:02d}/{year}")
-                return
-            except:
-                continue
-        
-        print(f"[WARNING] Could not select date")
+        """Select date of joining - e.g., 14th July 2022
+
+        Takes the same number of actions for any date (see DatePicker).
+        """
+        return self.form.set_date_of_joining((day, month, year))
     
     def select_experience(self, years):
         """Select experience from dropdown - values are 0,1,2,3,4 etc."""
-        time.sleep(0.5)
-        
-        # Click on experience dropdown - it's a MuiSelect component
-        exp_locators = [
-            (By.XPATH, "//div[contains(text(),'Select Experience')]"),
-            (By.XPATH, "//p[contains(text(),'Experience')]/ancestor::div[contains(@class,'MuiGrid-item')]//div[@role='combobox']"),
-            (By.XPATH, "//div[contains(@class,'MuiSelect-select')][contains(text(),'Select Experience')]"),
-            (By.XPATH, "(//div[@role='combobox'])[1]"),
-        ]
-        
-        for loc in exp_locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(loc))
-                element.click()
-                break
-            except:
-                continue
-        
-        time.sleep(0.5)
-        
-        # Select the option - options are 0, 1, 2, 3, 4 (just numbers)
-        option_locators = [
-            (By.XPATH, f"//li[@role='option'][text()='{years}']"),
-            (By.XPATH, f"//li[@data-value='{years}']"),
-            (By.XPATH, f"//ul[@role='listbox']//li[text()='{years}']"),
-        ]
-        
-        for loc in option_locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(loc))
-                element.click()
-                print(f"[OK] Selected experience: {years} years")
-                return
-            except:
-                continue
+        return self.form.set_experience(years)
     
     def select_primary_skill(self, skill):
         """Select primary skill - e.g., 'python developer'
         Options: angular, backend developer, django, flask, frontend developer, 
                  html css, javascript, python developer, react, vue
         """
-        time.sleep(0.5)
-        
-        # Click on primary skill dropdown
-        skill_locators = [
-            (By.XPATH, "//div[contains(text(),'Select Skill')]"),
-            (By.XPATH, "//p[contains(text(),'Primary Skill')]/ancestor::div[contains(@class,'MuiGrid-item')]//div[@role='combobox']"),
-            (By.XPATH, "//div[contains(@class,'MuiSelect-select')][contains(text(),'Select Skill')]"),
-            (By.XPATH, "(//div[@role='combobox'])[2]"),
-        ]
-        
-        for loc in skill_locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(loc))
-                element.click()
-                break
-            except:
-                continue
-        
-        time.sleep(0.5)
-        
-        # Select the option (case-insensitive match)
-        option_locators = [
-            (By.XPATH, f"//li[@role='option'][translate(text(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz')='{skill.lower()}']"),
-            (By.XPATH, f"//li[@role='option'][contains(translate(text(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'{skill.lower()}')]"),
-            (By.XPATH, f"//ul[@role='listbox']//li[contains(text(),'{skill}')]"),
-        ]
-        
-        for loc in option_locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(loc))
-                element.click()
-                print(f"[OK] Selected primary skill: {skill}")
-                return
-            except:
-                continue
-        print(f"[WARNING] Could not select skill: {skill}")
+        return self.form.set_primary_skill(skill)
     
-   
-
     def select_reporting_manager(self, manager_name="Madhu Poclassery"):
-        """Select reporting manager - click input to open dropdown, then select first option"""
-        time.sleep(0.5)
-        
-        try:
-            # Click on the Search input field to open dropdown
-            input_field = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//input[@placeholder='Search...']"))
-            )
-            input_field.click()
-            print("[OK] Clicked Reporting Manager input")
-            time.sleep(1)
-            
-            # Wait for dropdown listbox to appear
-            WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.XPATH, "//ul[@role='listbox']"))
-            )
-            print("[OK] Dropdown opened")
-            time.sleep(0.5)
-            
-            # Try to find and click the specific manager first
-            try:
-                option = WebDriverWait(self.driver, 2).until(
-                    EC.element_to_be_clickable((By.XPATH, f"//ul[@role='listbox']//li[contains(.,'{manager_name}')]"))
-                )
-                self.driver.execute_script("arguments[0].click();", option)
-                print(f"[OK] Selected: {manager_name}")
-                return True
-            except:
-                pass
-            
-            # Fallback: Click the first option in the dropdown
-            try:
-                first_option = WebDriverWait(self.driver, 3).until(
-                    EC.element_to_be_clickable((By.XPATH, "//ul[@role='listbox']//li[1]"))
-                )
-                option_text = first_option.text.split('\n')[0]  # Get first line (name)
-                self.driver.execute_script("arguments[0].click();", first_option)
-                print(f"[OK] Selected first option: {option_text}")
-                return True
-            except:
-                pass
-            
-            # Last fallback: keyboard navigation
-            input_field.send_keys(Keys.ARROW_DOWN)
-            time.sleep(0.3)
-            input_field.send_keys(Keys.ENTER)
-            print("[OK] Selected via keyboard")
-            return True
-            
-        except Exception as e:
-            print(f"[WARNING] Could not select reporting manager: {e}")
-            return False
+        """Search for the reporting manager and select it; falls back to the first result"""
+        return self.form.set_reporting_manager(manager_name) is not None
 
     # ==================== Employment Tab ====================
     
     def click_employment_tab(self):
         """Click on Employment tab in the modal"""
-        time.sleep(2)  # Wait for modal to be fully loaded
-        
-        print("Attempting to click Employment tab...")
-        
-        # First, try to find all tabs and click the Employment one
-        try:
-            # Find all tab buttons in the modal
-            tabs = self.driver.find_elements(By.XPATH, "//button[@role='tab']")
-            print(f"Found {len(tabs)} tabs")
-            for tab in tabs:
-                tab_text = tab.text.strip()
-                print(f"Tab found: '{tab_text}'")
-                if "Employment" in tab_text:
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-                    time.sleep(0.5)
-                    self.driver.execute_script("arguments[0].click();", tab)
-                    print("✓ Clicked Employment tab (found in tabs list)")
-                    time.sleep(1.5)
-                    return
-        except Exception as e:
-            print(f"Tab iteration failed: {e}")
-        
-        # Try specific locators
+        self.wait_until_settled()  # Wait for modal to be fully loaded
         locators = [
+            (By.XPATH, "//button[@role='tab'][contains(.,'Employment')]"),
             (By.XPATH, "//button[@role='tab'][.//span[contains(text(),'Employment')]]"),
             (By.XPATH, "//button[contains(@class,'MuiTab-root')][contains(.,'Employment')]"),
             (By.XPATH, "//div[contains(@class,'MuiTabs')]//button[contains(.,'Employment')]"),
             (By.XPATH, "//button[@role='tab'][2]"),  # Employment is typically the 2nd tab
             (By.CSS_SELECTOR, "button.MuiTab-root:nth-child(2)"),
         ]
-        
-        for loc in locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.presence_of_element_located(loc))
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                time.sleep(0.3)
-                self.driver.execute_script("arguments[0].click();", element)
-                print(f"✓ Clicked Employment tab using {loc}")
-                time.sleep(1.5)
-                return
-            except Exception as e:
-                continue
-        
-        print("⚠ Could not click Employment tab")
+        if self.act(locators, key="ManagePage.click_employment_tab") is not None:
+            print("✓ Clicked Employment tab")
+            self.wait_until_settled()
+        else:
+            print("⚠ Could not click Employment tab")
     
     def select_company(self, company_name="GigLabz"):
         """Select company from dropdown - default is GigLabz"""
-        time.sleep(0.5)
-        
-        # Click on company dropdown - it's a MuiSelect
-        comp_locators = [
-            (By.XPATH, "//div[@role='combobox'][contains(.,'Select Company') or contains(.,'GigLabz')]"),
-            (By.XPATH, "//div[contains(@class,'MuiSelect-select')][contains(text(),'Select Company')]"),
-            (By.XPATH, "//p[contains(text(),'Company')]/following::div[@role='combobox'][1]"),
-        ]
-        
-        for loc in comp_locators:
-            try:
-                element = WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(loc))
-                element.click()
-                print("✓ Clicked Company dropdown")
-                break
-            except:
-                continue
-        
-        time.sleep(0.5)
-        
-        # Select the option from listbox
-        option_locators = [
-            (By.XPATH, f"//li[@role='option'][contains(text(),'{company_name}')]"),
-            (By.XPATH, f"//li[contains(@class,'MuiMenuItem')][contains(text(),'{company_name}')]"),
-            (By.XPATH, f"//ul[@role='listbox']//li[contains(text(),'{company_name}')]"),
-        ]
-        
-        for opt_loc in option_locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(opt_loc))
-                element.click()
-                print(f"✓ Selected company: {company_name}")
-                return
-            except:
-                continue
-        print(f"⚠ Could not select company: {company_name}")
+        return self.form.set_company(company_name)
     
     def select_department(self, department):
         """Select department - e.g., 'IT'"""
-        time.sleep(0.5)
-        
-        # Click on department dropdown
-        dept_locators = [
-            (By.XPATH, "//div[@role='combobox'][contains(.,'Select Department')]"),
-            (By.XPATH, "//div[contains(@class,'MuiSelect-select')][contains(text(),'Select Department')]"),
-            (By.XPATH, "//p[contains(text(),'Department')]/following::div[@role='combobox'][1]"),
-        ]
-        
-        for loc in dept_locators:
-            try:
-                element = WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(loc))
-                element.click()
-                print("✓ Clicked Department dropdown")
-                break
-            except:
-                continue
-        
-        time.sleep(0.5)
-        
-        # Select the option
-        option_locators = [
-            (By.XPATH, f"//li[@role='option'][contains(text(),'{department}')]"),
-            (By.XPATH, f"//li[contains(@class,'MuiMenuItem')][contains(text(),'{department}')]"),
-            (By.XPATH, f"//ul[@role='listbox']//li[contains(text(),'{department}')]"),
-        ]
-        
-        for opt_loc in option_locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(opt_loc))
-                element.click()
-                print(f"✓ Selected department: {department}")
-                return
-            except:
-                continue
-        print(f"⚠ Could not select department: {department}")
+        return self.form.set_department(department)
     
     def select_role(self, role):
         """Select role - e.g., 'senior software developer'
@@ -563,162 +171,41 @@ class ManagePage(BasePage):
                  sales manager, senior project manager, senior qa, senior software developer,
                  software developer, technical lead, technical project manager
         """
-        time.sleep(0.5)
-        
-        # Click on role dropdown
-        role_locators = [
-            (By.XPATH, "//div[@role='combobox'][contains(.,'Select Role')]"),
-            (By.XPATH, "//div[contains(@class,'MuiSelect-select')][contains(text(),'Select Role')]"),
-            (By.XPATH, "//p[contains(text(),'Role')]/following::div[@role='combobox'][1]"),
-        ]
-        
-        for loc in role_locators:
-            try:
-                element = WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(loc))
-                element.click()
-                print("✓ Clicked Role dropdown")
-                break
-            except:
-                continue
-        
-        time.sleep(0.5)
-        
-        # Select the option - use data-value attribute which matches exactly
-        option_locators = [
-            (By.XPATH, f"//li[@data-value='{role.lower()}']"),
-            (By.XPATH, f"//li[@role='option'][contains(translate(text(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'{role.lower()}')]"),
-            (By.XPATH, f"//li[contains(@class,'MuiMenuItem')][contains(text(),'{role}')]"),
-        ]
-        
-        for opt_loc in option_locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(opt_loc))
-                element.click()
-                print(f"✓ Selected role: {role}")
-                return
-            except:
-                continue
-        print(f"⚠ Could not select role: {role}")
+        return self.form.set_role(role)
 
     def select_employee_type(self, employee_type="full time"):
         """Select employee type from dropdown"""
-        time.sleep(0.5)
-        
-        try:
-            # Click on employee_type dropdown
-            element = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//div[text()='Select Type']"))
-            )
-            element.click()
-            print("✓ Clicked Employee Type dropdown")
-            time.sleep(0.5)
-            
-            # Select the option
-            option = WebDriverWait(self.driver, 3).until(
-                EC.element_to_be_clickable((By.XPATH, "//li[contains(translate(text(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'full')]"))
-            )
-            option.click()
-            print(f"✓ Selected employee type: {employee_type}")
-        except Exception as e:
-            print(f"⚠ Could not select employee type: {e}")
+        return self.form.set_employee_type(employee_type)
 
     def select_work_shift(self, work_shift="day"):
         """Select work shift from dropdown"""
-        time.sleep(0.5)
-        
-        try:
-            # Click on work_shift dropdown
-            element = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//div[text()='Select Shift']"))
-            )
-            element.click()
-            print("✓ Clicked Work Shift dropdown")
-            time.sleep(0.5)
-            
-            # Select the option
-            option = WebDriverWait(self.driver, 3).until(
-                EC.element_to_be_clickable((By.XPATH, "//li[contains(translate(text(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'day')]"))
-            )
-            option.click()
-            print(f"✓ Selected work shift: {work_shift}")
-        except Exception as e:
-            print(f"⚠ Could not select work shift: {e}")
+        return self.form.set_work_shift(work_shift)
 
     def select_location(self, location="hyderabad"):
         """Select location from dropdown"""
-        time.sleep(0.5)
-        try:
-            element = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//*[text()='Select Location']"))
-            )
-            element.click()
-            print("✓ Clicked location dropdown")
-            time.sleep(0.5)
-            option = WebDriverWait(self.driver, 3).until(
-                EC.element_to_be_clickable((By.XPATH, f"//li[@role='option'][@data-value='{location}']"))
-            )
-            option.click()
-            print(f"✓ Selected location: {location}")
-        except Exception as e:
-            print(f"⚠ Could not select location: {e}")
+        return self.form.set_location(location)
 
     def select_vendor(self, vendor="cognizant"):
         """Select vendor from dropdown"""
-        time.sleep(0.5)
-        try:
-            element = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//*[text()='Select Vendor']"))
-            )
-            element.click()
-            print("✓ Clicked vendor dropdown")
-            time.sleep(0.5)
-            option = WebDriverWait(self.driver, 3).until(
-                EC.element_to_be_clickable((By.XPATH, f"//li[@role='option'][@data-value='{vendor}']"))
-            )
-            option.click()
-            print(f"✓ Selected vendor: {vendor}")
-        except Exception as e:
-            print(f"⚠ Could not select vendor: {e}")
+        return self.form.set_vendor(vendor)
 
     def select_project(self, project="fintech app"):
         """Select project from dropdown"""
-        time.sleep(0.5)
-        try:
-            element = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//*[text()='Select Project']"))
-            )
-            element.click()
-            print("✓ Clicked project dropdown")
-            time.sleep(0.5)
-            option = WebDriverWait(self.driver, 3).until(
-                EC.element_to_be_clickable((By.XPATH, f"//li[@role='option'][@data-value='{project}']"))
-            )
-            option.click()
-            print(f"✓ Selected project: {project}")
-        except Exception as e:
-            print(f"⚠ Could not select project: {e}")
+        return self.form.set_project(project)
 
     def click_add_resource_submit(self):
         """Click Add Resource button to submit the form"""
-        time.sleep(0.5)
+        self.wait_until_settled()
         locators = [
             (By.XPATH, "//button[contains(@class,'MuiButton-containedPrimary')][contains(.,'Add Resource')]"),
             (By.XPATH, "//div[contains(@class,'MuiDialogActions')]//button[contains(@class,'MuiButton-contained')]"),
             (By.XPATH, "//button[contains(text(),'Add Resource') and contains(@class,'MuiButton-contained')]"),
             (By.XPATH, "(//button[contains(text(),'Add Resource')])[last()]"),
         ]
-        
-        for loc in locators:
-            try:
-                element = WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(loc))
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                time.sleep(0.5)
-                element.click()
-                print("✓ Clicked Add Resource submit button")
-                time.sleep(2)  # Wait for save to complete
-                return
-            except:
-                continue
+        if self.act(locators, key="ManagePage.click_add_resource_submit") is not None:
+            print("✓ Clicked Add Resource submit button")
+            self.wait_until_settled()  # Wait for save to complete
+        else:
             print("⚠ Could not click Add Resource button")
 
     
@@ -744,54 +231,42 @@ class ManagePage(BasePage):
             (By.CSS_SELECTOR, ".Toastify__toast-container"),
         ]
 
-        for by, locator in locators:
-            try:
-                print(f"[DEBUG] Trying locator: {locator}")
-                toast = WebDriverWait(self.driver, 2).until(
-                    EC.presence_of_element_located((by, locator))
+        # Wait for any candidate, then read every candidate and its children
+        # in one call; text may lag behind the element by a render or two
+        deadline = time.monotonic() + timeout
+        try:
+            self.find_first(
+                locators, timeout=timeout, condition="present",
+                key="ManagePage.verify_user_create_or_update_toast",
+            )
+        except TimeoutException:
+            print("[DEBUG] Timeout waiting for any toast locator")
+            locators = []
+
+        while locators:
+            last_try = time.monotonic() >= deadline
+            for locator, state in zip(locators, self.snapshot(locators)):
+                if not state["found"]:
+                    continue
+                toast_text = state["text"] or next(
+                    (child["text"] for child in state["children"] if child["text"]), ""
                 )
-                
-                # Try to get text from element directly
-                toast_text = toast.text.strip()
-                
-                # If no direct text, try getting innerText via JavaScript
                 if not toast_text:
-                    toast_text = self.driver.execute_script("return arguments[0].innerText;", toast)
-                    if toast_text:
-                        toast_text = toast_text.strip()
-                
-                # If still no text, try getting text from child elements
-                if not toast_text:
-                    try:
-                        child_elements = toast.find_elements(By.XPATH, ".//*")
-                        for child in child_elements:
-                            child_text = child.text.strip()
-                            if child_text:
-                                toast_text = child_text
-                                break
-                    except:
-                        pass
-                
-                if toast_text:
-                    print(f"[FOUND] Toast text found: '{toast_text}'")
-                    success_keywords = ["created", "updated", "success", "added", "saved", "successful"]
-                    if any(keyword in toast_text.lower() for keyword in success_keywords):
-                        print(f"[OK] Success Toast Detected: {toast_text}")
-                        return toast_text
-                    else:
-                        # Toast found but no success keyword - might still be valid
-                        print(f"[INFO] Toast found but no success keyword: '{toast_text}'")
-                        # Return it anyway as we found a toast
-                        return toast_text
+                    if last_try:
+                        print(f"[DEBUG] Toast element found but no text with locator: {locator[1]}")
+                    continue
+
+                print(f"[FOUND] Toast text found: '{toast_text}'")
+                success_keywords = ["created", "updated", "success", "added", "saved", "successful"]
+                if any(keyword in toast_text.lower() for keyword in success_keywords):
+                    print(f"[OK] Success Toast Detected: {toast_text}")
                 else:
-                    print(f"[DEBUG] Toast element found but no text with locator: {locator}")
-                    
-            except TimeoutException:
-                print(f"[DEBUG] Timeout for locator: {locator}")
-                continue
-            except Exception as e:
-                print(f"[WARNING] Error checking toast with {locator}: {e}")
-                continue
+                    # Toast found but no success keyword - return it anyway as we found a toast
+                    print(f"[INFO] Toast found but no success keyword: '{toast_text}'")
+                return toast_text
+            if last_try:
+                break
+            time.sleep(0.1)  # poll interval while the toast renders its text
         
         # If no toast found after checking all locators, return None (don't fail)
         print("[WARNING] No toast message detected, continuing with validation...")
@@ -801,7 +276,7 @@ class ManagePage(BasePage):
     @pytest.mark.skip(reason="Not used currently")
     def click_close_modal(self):
         """Click close (X) button on the modal"""
-        time.sleep(0.5)
+        self.wait_until_settled()
         locators = [
             (By.XPATH, "//button[.//svg[@data-testid='CloseIcon']]"),
             (By.XPATH, "//svg[@data-testid='CloseIcon']/ancestor::button"),
@@ -810,12 +285,12 @@ class ManagePage(BasePage):
         
         for loc in locators:
             try:
-                element = WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(loc))
+                element = self.waiter(3).until(EC.element_to_be_clickable(loc))
                 element.click()
                 print("[OK] Closed modal")
-                time.sleep(0.5)
+                self.wait_until_settled()
                 return
-            except:
+            except Exception:
                 continue
         
         print("[WARNING] Could not close modal")
@@ -824,7 +299,7 @@ class ManagePage(BasePage):
     
     def verify_resource_in_list(self, name):
         """Verify that resource with given name appears in the list"""
-        time.sleep(1)  # Reduced from 3 seconds
+        self.wait_until_settled()  # Wait for the list to refresh
         
         print("\n" + "="*60)
         print("[VALIDATING] Checking if user was added to the list...")
@@ -838,7 +313,7 @@ class ManagePage(BasePage):
         
         for loc in locators:
             try:
-                element = WebDriverWait(self.driver, 3).until(EC.presence_of_element_located(loc))
+                element = self.waiter(3).until(EC.presence_of_element_located(loc))
                 if element:
                     # Highlight the element on screen
                     self.driver.execute_script("arguments[0].style.border='3px solid green'", element)
@@ -854,11 +329,11 @@ class ManagePage(BasePage):
                         screenshot_name = f"resource_added_{name}_{int(time.time())}.png"
                         self.driver.save_screenshot(f"reports/{screenshot_name}")
                         print(f"[SCREENSHOT] Screenshot saved: reports/{screenshot_name}")
-                    except:
+                    except Exception:
                         pass
                     
                     return True
-            except:
+            except Exception:
                 continue
         
         print("\n" + "[FAILED]"*5)
@@ -868,22 +343,21 @@ class ManagePage(BasePage):
     
     # ==================== Helper Methods ====================
     
-    def generate_random_name(self):
-        """Generate random first and last name"""
-        first_names = ["John", "Jane", "Mike", "Sarah", "David", "Emma", "Chris", "Lisa", "Tom", "Anna"]
-        last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis"]
-        return random.choice(first_names), random.choice(last_names)
-    
-    def generate_random_phone(self):
-        """Generate random 10-digit phone starting with 6-9"""
-        first_digit = random.choice(['6', '7', '8', '9'])
-        remaining = ''.join(random.choices('0123456789', k=9))
-        return first_digit + remaining
-    
-    def generate_random_email(self, first_name, last_name):
-        """Generate random yopmail email"""
-        suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=4))
-        return f"{first_name.lower()}{last_name.lower()}{suffix}@yopmail.com"
+    def generate_resource_data(self):
+        """Generate one unique resource (see DataFactory)
+
+        Returns:
+            Dict with first_name, last_name, email and phone, all derived
+            from the same sequence number
+        """
+        return self.data_factory().resource()
+
+    @classmethod
+    def data_factory(cls):
+        """DataFactory shared by all ManagePage instances of this process"""
+        if cls._data_factory is None:
+            cls._data_factory = DataFactory()
+        return cls._data_factory
     
     # ==================== Complete Flow ====================
 
@@ -920,15 +394,15 @@ class ManagePage(BasePage):
         
         # Step 5: Submit
         self.click_add_resource_submit()
-        time.sleep(3)
+        self.wait_until_settled()
         
         # Step 6: Close modal if still open
         try:
             self.click_close_modal()
-        except:
+        except Exception:
             pass
         
-        time.sleep(2)
+        self.wait_until_settled()
         
         # Step 7: Verify
         return self.verify_resource_in_list(first_name)
@@ -0,0 +1,194 @@
+import os
+from datetime import date, datetime
+
+import yaml
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from pages.components.date_picker import DatePicker
+from pages.components.select import MuiSelect
+from pages.components.typeahead import Typeahead
+
+
+SPEC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "specs")
+
+# Locator keys allowed in specs
+LOCATOR_TYPES = {
+    "xpath": By.XPATH,
+    "css": By.CSS_SELECTOR,
+    "id": By.ID,
+    "name": By.NAME,
+}
+FIELD_TYPES = ("text", "select", "date", "typeahead")
+SETTLE_MODES = ("before", "after", "both", "none")
+FIELD_KEYS = ("type", "locators", "label", "settle", "format")
+# Component-specific options, kept in FieldSpec.options
+FIELD_OPTIONS = ("fallback_first", "keystrokes")
+
+
+class PageSpecError(ValueError):
+    """Raised for an invalid page specification"""
+
+
+class FieldSpec:
+    """One field of a page spec"""
+
+    def __init__(self, name, type, locators, label=None, settle=None, format=None, **options):
+        self.name = name
+        self.type = type
+        self.locators = locators
+        self.label = label or name.replace("_", " ")
+        self.settle = settle
+        self.format = format
+        self.options = options
+
+
+def parse_locator(entry, where):
+    """Turn ``{"xpath": "//input"}`` into ``(By.XPATH, "//input")``"""
+    if not isinstance(entry, dict) or len(entry) != 1:
+        raise PageSpecError(f"{where}: a locator must be a single 'type: value' pair, got {entry!r}")
+    kind, value = next(iter(entry.items()))
+    if kind not in LOCATOR_TYPES:
+        raise PageSpecError(f"{where}: unknown locator type '{kind}' (use {', '.join(LOCATOR_TYPES)})")
+    return (LOCATOR_TYPES[kind], value)
+
+
+def parse_spec(spec):
+    """Validate a spec mapping and return (class name, settle mode, {name: FieldSpec})"""
+    name = spec.get("name")
+    if not name:
+        raise PageSpecError("Page spec needs a 'name'")
+    settle = spec.get("settle", "before")
+    fields = {}
+    for field_name, field in (spec.get("fields") or {}).items():
+        where = f"{name}.{field_name}"
+        field = dict(field)
+        unknown = set(field) - set(FIELD_KEYS) - set(FIELD_OPTIONS)
+        if unknown:
+            raise PageSpecError(
+                f"{where}: unknown key(s) {', '.join(sorted(unknown))} "
+                f"(use {', '.join(FIELD_KEYS + FIELD_OPTIONS)})"
+            )
+        if field.get("type") not in FIELD_TYPES:
+            raise PageSpecError(f"{where}: type must be one of {', '.join(FIELD_TYPES)}")
+        if field.get("settle", settle) not in SETTLE_MODES:
+            raise PageSpecError(f"{where}: settle must be one of {', '.join(SETTLE_MODES)}")
+        if not field.get("locators"):
+            raise PageSpecError(f"{where}: at least one locator is required")
+        field["locators"] = [parse_locator(entry, where) for entry in field["locators"]]
+        fields[field_name] = FieldSpec(field_name, **field)
+    return name, settle, fields
+
+
+class SpecPage(BasePage):
+    """Base class of page objects compiled from a YAML spec
+
+    Every field gets a ``set_<field>(value)`` method, and ``fill(values)``
+    sets many fields at once: text fields in a single browser call, then
+    the components in spec order. Fields are driven by the shared
+    component engines (fill_form, MuiSelect, DatePicker, Typeahead).
+    """
+
+    fields = {}
+    settle = "before"
+
+    def set(self, field_name, value):
+        """Set one field; returns the component's result"""
+        field = self.fields[field_name]
+        self._settle(field, "before")
+        result = getattr(self, f"_set_{field.type}")(field, value)
+        self._settle(field, "after")
+        return result
+
+    def fill(self, values):
+        """Set several fields, batching all text fields into one browser call
+
+        Args:
+            values: {field name: value}, set in spec order
+
+        Returns:
+            True if every field was set
+        """
+        unknown = set(values) - set(self.fields)
+        if unknown:
+            raise PageSpecError(f"{type(self).__name__} has no fields {', '.join(sorted(unknown))}")
+
+        ordered = [field for name, field in self.fields.items() if name in values]
+        text = [field for field in ordered if field.type == "text"]
+        ok = True
+        if text:
+            if any(self._settles(field, "before") for field in text):
+                self.wait_until_settled()
+            ok = self.fill_form(
+                {tuple(field.locators): self._format(field, values[field.name]) for field in text},
+                keystrokes=[tuple(field.locators) for field in text if field.options.get("keystrokes")],
+            )
+            if any(self._settles(field, "after") for field in text):
+                self.wait_until_settled()
+        for field in ordered:
+            if field.type != "text":
+                ok = self.set(field.name, values[field.name]) not in (None, False) and ok
+        return ok
+
+    # ==================== Component drivers ====================
+
+    def _set_text(self, field, value):
+        keystrokes = [tuple(field.locators)] if field.options.get("keystrokes") else []
+        return self.fill_form({tuple(field.locators): self._format(field, value)}, keystrokes=keystrokes)
+
+    def _set_select(self, field, value):
+        return MuiSelect(self.driver, field.label, field.locators).select(value)
+
+    def _set_typeahead(self, field, value):
+        return Typeahead(self.driver, field.label, field.locators).select(
+            value, fallback_first=field.options.get("fallback_first", False)
+        )
+
+    def _set_date(self, field, value):
+        if isinstance(value, str):
+            value = datetime.strptime(value, "%d/%m/%Y").date()
+        if isinstance(value, date):
+            value = (value.day, value.month, value.year)
+        return DatePicker(self.driver, field.locators).select(*value)
+
+    # ==================== Helpers ====================
+
+    def _settles(self, field, when):
+        mode = field.settle or self.settle
+        return mode in (when, "both")
+
+    def _settle(self, field, when):
+        if self._settles(field, when):
+            self.wait_until_settled()
+
+    @staticmethod
+    def _format(field, value):
+        return field.format.format(value=value) if field.format else str(value)
+
+
+def compile_page(spec):
+    """Build a page-object class from a spec mapping (see pages/specs/)"""
+    name, settle, fields = parse_spec(spec)
+    namespace = {"fields": fields, "settle": settle, "__doc__": spec.get("description", f"Page object for {name}")}
+    for field_name, field in fields.items():
+        namespace[f"set_{field_name}"] = _setter(field_name, field)
+    return type(name, (SpecPage,), namespace)
+
+
+def _setter(field_name, field):
+    def setter(self, value):
+        return self.set(field_name, value)
+    setter.__name__ = f"set_{field_name}"
+    setter.__doc__ = f"Set {field.label} ({field.type})"
+    return setter
+
+
+_compiled = {}
+
+
+def load_page(name):
+    """Compiled page class for ``pages/specs/<name>.yaml`` (cached per process)"""
+    if name not in _compiled:
+        with open(os.path.join(SPEC_DIR, f"{name}.yaml"), "r") as file:
+            _compiled[name] = compile_page(yaml.safe_load(file))
+    return _compiled[name]
@@ -1,11 +1,8 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from pages.base_page import BasePage
 import random
 import string
-import time
 from datetime import datetime
 
 
@@ -21,7 +18,7 @@ class SystemAdministrationPage(BasePage):
     
     def click_SA_menu(self):
         """Click on System Administration menu in sidebar"""
-        time.sleep(1)
+        self.wait_until_settled()
         locators = [
             # The text appears as uppercase "SYSTEM ADMINISTRATION" in the UI
             (By.XPATH, "//p[contains(translate(text(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'system administration')]"),
@@ -33,30 +30,10 @@ class SystemAdministrationPage(BasePage):
             (By.CSS_SELECTOR, "p.MuiTypography-body1.css-5ajsgi"),
         ]
         
-        for loc in locators:
-            try:
-                element = WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(loc))
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                # FAIL in many real UI cases because the element is not visible or not in viewport
-                # ElementNotInteractableException, ElementClickInterceptedException
-                time.sleep(0.3)
-                element.click()
-                print("[OK] Clicked System Administration menu")
-                return True
-            except:
-                continue
-        
-        # Try JavaScript click as fallback
-        for loc in locators:
-            try:
-                element = WebDriverWait(self.driver, 3).until(EC.presence_of_element_located(loc))
-                self.driver.execute_script("arguments[0].click();", element)
-                # Bypasses Selenium’s normal .click(), Directly triggers the DOM click event using JavaScript
-                # Aviods Visibility/Interactable issues
-                print("[OK] Clicked System Administration menu (JS)")
-                return True
-            except:
-                continue
+        # Scroll, actionability check and click in one call
+        if self.act(locators, key="SystemAdministrationPage.click_SA_menu") is not None:
+            print("[OK] Clicked System Administration menu")
+            return True
         
         print("[WARNING] Could not click System Administration menu")
         return False
\ No newline at end of file
@@ -0,0 +1,211 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from utils.wait_policy import WaitBudgetExceeded, WaitPolicy
+
+
+LOCATOR = (By.ID, "first-name")
+
+
+class ScriptDriver:
+    """Minimal driver for page methods that only run scripts"""
+
+    session_id = "session-1"
+
+    def execute_script(self, script, *args):
+        return None
+
+
+class Handle:
+    def __init__(self, name, stale=False):
+        self.name = name
+        self.stale = stale
+
+    @property
+    def text(self):
+        if self.stale:
+            raise StaleElementReferenceException("gone")
+        return self.name
+
+
+class CacheDriver(ScriptDriver):
+    """Driver whose cache validation script answers ``valid`` (or raises if stale)"""
+
+    def __init__(self, valid=True, stale=False):
+        self.valid = valid
+        self.stale = stale
+        self.checks = []
+
+    def execute_script(self, script, *args):
+        self.checks.append(args[1:])
+        if self.stale:
+            raise StaleElementReferenceException("gone")
+        return {"valid": self.valid, "epoch": "doc:2"}
+
+
+class Button:
+    def __init__(self, name="button"):
+        self.name = name
+        self.clicks = 0
+
+    def click(self):
+        self.clicks += 1
+
+
+class TestElementCache:
+    """Test cases for the validated element handle cache"""
+
+    def setup_method(self):
+        BasePage._handles.clear()
+
+    def test_valid_handle_is_reused_after_one_check(self):
+        """Verify a handle is reused after a single validation call that carries the locator and epoch"""
+        driver = CacheDriver(valid=True)
+        page = BasePage(driver)
+        found = []
+
+        def lookup():
+            found.append(Button(f"button-{len(found)}"))
+            return found[-1]
+
+        first = page.cached_element(LOCATOR, "clickable", lookup)
+        assert driver.checks == []
+        assert page.cached_element(LOCATOR, "clickable", lookup) is first
+        assert page.cached_element(LOCATOR, "clickable", lookup) is first
+
+        assert len(found) == 1
+        assert driver.checks == [("id", "first-name", "clickable", None), ("id", "first-name", "clickable", "doc:2")]
+
+    @pytest.mark.parametrize("valid, stale", [(False, False), (True, True)])
+    def test_changed_or_stale_handle_is_refound(self, valid, stale):
+        """Verify a handle that no longer matches its locator, or went stale, is looked up again"""
+        page = BasePage(CacheDriver(valid=valid, stale=stale))
+        handles = [Button("old"), Button("new")]
+
+        page.cached_element(LOCATOR, "present", lambda: handles.pop(0))
+
+        assert page.cached_element(LOCATOR, "present", lambda: handles.pop(0)).name == "new"
+
+    def test_stale_handle_during_action_is_refound(self):
+        """Verify StaleElementReferenceException from the action triggers one fresh lookup"""
+        page = BasePage(CacheDriver())
+        handles = [Handle("old", stale=True), Handle("new")]
+
+        text = page._with_element(LOCATOR, "present", lambda: handles.pop(0), lambda element: element.text)
+
+        assert text == "new"
+
+    def test_cached_click_stays_native(self):
+        """Verify a click on a reused handle is a WebDriver click, not a scripted one"""
+        button = Button()
+        page = BasePage(CacheDriver())
+        BasePage._handles[("session-1", "clickable", LOCATOR)] = ("doc:2", button)
+
+        page.click(LOCATOR)
+
+        assert button.clicks == 1
+
+
+class SnapshotDriver(ScriptDriver):
+    """Driver that answers the snapshot script with canned element states"""
+
+    def __init__(self, states):
+        super().__init__()
+        self.states = states
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append(args)
+        return self.states
+
+
+class TestSnapshot:
+    """Test cases for the batched element state snapshot"""
+
+    def test_named_locators_map_to_states_in_one_call(self):
+        """Verify a mapping of locators returns a mapping of states from one script call"""
+        states = [{"found": True, "text": "Saved", "children": []}, {"found": False}]
+        driver = SnapshotDriver(states)
+
+        result = BasePage(driver).snapshot({"toast": LOCATOR, "alert": (By.XPATH, "//div[@role='alert']")})
+
+        assert result == {"toast": states[0], "alert": states[1]}
+        assert driver.calls == [([["id", "first-name"], ["xpath", "//div[@role='alert']"]], 1)]
+
+
+class ActDriver(ScriptDriver):
+    """Driver that answers the act script with a canned result"""
+
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+        self.calls = []
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(args)
+        return self.result
+
+
+class Clickable:
+    clicks = 0
+
+    def click(self):
+        self.clicks += 1
+
+
+class TestAct:
+    """Test cases for the coalesced scroll/check/click primitive"""
+
+    def test_scripted_click_needs_no_native_call(self):
+        """Verify an in-page click returns the winning candidate without a WebDriver click"""
+        element = Clickable()
+        driver = ActDriver({"index": 1, "element": element, "done": True, "reason": None})
+
+        index = BasePage(driver).act([LOCATOR, (By.XPATH, "//button")])
+
+        assert index == 1
+        assert element.clicks == 0
+        assert driver.calls[0][1:] == ("click", 5000, True)
+
+    def test_trusted_click_uses_webdriver(self):
+        """Verify trusted=True performs a native click on the checked element"""
+        element = Clickable()
+        driver = ActDriver({"index": 0, "element": element, "done": False, "reason": None})
+
+        assert BasePage(driver).act(LOCATOR, trusted=True) == 0
+        assert element.clicks == 1
+        assert driver.calls[0][3] is False
+
+    def test_not_actionable_returns_none(self):
+        """Verify a covered element is reported instead of clicked"""
+        driver = ActDriver({"index": -1, "element": None, "done": False, "reason": "covered by div.MuiBackdrop-root"})
+
+        assert BasePage(driver).act(LOCATOR) is None
+
+
+class TestWaitBudget:
+    """Test cases for wait budget exhaustion"""
+
+    def teardown_method(self):
+        WaitPolicy.current = None
+
+    def test_exhausted_budget_is_not_swallowed(self):
+        """Verify click_first and is_element_visible re-raise an exhausted budget instead of reporting a miss"""
+        WaitPolicy.current = WaitPolicy(test_budget=0)
+        page = BasePage(ActDriver(None))
+
+        with pytest.raises(WaitBudgetExceeded):
+            page.click_first([LOCATOR])
+        with pytest.raises(WaitBudgetExceeded):
+            page.is_element_visible(LOCATOR)
+
+    def test_step_budget_only_applies_inside_steps(self):
+        """Verify waits outside a named step are capped by the test budget alone"""
+        policy = WaitPolicy(test_budget=300, step_budget=90)
+        policy.started -= 120
+
+        assert policy.timeout(60) == 60
+        with policy.step("Add resource"):
+            assert 89 < policy.timeout(120) <= 90
@@ -0,0 +1,91 @@
+import threading
+
+from utils.cleanup import CleanupLedger
+from utils.json_file import load_json
+
+
+API = {"base_url": "https://app.example.com/api", "timeout_secs": 5}
+CLEANUP = {"delete_paths": {"resource": "/resources/{id}"}, "retries": 0, "concurrency": 4}
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class FakeSession:
+    """Answers DELETEs with a status per id (204 unless listed)"""
+
+    def __init__(self, statuses=None):
+        self.statuses = statuses or {}
+        self.deleted = []
+        self.lock = threading.Lock()
+
+    def delete(self, url, headers=None, cookies=None, timeout=None):
+        entity_id = url.rsplit("/", 1)[1]
+        with self.lock:
+            self.deleted.append(entity_id)
+        return FakeResponse(self.statuses.get(entity_id, 204))
+
+
+class TestCleanupLedger:
+    """Test cases for background bulk deletion of created entities"""
+
+    def test_recorded_entities_are_deleted_in_background(self, tmp_path):
+        """Verify every recorded id is deleted once and 404 counts as deleted"""
+        session = FakeSession({"7": 404})
+        ledger = CleanupLedger(API, CLEANUP, manifest_path=str(tmp_path / "pending.json"), session=session)
+        ledger.authorize({"Authorization": "Bearer t"})
+        for entity_id in range(10):
+            ledger.record("resource", entity_id)
+        ledger.record("resource", 3)
+        ledger.record("project", 99)
+
+        ledger.start()
+
+        assert ledger.finish(timeout=5) == 0
+        assert sorted(session.deleted, key=int) == [str(i) for i in range(10)]
+
+    def test_failures_are_retried_by_the_next_run(self, tmp_path):
+        """Verify undeleted ids go to the manifest and the next authorized ledger deletes them"""
+        manifest = str(tmp_path / "pending.json")
+        first = CleanupLedger(API, CLEANUP, manifest_path=manifest, session=FakeSession({"2": 403}))
+        first.authorize({"Authorization": "Bearer t"})
+        first.record("resource", 1)
+        first.record("resource", 2)
+        first.start()
+        assert first.finish(timeout=5) == 1
+
+        session = FakeSession()
+        second = CleanupLedger(API, CLEANUP, manifest_path=manifest, session=session)
+        second.authorize({"Authorization": "Bearer t"})
+        second.start()
+
+        assert second.finish(timeout=5) == 0
+        assert session.deleted == ["2"]
+
+    def test_without_credentials_entries_are_kept(self, tmp_path):
+        """Verify a process that never logged in leaves its ids for a later run"""
+        manifest = str(tmp_path / "pending.json")
+        ledger = CleanupLedger(API, CLEANUP, manifest_path=manifest, session=FakeSession())
+        ledger.record("resource", 5)
+        ledger.start()
+
+        assert ledger.finish(timeout=5) == 1
+
+    def test_only_leftovers_of_the_same_api_are_claimed(self, tmp_path):
+        """Verify a run never deletes manifest entries written for another base_url"""
+        manifest = str(tmp_path / "pending.json")
+        for base_url, entity_id in (("https://app.example.com/api", 1), ("https://other.example.com/api", 2)):
+            ledger = CleanupLedger({"base_url": base_url}, CLEANUP, manifest_path=manifest, session=FakeSession())
+            ledger.record("resource", entity_id)
+            ledger.finish(timeout=5)
+
+        session = FakeSession()
+        ledger = CleanupLedger(API, CLEANUP, manifest_path=manifest, session=session)
+        ledger.authorize({"Authorization": "Bearer t"})
+        ledger.start()
+
+        assert ledger.finish(timeout=5) == 0
+        assert session.deleted == ["1"]
+        assert load_json(manifest) == [["https://other.example.com/api", "resource", "2"]]
@@ -0,0 +1,66 @@
+import time
+
+from utils.data_factory import DataFactory, UniquenessIndex
+from utils.option_catalog import OptionCatalog
+
+
+class TestDataFactory:
+    """Test cases for the unique test-data factory"""
+
+    def test_values_never_collide_across_runs_and_workers(self, tmp_path):
+        """Verify two factories sharing an index produce disjoint names, emails and phones"""
+        index = UniquenessIndex(str(tmp_path / "index.json"))
+        records = DataFactory("run1-w0", index=index).resources(3000)
+        records += DataFactory("run2-w1", index=index).resources(3000)
+        records.append(DataFactory("run2-w1", index=index).resource())
+
+        for field in ("first_name", "email", "phone"):
+            assert len({record[field] for record in records}) == len(records)
+        assert all(len(record["phone"]) == 10 and record["phone"][0] in "6789" for record in records)
+        assert "run2-w1" in records[-1]["email"]
+
+    def test_fresh_machines_do_not_repeat_values(self, tmp_path):
+        """Verify runs whose indexes both start at 0 still get different names and phones"""
+        first = DataFactory("run1-w0", index=UniquenessIndex(str(tmp_path / "a.json"))).resources(100)
+        second = DataFactory("run2-w0", index=UniquenessIndex(str(tmp_path / "b.json"))).resources(100)
+
+        for field in ("first_name", "email", "phone"):
+            assert not {record[field] for record in first} & {record[field] for record in second}
+        assert all(record["first_name"].isalpha() for record in first + second)
+
+    def test_phone_namespace_digits_are_apart_from_sequence_digits(self, tmp_path):
+        """Verify the namespace only sets the reserved digits and the sequence only the others"""
+        index = UniquenessIndex(str(tmp_path / "index.json"))
+        first, second = DataFactory("run1-w0", index=index), DataFactory("run2-w0", index=index)
+
+        for seq in (0, 1, 999999, 1000000, 3999999):
+            a, b = first.record(seq)["phone"], second.record(seq)["phone"]
+            assert a[0] + a[4:] == b[0] + b[4:] and a[1:4] != b[1:4]
+        assert len({first.record(seq)["phone"] for seq in range(0, 4000000, 999)}) == len(range(0, 4000000, 999))
+
+    def test_output_is_deterministic(self, tmp_path):
+        """Verify the same seed and sequence numbers give the same records"""
+        first = DataFactory("ns", seed=7, index=UniquenessIndex(str(tmp_path / "a.json"))).resources(5)
+        second = DataFactory("ns", seed=7, index=UniquenessIndex(str(tmp_path / "b.json"))).resources(5)
+
+        assert first == second
+
+    def test_choices_come_from_the_catalog(self, tmp_path):
+        """Verify dropdown values are picked deterministically from the catalog's options"""
+        catalog = OptionCatalog("https://app.example.com", path=str(tmp_path / "catalog.json"))
+        catalog.update("role", [{"value": "qa", "label": "QA"}, {"value": "dev", "label": "Developer"}])
+        factory = DataFactory("ns", index=UniquenessIndex(str(tmp_path / "index.json")))
+
+        assert [factory.choose(catalog, "role", seq) for seq in range(3)] == ["QA", "Developer", "QA"]
+        assert factory.choose(catalog, "vendor", 0, default="any") == "any"
+        assert factory.choose(None, "role", 0) is None
+
+    def test_bulk_generation_is_fast(self, tmp_path):
+        """Verify 10k records take well under a second"""
+        factory = DataFactory("ns", index=UniquenessIndex(str(tmp_path / "index.json")))
+        start = time.perf_counter()
+        records = factory.resources(10000)
+        elapsed = time.perf_counter() - start
+
+        assert len(records) == 10000
+        assert elapsed < 0.5
@@ -0,0 +1,54 @@
+import json
+
+from utils.data_source import iter_rows, worker_shard
+
+
+def write_jsonl(path, count):
+    with open(path, "w") as file:
+        for number in range(count):
+            file.write(json.dumps({"name": f"user{number}"}) + "\n")
+
+
+class TestDataSource:
+    """Test cases for streaming CSV/JSONL case rows"""
+
+    def test_csv_rows_with_comments_and_numbers(self, tmp_path):
+        """Verify CSV rows are read as stripped dicts and comment lines are skipped"""
+        path = tmp_path / "cases.csv"
+        path.write_text("# comment\nname, skill\nAnna, react\nMike,vue\n")
+
+        rows = list(iter_rows(str(path)))
+
+        assert rows == [{"name": "Anna", "skill": "react"}, {"name": "Mike", "skill": "vue"}]
+        assert [row.number for row in rows] == [0, 1]
+
+    def test_resume_and_shard(self, tmp_path):
+        """Verify shards partition the rows and resuming skips earlier rows"""
+        path = str(tmp_path / "cases.jsonl")
+        write_jsonl(path, 10)
+
+        shards = [[row.number for row in iter_rows(path, shard=(index, 3))] for index in range(3)]
+        assert sorted(sum(shards, [])) == list(range(10))
+        assert shards[1] == [1, 4, 7]
+
+        assert [row.number for row in iter_rows(path, start=6, shard=(0, 2))] == [6, 8]
+        assert [row["name"] for row in iter_rows(path, start=2, limit=2)] == ["user2", "user3"]
+
+    def test_rows_are_streamed(self, tmp_path):
+        """Verify rows are produced lazily from a large file"""
+        path = str(tmp_path / "cases.jsonl")
+        write_jsonl(path, 50000)
+
+        rows = iter_rows(path)
+
+        assert next(rows).number == 0
+        assert next(rows)["name"] == "user1"
+
+    def test_worker_shard_from_sharding_plugin(self, monkeypatch):
+        """Verify the worker's shard is read from the sharding plugin's environment"""
+        monkeypatch.setenv("TEST_WORKER_COUNT", "1")
+        assert worker_shard() is None
+
+        monkeypatch.setenv("TEST_WORKER_COUNT", "4")
+        monkeypatch.setenv("TEST_WORKER_INDEX", "2")
+        assert worker_shard() == (2, 4)
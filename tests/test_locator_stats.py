@@ -0,0 +1,45 @@
+import time
+
+from utils.locator_stats import LocatorStats
+
+
+LOCATORS = [("xpath", "//span[text()='Manage']"), ("xpath", "//*[contains(text(),'Manage')]")]
+
+
+class TestLocatorStats:
+    """Test cases for the self-ranking locator store"""
+
+    def test_failing_candidate_is_demoted_and_persists(self, tmp_path):
+        """Verify a candidate that keeps missing moves behind its fallback on later runs"""
+        path = str(tmp_path / "stats.json")
+        stats = LocatorStats(path)
+        assert stats.rank("Page.method", LOCATORS) == [0, 1]
+
+        for _ in range(3):
+            stats.record("Page.method", LOCATORS, 1, 0.2)
+        stats.save()
+
+        assert LocatorStats(path).rank("Page.method", LOCATORS) == [1, 0]
+
+    def test_fallback_never_outranks_working_specific_locator(self, tmp_path):
+        """Verify a generic fallback that wins stays behind a specific locator that still works"""
+        stats = LocatorStats(str(tmp_path / "stats.json"))
+        stats.record("Page.method", LOCATORS, 1, 0.2)
+        assert stats.rank("Page.method", LOCATORS) == [0, 1]
+
+        for _ in range(5):
+            stats.record("Page.method", LOCATORS, 1, 0.2)
+            stats.record("Page.method", LOCATORS, 0, 0.1)
+
+        assert stats.rank("Page.method", LOCATORS) == [0, 1]
+
+    def test_statistics_decay(self, tmp_path):
+        """Verify old statistics lose weight after a half-life"""
+        stats = LocatorStats(str(tmp_path / "stats.json"), half_life_secs=60)
+        stats.record("Page.method", LOCATORS, 0, 0.1)
+        entry = stats._data["Page.method"]["xpath=//span[text()='Manage']"]
+        entry["updated"] = time.time() - 60
+
+        summary = stats.summary("Page.method")
+
+        assert round(summary["xpath=//span[text()='Manage']"]["hits"], 2) == 0.5
@@ -60,6 +60,22 @@ class TestLogin:
         assert login_page.is_element_visible(login_page.LOGIN_BUTTON), \
             "Login button should be visible on OTP page"
         
+    def test_login_via_ui(self, driver, config):
+        """Test the full email + OTP login through the UI
+        
+        Other tests log in through the cached session or the API fast
+        path, so this is the only test that renders the login screens.
+        """
+        login_page = LoginPage(driver)
+        
+        email = config.get("email", "test@example.com")
+        otp_code = config.get("otp", "1234")
+        
+        assert login_page.login_via_ui(email, otp_code), \
+            f"Should reach the application after login. Current URL: {driver.current_url}"
+        
+        print(f"Login successful! Redirected to: {driver.current_url}")
+    
     @pytest.mark.skip(reason="Skipping for now")
     def test_complete_login_with_manual_otp(self, driver, config):
         """Test complete login flow with manual OTP entry
@@ -86,7 +102,7 @@ class TestLogin:
         login_page.click_login()
         
         # Wait for page to load after login
-        time.sleep(5)
+        login_page.wait_until_settled()
         
         # Verify login was successful by checking URL change
         current_url = driver.current_url
@@ -122,8 +138,12 @@ class TestLogin:
 class TestResourceManagement:
     """Test cases for Resource Management functionality - Updated UI with tabs"""
     
-    def test_add_resource_new_flow(self, driver, config):
+    @pytest.mark.data_source("resources.csv")
+    def test_add_resource_new_flow(self, case, logged_in_driver, config, option_catalog, resource_seeder):
         """Test adding resource with new tabbed modal UI
+
+        Runs once per row of tests/data/resources.csv (values below are
+        those of the first row).
         
         13-Step Flow:
         1. Click Add Resource button
@@ -141,110 +161,112 @@ class TestResourceManagement:
         13. Click close icon
         14. Validate user in list
         """
-        login_page = LoginPage(driver)
+        driver = logged_in_driver
         manage_page = ManagePage(driver)
-        
-        # Get config values
-        email = config.get("email", "test@example.com")
-        manual_wait = config.get("otp_manual_wait_secs", 15)
-        
-        # ==================== Login Process ====================
-        login_page.login_with_email(email)
-        assert login_page.is_otp_page_displayed(), "OTP page should be displayed"
-        
-        # Enter hardcoded OTP
-        print(">>> Entering OTP: 1234 <<<")
-        login_page.enter_otp("1234")
-        
-        login_page.click_login()
-        
-        # Wait for page to load after login
-        time.sleep(8)
-        
-        # Verify login was successful
-        current_url = driver.current_url
-        print(f"Current URL after login: {current_url}")
-        
-        if "/otp" in current_url:
-            pytest.fail("Login failed - still on OTP page")
+
+        # Generate test data - one record, so all fields share a sequence number
+        resource = manage_page.generate_resource_data()
+        first_name, last_name = resource["first_name"], resource["last_name"]
+        phone = resource["phone"]
+        resource_email = resource["email"]
+
+        # A blank cell in the data file picks one of the catalog's known options
+        dropdowns = ("experience", "primary_skill", "company", "department", "role",
+                     "employee_type", "work_shift", "location", "vendor", "project")
+        factory = manage_page.data_factory()
+        choices = {}
+        for name in dropdowns:
+            label = name.replace("_", " ")
+            choices[label] = case[name] or factory.choose(option_catalog, label, resource["seq"], default="")
+        join_day, join_month, join_year = (int(part) for part in case["date_of_joining"].split("/"))
+        # Values missing from the cached option lists are re-read from the
+        # page when selected, and only fail if the app does not offer them
+        if option_catalog is not None:
+            stale = option_catalog.check(choices)
+            if stale:
+                print(f"[WARNING] Not in the cached options, re-reading from the page: {', '.join(stale)}")
         
         print("Login successful! Navigating to Resource Management...")
         
         # ==================== Navigate to Resource Management ====================
-        time.sleep(2)
-        sa_page = SystemAdministrationPage(driver)
-        sa_page.click_SA_menu()
-        time.sleep(2)
-        manage_page.click_manage_menu()
-        time.sleep(3)
-        manage_page.click_resource_management_tab()
-        time.sleep(3)
-        
-        # ==================== Add Resource Flow ====================
+        with manage_page.step("Navigate to Resource Management"):
+            manage_page.wait_until_settled()
+            sa_page = SystemAdministrationPage(driver)
+            sa_page.click_SA_menu()
+            manage_page.wait_until_settled()
+            manage_page.click_manage_menu()
+            manage_page.wait_until_settled()
+            manage_page.click_resource_management_tab()
+            manage_page.wait_until_settled()
+        
+        # ==================== Seed background resources ====================
+        # Only the resource under test goes through the UI modal; any
+        # others are created over the API
         num_resources = config.get("num_resources_to_add", 1)
-        
-        for i in range(num_resources):
-            # Generate test data
-            first_name, last_name = manage_page.generate_random_name()
-            phone = manage_page.generate_random_phone()
-            resource_email = manage_page.generate_random_email(first_name, last_name)
-            
-            print(f"\n--- Adding Resource {i + 1} of {num_resources} ---")
+        if num_resources > 1:
+            fields = ("first_name", "last_name", "email", "phone")
+            seeded = [
+                {field: record[field] for field in fields}
+                for record in manage_page.data_factory().resources(num_resources - 1)
+            ]
+            report = resource_seeder.seed(seeded)
+            assert not report.failures, f"Seeding failed: {report.summary()}"
+
+        # ==================== Add Resource Flow ====================
+        with manage_page.step("Add resource"):
+            print("\n--- Adding Resource through the UI ---")
             print(f"Name: {first_name} {last_name}")
             print(f"Email: {resource_email}")
             print(f"Phone: {phone}")
-            
+        
             # Step 1: Click Add Resource button
             manage_page.click_add_resource_button()
-            time.sleep(2)
-            
+            manage_page.wait_until_settled()
+        
             # Step 2-5: Fill Basic Info
-            manage_page.enter_first_name(first_name)
-            manage_page.enter_last_name(last_name)
-            manage_page.enter_email(resource_email)
-            manage_page.enter_phone(phone)
-            
-            # Step 6: Select Date of Joining - 14th July 2022
-            manage_page.select_date_of_joining(14, 7, 2022)
-            
-            # Step 7: Select Experience - 3 years
-            manage_page.select_experience("3")
-            
-            # Step 8: Select Primary Skill - Python Developer
-            manage_page.select_primary_skill("python developer")
-            
-            # Step 9: Select Reporting Manager - Madhu
-            manage_page.select_reporting_manager("Madhu Poclassery")
-            
+            manage_page.fill_basic_info(first_name, last_name, resource_email, phone)
+        
+            # Step 6: Select Date of Joining
+            manage_page.select_date_of_joining(join_day, join_month, join_year)
+        
+            # Step 7: Select Experience
+            manage_page.select_experience(choices["experience"])
+        
+            # Step 8: Select Primary Skill
+            manage_page.select_primary_skill(choices["primary skill"])
+        
+            # Step 9: Select Reporting Manager
+            manage_page.select_reporting_manager(case["reporting_manager"])
+        
             # Step 10: Click Employment Tab
             manage_page.click_employment_tab()
-            time.sleep(1)
-            
+            manage_page.wait_until_settled()
+        
             # Step 11: Fill Employment Info
             # Select Company - GigLabz
-            manage_page.select_company("GigLabz")
-            
+            manage_page.select_company(choices["company"])
+        
             # Select Department - IT
-            manage_page.select_department("IT")
-            
+            manage_page.select_department(choices["department"])
+        
             # Select Role - Senior Software Developer
-            manage_page.select_role("senior software developer")
+            manage_page.select_role(choices["role"])
 
             print("DEBUG: about to select employee type")
-            manage_page.select_employee_type("full time")
+            manage_page.select_employee_type(choices["employee type"])
             print("DEBUG: about to select work shift")
-            manage_page.select_work_shift("day")
+            manage_page.select_work_shift(choices["work shift"])
             print("DEBUG: about to select location")
-            manage_page.select_location("hyderabad")
+            manage_page.select_location(choices["location"])
             print("DEBUG: about to select vendor")
-            manage_page.select_vendor("cognizant")
+            manage_page.select_vendor(choices["vendor"])
             print("DEBUG: about to select project")
-            manage_page.select_project("fintech app")            
+            manage_page.select_project(choices["project"])            
             # Step 12: Click Add Resource button (submit)
             manage_page.click_add_resource_submit()
             print("[WAIT] Waiting for resource to be saved...")
-            time.sleep(3)
-            
+            manage_page.wait_until_settled()
+        
             # Verify toast message (optional - don't fail if not found)
             toast_text = manage_page.verify_user_create_or_update_toast(timeout=10)
             if toast_text:
@@ -255,32 +277,37 @@ class TestResourceManagement:
             # Step 13: Click Close icon
             # manage_page.click_close_modal()
             # time.sleep(2)
-            
+        
             # Step 14: Validate user in list
             print(f"\n[LIST] Verifying if '{first_name} {last_name}' was added to the list...")
             success = manage_page.verify_resource_in_list(first_name)
-            
+
+            # The UI does not show the new id - find it by the unique email
+            # so the resource is deleted at session end like seeded ones
+            if resource_seeder.lookup_path and resource_seeder.track(resource_email) is None:
+                print(f"[WARNING] Resource {resource_email} not found over the API; it will not be cleaned up")
+        
             if success:
                 print("\n" + "="*60)
-                print(f"[RESULT] RESULT: Resource {i + 1} ({first_name} {last_name})")
+                print(f"[RESULT] RESULT: Resource ({first_name} {last_name})")
                 print(f"   [SUCCESS] USER ADDED SUCCESSFULLY!")
                 print(f"   [EMAIL] Email: {resource_email}")
                 print(f"   [PHONE] Phone: {phone}")
                 print("="*60 + "\n")
             else:
                 print("\n" + "="*60)
-                print(f"[WARNING] RESULT: Resource {i + 1} ({first_name} {last_name})")
+                print(f"[WARNING] RESULT: Resource ({first_name} {last_name})")
                 print(f"   [FAILED] User may need manual verification")
                 print("="*60 + "\n")
-            
-            time.sleep(2)
         
+            manage_page.wait_until_settled()
+    
         print("\n" + "="*40)
         print(f"=== TEST COMPLETED: Added {num_resources} resource(s) ===")
         print("="*40 + "\n")
         
-        # Logout after completing all resource additions
-        login_page.logout()
+        # No logout here - it would revoke the cached session; the pool
+        # clears cookies and storage before the browser is reused
         
 
 
@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from pages.components.select import MuiSelect
+from utils.option_catalog import OptionCatalog, UnknownOption
+
+
+ROLES = [
+    {"value": "qa", "label": "Quality Analyst"},
+    {"value": "ssd", "label": "Senior Software Developer"},
+]
+
+
+class TestOptionCatalog:
+    """Test cases for the on-disk dropdown option catalog"""
+
+    def test_harvested_options_resolve_and_persist(self, tmp_path):
+        """Verify options stored once are matched by value, label or substring in a new process"""
+        path = str(tmp_path / "catalog.json")
+        OptionCatalog("https://app.example.com", path=path).update("role", ROLES)
+
+        catalog = OptionCatalog("https://app.example.com", path=path)
+
+        assert catalog.resolve("role", "qa")["label"] == "Quality Analyst"
+        assert catalog.resolve("role", "senior software developer")["value"] == "ssd"
+        assert catalog.resolve("role", "Software")["value"] == "ssd"
+        assert catalog.resolve("department", "IT") is None
+
+    def test_missing_choices_mark_lists_for_rereading(self, tmp_path):
+        """Verify values missing from a fresh list drop that list instead of failing"""
+        catalog = OptionCatalog("https://app.example.com", path=str(tmp_path / "catalog.json"))
+        catalog.update("role", ROLES)
+        catalog.update("work shift", [{"value": "day", "label": "Day"}])
+
+        stale = catalog.check({"role": "astronaut", "work shift": "day", "vendor": "anyone"})
+
+        assert stale == ["role"]
+        assert catalog.options("role") is None
+        assert catalog.choices("work shift") == ["Day"]
+
+    def test_stale_lists_are_ignored(self, tmp_path):
+        """Verify lists older than the TTL are treated as unknown"""
+        catalog = OptionCatalog("https://app.example.com", ttl_secs=60, path=str(tmp_path / "catalog.json"))
+        catalog.update("role", ROLES)
+        catalog._data["role"]["harvested"] = time.time() - 61
+
+        assert catalog.options("role") is None
+        assert catalog.resolve("role", "astronaut") is None
+
+
+class ScriptedSelect(MuiSelect):
+    """MuiSelect whose menu is opened by trigger ``trigger`` and shows ``menu``"""
+
+    def __init__(self, trigger, menu):
+        super().__init__(None, "role", [])
+        self.trigger = trigger
+        self.menu = menu
+
+    def open(self, timeout=5):
+        return self.trigger
+
+    def choose(self, wanted, timeout=3):
+        self.options = self.menu
+        labels = [option["label"] for option in self.menu if wanted and wanted.lower() in option["label"].lower()]
+        return labels[0] if labels else None
+
+
+class TestSelectCatalog:
+    """Test cases for how MuiSelect feeds and uses the option catalog"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_timings(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(MuiSelect.timings, "path", str(tmp_path / "dropdowns.json"))
+
+    def teardown_method(self):
+        MuiSelect.catalog = None
+
+    def test_fallback_menu_without_match_is_not_stored(self, tmp_path):
+        """Verify a menu opened by a fallback trigger on a miss does not overwrite the catalog"""
+        MuiSelect.catalog = OptionCatalog("https://app.example.com", path=str(tmp_path / "catalog.json"))
+        MuiSelect.catalog.update("role", ROLES)
+        other_menu = [{"value": "day", "label": "Day"}]
+
+        assert ScriptedSelect(1, other_menu).select("Analyst") is None
+        assert MuiSelect.catalog.choices("role") == ["Quality Analyst", "Senior Software Developer"]
+
+        assert ScriptedSelect(0, other_menu).select("Analyst") is None
+        assert MuiSelect.catalog.choices("role") == ["Day"]
+
+    def test_option_added_since_harvest_is_reread(self, tmp_path):
+        """Verify a value missing from the stored list is looked up on the page before failing"""
+        MuiSelect.catalog = OptionCatalog("https://app.example.com", path=str(tmp_path / "catalog.json"))
+        MuiSelect.catalog.update("role", ROLES)
+        menu = ROLES + [{"value": "pm", "label": "Project Manager"}]
+
+        assert ScriptedSelect(0, menu).select("Project Manager") == "Project Manager"
+        assert "Project Manager" in MuiSelect.catalog.choices("role")
+
+        with pytest.raises(UnknownOption, match="options on the page"):
+            ScriptedSelect(0, menu).select("Astronaut")
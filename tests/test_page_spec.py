@@ -0,0 +1,52 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages.page_spec import PageSpecError, compile_page, load_page
+
+
+class TestPageSpec:
+    """Test cases for compiling YAML page specs into page objects"""
+
+    def test_resource_form_compiles(self):
+        """Verify the shipped spec yields one setter per field with parsed locators"""
+        form_class = load_page("resource_form")
+
+        assert form_class.__name__ == "ResourceForm"
+        assert hasattr(form_class, "set_first_name") and hasattr(form_class, "set_project")
+        assert form_class.fields["phone"].locators[0] == (By.CSS_SELECTOR, "input.form-control[type='tel']")
+        assert form_class.fields["primary_skill"].label == "primary skill"
+        assert form_class.fields["reporting_manager"].options == {"fallback_first": True}
+
+    @pytest.mark.parametrize("field, message", [
+        ({"type": "checkbox", "locators": [{"xpath": "//input"}]}, "type must be one of"),
+        ({"type": "text", "locators": []}, "at least one locator"),
+        ({"type": "text", "locators": [{"selector": "//input"}]}, "unknown locator type"),
+        ({"type": "text", "settle": "sometimes", "locators": [{"id": "name"}]}, "settle must be one of"),
+        ({"type": "text", "fallback-first": True, "locators": [{"id": "name"}]}, "unknown key"),
+    ])
+    def test_invalid_specs_are_rejected(self, field, message):
+        """Verify spec mistakes are reported with the field they belong to"""
+        with pytest.raises(PageSpecError, match=message):
+            compile_page({"name": "Broken", "fields": {"name": field}})
+
+    def test_keystrokes_option_reaches_fill_form(self):
+        """Verify text fields marked keystrokes are typed with real key presses"""
+        form_class = compile_page({"name": "Login", "fields": {
+            "email": {"type": "text", "locators": [{"id": "email"}]},
+            "otp": {"type": "text", "keystrokes": True, "locators": [{"id": "otp"}]},
+        }})
+        calls = []
+
+        class RecordingForm(form_class):
+            def fill_form(self, fields, keystrokes=()):
+                calls.append((fields, list(keystrokes)))
+                return True
+
+        form = RecordingForm(None)
+        form.settle = "none"
+        form.fill({"email": "a@b.c", "otp": "123456"})
+        form.set_otp("654321")
+
+        otp = ((By.ID, "otp"),)
+        assert calls[0] == ({((By.ID, "email"),): "a@b.c", otp: "123456"}, [otp])
+        assert calls[1] == ({otp: "654321"}, [otp])
@@ -0,0 +1,120 @@
+import threading
+
+from utils.cleanup import CleanupLedger
+from utils.resource_seeder import ResourceSeeder
+
+
+API = {"base_url": "https://app.example.com/api", "timeout_secs": 5}
+SEEDING = {"create_path": "/resources", "id_field": "data.id", "backoff_secs": 0,
+           "field_map": {"first_name": "firstName"}}
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.body = body
+        self.text = str(body)
+
+    def json(self):
+        return self.body
+
+
+class FakeSession:
+    """Answers POSTs from a script of status codes, then with created ids"""
+
+    def __init__(self, statuses=()):
+        self.statuses = list(statuses)
+        self.posts = []
+        self.gets = []
+        self.found = []
+        self.lock = threading.Lock()
+
+    def post(self, url, json=None, headers=None, cookies=None, timeout=None):
+        with self.lock:
+            self.posts.append((url, json, headers))
+            if self.statuses:
+                return FakeResponse(self.statuses.pop(0), {"error": "busy"})
+            return FakeResponse(201, {"data": {"id": len(self.posts)}})
+
+    def get(self, url, headers=None, cookies=None, timeout=None):
+        self.gets.append(url)
+        return FakeResponse(200, {"data": self.found})
+
+
+class TestResourceSeeder:
+    """Test cases for API-backed bulk resource creation"""
+
+    def test_seed_creates_all_with_auth_and_mapped_fields(self):
+        """Verify every resource is posted with the auth header and renamed fields"""
+        session = FakeSession()
+        seeder = ResourceSeeder(API, SEEDING, headers={"Authorization": "Bearer t"}, session=session)
+
+        report = seeder.seed([{"first_name": f"User{i}", "email": f"u{i}@x.io"} for i in range(20)], concurrency=4)
+
+        assert len(report.created) == 20 and not report.failures
+        url, payload, headers = session.posts[0]
+        assert url == "https://app.example.com/api/resources"
+        assert set(payload) == {"firstName", "email"}
+        assert headers == {"Authorization": "Bearer t"}
+        assert "20/20 created" in report.summary()
+
+    def test_throttled_requests_are_retried(self):
+        """Verify 429/503 responses are retried and counted, while 400 fails immediately"""
+        session = FakeSession([429, 503])
+        seeder = ResourceSeeder(API, SEEDING, session=session)
+
+        report = seeder.seed([{"first_name": "A"}], concurrency=1)
+        assert report.created == [3] and report.retries == 2
+
+        session.statuses = [400]
+        report = seeder.seed([{"first_name": "B"}], concurrency=1)
+        assert report.created == [] and "HTTP 400" in report.failures[0][1]
+
+    def test_created_ids_go_to_the_given_ledger_only(self, tmp_path):
+        """Verify ids are recorded in the ledger passed in, and seeders without one record nothing"""
+        ledger = CleanupLedger(API, {"delete_paths": {"resource": "/resources/{id}"}},
+                               manifest_path=str(tmp_path / "pending.json"))
+        seeder = ResourceSeeder(API, SEEDING, headers={"Authorization": "Bearer t"},
+                                session=FakeSession(), ledger=ledger)
+
+        seeder.seed([{"first_name": "A"}, {"first_name": "B"}], concurrency=1)
+        ResourceSeeder(API, SEEDING, session=FakeSession()).seed([{"first_name": "C"}])
+
+        assert sorted(ledger.entries) == [("resource", "1"), ("resource", "2")]
+        assert ledger.headers == {"Authorization": "Bearer t"}
+
+    def test_cookie_only_credentials_authorize_the_ledger(self, tmp_path):
+        """Verify a session authenticated by cookies alone can still delete what it created"""
+        ledger = CleanupLedger(API, {"delete_paths": {"resource": "/resources/{id}"}},
+                               manifest_path=str(tmp_path / "pending.json"))
+        ResourceSeeder(API, SEEDING, cookies={"sid": "abc"}, session=FakeSession(), ledger=ledger)
+
+        assert ledger.headers == {} and ledger.cookies == {"sid": "abc"}
+
+    def test_ui_created_resource_is_found_by_exact_email(self, tmp_path):
+        """Verify a resource created elsewhere is looked up by email and recorded for cleanup"""
+        ledger = CleanupLedger(API, {"delete_paths": {"resource": "/resources/{id}"}},
+                               manifest_path=str(tmp_path / "pending.json"))
+        session = FakeSession()
+        session.found = [{"id": 41, "email": "anna.x@yopmail.com.au"}, {"id": 42, "email": "Anna.X@yopmail.com"}]
+        seeder = ResourceSeeder(API, dict(SEEDING, lookup_path="/resources?search={email}"),
+                                session=session, ledger=ledger)
+
+        assert seeder.track("anna.x@yopmail.com") == 42
+        assert session.gets == ["https://app.example.com/api/resources?search=anna.x%40yopmail.com"]
+        assert ledger.entries == [("resource", "42")]
+
+        session.found = []
+        assert seeder.track("nobody@yopmail.com") is None
+        assert ledger.entries == [("resource", "42")]
+
+    def test_unconfigured_routes_send_nothing(self):
+        """Verify seeding and tracking are skipped without a request when their paths are not set"""
+        session = FakeSession()
+        seeder = ResourceSeeder(API, {"backoff_secs": 0}, session=session)
+
+        report = seeder.seed([{"first_name": "A"}])
+
+        assert report.created == [] and not report.failures
+        assert seeder.track("anna.x@yopmail.com") is None
+        assert session.posts == [] and session.gets == []
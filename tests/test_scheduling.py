@@ -0,0 +1,77 @@
+import json
+
+from utils.scheduling import DurationModel, bin_pack, nodeid_key, order_longest_first
+
+
+def write_result(directory, name, full_name, start, seconds, status="passed"):
+    result = {
+        "name": name,
+        "fullName": full_name,
+        "status": status,
+        "start": start,
+        "stop": start + int(seconds * 1000),
+    }
+    (directory / f"{name}-{start}-result.json").write_text(json.dumps(result))
+
+
+class TestDurationModel:
+    """Test cases for the allure-based duration model"""
+
+    def test_nodeid_key_matches_allure_full_name(self):
+        """Verify pytest node ids map onto allure's fullName format"""
+        assert nodeid_key("tests/test_a.py::TestX::test_y") == "tests.test_a.TestX#test_y"
+        assert nodeid_key("tests/test_a.py::test_y[1]") == "tests.test_a#test_y[1]"
+
+    def test_recent_runs_weigh_more(self, tmp_path):
+        """Verify the moving average leans towards the latest run"""
+        write_result(tmp_path, "test_y", "tests.test_a.TestX#test_y", 1000, 10)
+        write_result(tmp_path, "test_y", "tests.test_a.TestX#test_y", 2000, 20)
+
+        model = DurationModel.from_allure_results(str(tmp_path), alpha=0.5)
+
+        assert model.estimate("tests/test_a.py::TestX::test_y") == 15
+
+    def test_skipped_runs_and_unknown_tests(self, tmp_path):
+        """Verify skipped runs are ignored and unknown tests get the median"""
+        write_result(tmp_path, "test_y", "tests.test_a.TestX#test_y", 1000, 8)
+        write_result(tmp_path, "test_z", "tests.test_a.TestX#test_z", 1000, 0, status="skipped")
+
+        model = DurationModel.from_allure_results(str(tmp_path))
+
+        assert model.estimate("tests/test_a.py::TestX::test_z") == 8
+        assert model.estimate("tests/test_b.py::test_new") == 8
+
+    def test_package_prefix_is_ignored(self, tmp_path):
+        """Verify results recorded under a parent package still match"""
+        write_result(tmp_path, "test_y", "project.tests.test_a.TestX#test_y", 1000, 5)
+
+        model = DurationModel.from_allure_results(str(tmp_path))
+
+        assert model.estimate("tests/test_a.py::TestX::test_y") == 5
+
+
+class TestScheduling:
+    """Test cases for longest-first ordering and bin packing"""
+
+    def test_longest_first_and_balanced_shards(self):
+        """Verify slow tests start first and workers finish close together"""
+        model = DurationModel({
+            "t#slow": 100, "t#mid": 60, "t#a": 40, "t#b": 30, "t#c": 30,
+        })
+        nodeids = ["t.py::a", "t.py::b", "t.py::c", "t.py::mid", "t.py::slow"]
+
+        assert order_longest_first(nodeids, model)[0] == "t.py::slow"
+
+        shards, loads = bin_pack(nodeids, model, 2)
+        assert sorted(loads) == [130, 130]
+        assert sorted(sum(shards, [])) == sorted(nodeids)
+
+    def test_mostly_unknown_tests_are_split_by_count(self):
+        """Verify one known slow test does not leave the other worker with every unknown test"""
+        model = DurationModel({"t#slow": 300}, default=1)
+        nodeids = ["t.py::slow"] + [f"t.py::new{i}" for i in range(43)]
+
+        shards, _ = bin_pack(nodeids, model, 2)
+
+        assert sorted(len(shard) for shard in shards) == [22, 22]
+        assert shards[0][0] == "t.py::slow"
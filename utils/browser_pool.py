@@ -0,0 +1,151 @@
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+
+class PooledSession:
+    """Bookkeeping for a single WebDriver session owned by the pool"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.monotonic()
+        self.uses = 0
+
+    @property
+    def age(self):
+        return time.monotonic() - self.created_at
+
+
+class BrowserPool:
+    """Pool of warm WebDriver sessions reused across tests of one worker
+
+    Sessions are reset between tests (cookies, storage, back to base URL)
+    instead of being relaunched. A session is evicted when it fails its
+    health check, has been reused ``max_reuse`` times or is older than
+    ``max_age`` seconds.
+    """
+
+    def __init__(self, factory, base_url, size=1, max_reuse=25, max_age=900):
+        """
+        Args:
+            factory: Callable returning a new WebDriver session
+            base_url: URL every session is reset to
+            size: Number of sessions to launch up front
+            max_reuse: Tests a session may serve before it is replaced
+            max_age: Seconds a session may live before it is replaced
+        """
+        self.factory = factory
+        self.base_url = base_url
+        self.size = size
+        self.max_reuse = max_reuse
+        self.max_age = max_age
+        self._idle = []
+        self._in_use = {}
+        self._lock = threading.Lock()
+        self.launched = 0
+        self.evicted = 0
+
+    # ==================== Lifecycle ====================
+
+    def prewarm(self):
+        """Launch sessions until ``size`` of them are idle"""
+        while len(self._idle) < self.size:
+            self._idle.append(self._launch())
+
+    def acquire(self):
+        """Return a healthy session ready at the base URL"""
+        while True:
+            with self._lock:
+                session = self._idle.pop() if self._idle else None
+            if session is None:
+                session = self._launch()
+                break
+            if self._is_expired(session) or not self._is_healthy(session):
+                self._evict(session)
+                continue
+            break
+
+        session.uses += 1
+        with self._lock:
+            self._in_use[id(session.driver)] = session
+        return session.driver
+
+    def release(self, driver):
+        """Reset a session and hand it back to the pool"""
+        with self._lock:
+            session = self._in_use.pop(id(driver), None)
+        if session is None:
+            return
+
+        if self._is_expired(session) or not self._reset(session):
+            self._evict(session)
+            return
+
+        with self._lock:
+            self._idle.append(session)
+
+    def close(self):
+        """Quit every session owned by the pool"""
+        with self._lock:
+            sessions = self._idle + list(self._in_use.values())
+            self._idle = []
+            self._in_use = {}
+        for session in sessions:
+            self._quit(session)
+        print(f"[POOL] Launched {self.launched} browser(s), evicted {self.evicted}")
+
+    # ==================== Internals ====================
+
+    def _launch(self):
+        driver = self.factory()
+        driver.get(self.base_url)
+        self.launched += 1
+        return PooledSession(driver)
+
+    def _is_expired(self, session):
+        return session.uses >= self.max_reuse or session.age >= self.max_age
+
+    def _is_healthy(self, session):
+        """Check the session still answers and has a single window"""
+        try:
+            handles = session.driver.window_handles
+            if not handles:
+                return False
+            return session.driver.execute_script("return document.readyState") is not None
+        except WebDriverException:
+            return False
+
+    def _reset(self, session):
+        """Clear cookies and storage, close extra windows and go home"""
+        driver = session.driver
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            try:
+                driver.execute_script(
+                    "window.localStorage.clear(); window.sessionStorage.clear();"
+                )
+            except WebDriverException:
+                # Storage is not reachable from about:blank or error pages
+                pass
+            driver.delete_all_cookies()
+            driver.get(self.base_url)
+            return True
+        except WebDriverException as e:
+            print(f"[WARNING] Browser reset failed, evicting session: {e}")
+            return False
+
+    def _evict(self, session):
+        self.evicted += 1
+        self._quit(session)
+
+    def _quit(self, session):
+        try:
+            session.driver.quit()
+        except WebDriverException:
+            pass
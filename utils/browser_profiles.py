@@ -0,0 +1,68 @@
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+
+DEFAULT_PROFILE = {
+    "headless": False,
+    "window_size": None,
+    "load_images": True,
+    "load_fonts": True,
+    "extensions": True,
+    "gpu": True,
+    "background_throttling": True,
+    "page_load_strategy": "normal",
+}
+
+FONT_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"]
+
+
+def get_profile(config, name=None):
+    """Return the named browser profile merged over the defaults
+
+    Args:
+        config: Loaded config.yaml
+        name: Profile name; falls back to ``browser_profile`` in the config
+    """
+    name = name or config.get("browser_profile", "debug")
+    profiles = config.get("browser_profiles", {})
+    if name not in profiles:
+        raise ValueError(f"Unknown browser profile '{name}'. Available: {', '.join(sorted(profiles))}")
+    profile = dict(DEFAULT_PROFILE)
+    profile.update(profiles[name] or {})
+    profile["name"] = name
+    return profile
+
+
+def build_chrome_options(profile):
+    """Translate a browser profile into ChromeOptions"""
+    chrome_options = ChromeOptions()
+    chrome_options.add_argument("--disable-notifications")
+
+    if profile["headless"]:
+        chrome_options.add_argument("--headless=new")
+    if profile["window_size"]:
+        chrome_options.add_argument(f"--window-size={profile['window_size']}")
+    else:
+        chrome_options.add_argument("--start-maximized")
+
+    if not profile["load_images"]:
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+    if not profile["extensions"]:
+        chrome_options.add_argument("--disable-extensions")
+    if not profile["gpu"]:
+        chrome_options.add_argument("--disable-gpu")
+    if not profile["background_throttling"]:
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+
+    chrome_options.page_load_strategy = profile["page_load_strategy"]
+    return chrome_options
+
+
+def apply_runtime_settings(driver, profile):
+    """Apply profile settings that need a running browser (CDP)"""
+    if not profile["load_fonts"]:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": FONT_URL_PATTERNS})
@@ -0,0 +1,159 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from utils.file_lock import FileLock
+from utils.http_client import get_http_session, api_url
+from utils.json_file import load_json, dump_json
+from utils.paths import cache_path
+
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class CleanupLedger:
+    """Entities created during the session, deleted in bulk through the API
+
+    Creators ``record()`` the id of everything they make. When the session
+    ends, ``start()`` deletes the recorded entities on a background thread,
+    ``concurrency`` requests at a time, while pytest finishes its reports.
+    ``finish()`` waits only briefly and writes whatever was not deleted
+    yet to a manifest, tagged with the API base_url; deletions still in
+    flight are repeated later and then answered with 404, which counts
+    as deleted. The next run against the
+    same base_url that gets API credentials claims those entries and
+    deletes them together with its own; entries of other environments
+    stay in the manifest.
+
+    Usage:
+        ledger.authorize(headers, cookies)   # credentials of a logged-in user
+        ledger.record("resource", 123)
+        ledger.start()                       # at session end
+        ledger.finish(timeout=5)             # before the process exits
+    """
+
+    def __init__(self, api_config, cleanup_config, manifest_path=None, session=None):
+        """
+        Args:
+            api_config: ``api`` section of the config
+            cleanup_config: ``cleanup`` section of the config
+            manifest_path: File of entities left over by earlier runs
+            session: HTTP session to use (defaults to the pooled one)
+        """
+        self.api_config = api_config
+        self.base_url = api_config["base_url"]
+        self.delete_paths = cleanup_config.get("delete_paths") or {}
+        self.concurrency = cleanup_config.get("concurrency", 8)
+        self.retries = cleanup_config.get("retries", 2)
+        self.manifest_path = manifest_path or cache_path("cleanup", "pending.json")
+        self.session = session
+        self.headers = None
+        self.cookies = None
+        self.entries = []
+        self.deleted = set()
+        self.failed = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def record(self, kind, entity_id):
+        """Remember an entity to delete at the end of the session"""
+        if entity_id is None or kind not in self.delete_paths:
+            return
+        with self._lock:
+            self.entries.append((kind, str(entity_id)))
+
+    def authorize(self, headers, cookies=None):
+        """Set the credentials used for deleting; claims leftovers of earlier runs once
+
+        Either ``headers`` or ``cookies`` may carry the credentials. Only
+        manifest entries written for this ledger's base_url are claimed.
+        """
+        first = self.headers is None
+        self.headers, self.cookies = headers or {}, cookies or {}
+        if first:
+            with FileLock(self.manifest_path + ".lock"):
+                pending = load_json(self.manifest_path, default=[])
+                leftovers = [entry for entry in pending if self._owns(entry)]
+                dump_json(self.manifest_path, [entry for entry in pending if not self._owns(entry)])
+            with self._lock:
+                self.entries.extend((kind, str(entity_id)) for _, kind, entity_id in leftovers)
+            if leftovers:
+                print(f"[CLEANUP] Retrying {len(leftovers)} deletion(s) left over by earlier runs")
+
+    def start(self):
+        """Delete every recorded entity on a background thread"""
+        if self._thread is not None or not self.entries:
+            return
+        if self.headers is None:
+            # Nothing to authenticate with in this process - keep for the next run
+            return
+        self._thread = threading.Thread(target=self._run, name="cleanup", daemon=True)
+        self._thread.start()
+
+    def finish(self, timeout=5):
+        """Wait for the background deletion; write what is left to the manifest
+
+        Returns:
+            Number of entities left for the next run
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        with self._lock:
+            remaining = [entry for entry in dict.fromkeys(self.entries) if entry not in self.deleted]
+        if remaining:
+            with FileLock(self.manifest_path + ".lock"):
+                pending = load_json(self.manifest_path, default=[])
+                known = {tuple(entry) for entry in pending}
+                pending.extend(
+                    [self.base_url, kind, entity_id] for kind, entity_id in remaining
+                    if (self.base_url, kind, entity_id) not in known
+                )
+                dump_json(self.manifest_path, pending)
+        if self.entries:
+            print(f"[CLEANUP] Deleted {len(self.deleted)}, left {len(remaining)} for the next run")
+            for (kind, entity_id), error in list(self.failed.items())[:5]:
+                print(f"[WARNING] Could not delete {kind} {entity_id}: {error}")
+        return len(remaining)
+
+    def _owns(self, entry):
+        """Whether manifest ``entry`` ([base_url, kind, id]) belongs to this ledger's API"""
+        return len(entry) == 3 and entry[0] == self.base_url
+
+    def _run(self):
+        with self._lock:
+            entries = list(dict.fromkeys(self.entries))
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            list(pool.map(self._delete, entries))
+        print(f"[CLEANUP] {len(self.deleted)}/{len(entries)} deleted in {time.monotonic() - start:.1f}s")
+
+    def _delete(self, entry):
+        kind, entity_id = entry
+        session = self.session or get_http_session(
+            pool_maxsize=max(self.concurrency, self.api_config.get("pool_maxsize", 10))
+        )
+        url = api_url(self.api_config, self.delete_paths[kind].format(id=entity_id))
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(0.5 * 2 ** (attempt - 1))
+            try:
+                response = session.delete(
+                    url, headers=self.headers, cookies=self.cookies,
+                    timeout=self.api_config.get("timeout_secs", 15),
+                )
+            except requests.RequestException as e:
+                error = e.__class__.__name__
+                continue
+            # 404: already gone, e.g. deleted by a test or an earlier attempt
+            if response.status_code < 400 or response.status_code == 404:
+                with self._lock:
+                    self.deleted.add(entry)
+                return
+            error = f"HTTP {response.status_code}"
+            if response.status_code not in RETRY_STATUSES:
+                break
+        with self._lock:
+            self.failed[entry] = error
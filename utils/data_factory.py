@@ -0,0 +1,148 @@
+import hashlib
+
+from utils.file_lock import FileLock
+from utils.json_file import load_json, dump_json
+from utils.paths import cache_path
+from utils.worker import get_data_namespace
+
+
+FIRST_NAMES = ["John", "Jane", "Mike", "Sarah", "David", "Emma", "Chris", "Lisa", "Tom", "Anna",
+               "Ravi", "Priya", "Arjun", "Meera", "Omar", "Sofia", "Liam", "Nina", "Kiran", "Zara"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+              "Reddy", "Sharma", "Iyer", "Khan", "Lopez", "Clark", "Patel", "Nair"]
+
+# Phone numbers: leading digit + 3 digits reserved for the namespace +
+# 6 digits from an affine bijection of the sequence number modulo 10^6.
+# The leading digit cycles once per 10^6 sequence numbers, so one
+# machine's index yields 4 * 10^6 distinct phones before any repeat
+PHONE_NAMESPACE_SPACE = 10 ** 3
+PHONE_SPACE = 10 ** 6
+PHONE_LEADS = "6789"
+PHONE_MULTIPLIER = 387420489  # coprime to 10
+
+
+class UniquenessIndex:
+    """Persistent sequence counter shared by every run and worker on this machine
+
+    Sequence numbers are handed out in blocks under a file lock and never
+    reused, so values derived from them do not collide on this machine.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or cache_path("data_index.json")
+
+    def reserve(self, count):
+        """Reserve ``count`` sequence numbers; returns the first one"""
+        with FileLock(self.path + ".lock"):
+            data = load_json(self.path, default={})
+            start = data.get("next", 0)
+            data["next"] = start + count
+            dump_json(self.path, data)
+        return start
+
+
+def letter_tag(number, width=3):
+    """Encode ``number`` as capitalised letters, e.g. 0 -> "Aaa", 27 -> "Abb" """
+    letters = []
+    while number or len(letters) < width:
+        number, digit = divmod(number, 26)
+        letters.append(chr(ord("a") + digit))
+    return "".join(reversed(letters)).capitalize()
+
+
+def namespace_tag(namespace, width=6):
+    """Letter tag derived from a hash of ``namespace``, e.g. "3fa2c1d0-w1" -> "Kfcfhe" """
+    number = int(hashlib.sha1(namespace.encode("utf-8")).hexdigest()[:12], 16)
+    return letter_tag(number % 26 ** width, width)
+
+
+def base36(number):
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    text = ""
+    while True:
+        number, digit = divmod(number, 36)
+        text = digits[digit] + text
+        if not number:
+            return text
+
+
+class DataFactory:
+    """Deterministic generator of unique resource test data
+
+    Every record is derived from a sequence number reserved in the
+    persistent UniquenessIndex and from the run/worker namespace. The
+    index only spans one machine, so names also carry a tag hashed from
+    the namespace and emails contain it: a fresh machine starting again
+    at sequence 0 does not repeat earlier names or emails. Phones have
+    only 3 digits for the namespace hash, kept apart from the sequence
+    digits, so runs on different machines repeat a phone only when those
+    digits coincide (about 1 in 1000 pairs of namespaces). With the same
+    namespace, seed and sequence numbers the output is identical.
+
+    Usage:
+        factory = DataFactory()
+        factory.resource()          # {"first_name": "AnnaKqbzxaBqz", ...}
+        factory.resources(10000)    # one index reservation for the batch
+    """
+
+    def __init__(self, namespace=None, seed=0, index=None, block_size=100):
+        """
+        Args:
+            namespace: Run/worker tag (defaults to get_data_namespace())
+            seed: Varies name choice and phone numbers between suites
+            index: UniquenessIndex to reserve sequence numbers from
+            block_size: Sequence numbers reserved at a time for single records
+        """
+        self.namespace = namespace or get_data_namespace()
+        self.seed = seed
+        self.index = index or UniquenessIndex()
+        self.block_size = block_size
+        self._tag = namespace_tag(self.namespace)
+        digest = int(hashlib.sha1(self.namespace.encode("utf-8")).hexdigest()[-12:], 16)
+        self._phone_prefix = digest % PHONE_NAMESPACE_SPACE
+        self._next = 0
+        self._end = 0
+
+    def sequence(self):
+        """Next unused sequence number"""
+        if self._next >= self._end:
+            self._next = self.index.reserve(self.block_size)
+            self._end = self._next + self.block_size
+        self._next += 1
+        return self._next - 1
+
+    def record(self, seq):
+        """Resource data for sequence number ``seq``"""
+        first_name = FIRST_NAMES[(seq + self.seed) % len(FIRST_NAMES)] + self._tag + letter_tag(seq)
+        last_name = LAST_NAMES[(seq // len(FIRST_NAMES) + self.seed) % len(LAST_NAMES)]
+        lead = PHONE_LEADS[seq // PHONE_SPACE % len(PHONE_LEADS)]
+        tail = (PHONE_MULTIPLIER * seq + self.seed) % PHONE_SPACE
+        return {
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": f"{first_name.lower()}.{last_name.lower()}.{self.namespace}.{base36(seq)}@yopmail.com",
+            "phone": f"{lead}{self._phone_prefix:03d}{tail:06d}",
+            "namespace": self.namespace,
+            "seq": seq,
+        }
+
+    def resource(self):
+        """One unique resource record"""
+        return self.record(self.sequence())
+
+    def resources(self, count):
+        """``count`` unique resource records from a single index reservation"""
+        start = self.index.reserve(count)
+        return [self.record(seq) for seq in range(start, start + count)]
+
+    def choose(self, catalog, name, seq, default=None):
+        """Deterministic pick from the known options of dropdown ``name``
+
+        Args:
+            catalog: OptionCatalog (or None)
+            name: Dropdown name, e.g. "primary skill"
+            seq: Sequence number of the record the value is for
+            default: Returned when the catalog has no options for ``name``
+        """
+        choices = catalog.choices(name) if catalog is not None else []
+        return choices[(seq + self.seed) % len(choices)] if choices else default
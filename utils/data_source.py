@@ -0,0 +1,66 @@
+import csv
+import json
+import os
+
+
+class DataRow(dict):
+    """One case read from a data file; ``number`` is its 0-based row number"""
+
+    def __init__(self, number, values):
+        super().__init__(values)
+        self.number = number
+
+
+def worker_shard():
+    """(index, count) of this worker under the sharding plugin, else None"""
+    count = int(os.environ.get("TEST_WORKER_COUNT", "1"))
+    if count <= 1:
+        return None
+    return int(os.environ.get("TEST_WORKER_INDEX", "0")), count
+
+
+def _read_csv(file):
+    for values in csv.DictReader(line for line in file if not line.startswith("#")):
+        yield {key.strip(): (value or "").strip() for key, value in values.items() if key}
+
+
+def _read_jsonl(file):
+    for line in file:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield json.loads(line)
+
+
+READERS = {".csv": _read_csv, ".jsonl": _read_jsonl}
+
+
+def iter_rows(path, start=0, shard=None, limit=None):
+    """Stream cases from a CSV or JSONL file, one row at a time
+
+    Only the current row is held in memory, so files with tens of
+    thousands of rows can drive an in-test loop.
+
+    Args:
+        path: .csv (header row, # comments) or .jsonl (one object per line)
+        start: Row number to resume from; earlier rows are skipped
+        shard: (index, count) - yield only rows where number % count == index
+        limit: Stop after yielding this many rows
+
+    Yields:
+        DataRow dicts with their row number
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in READERS:
+        raise ValueError(f"Unsupported data file '{path}' (use {', '.join(READERS)})")
+
+    yielded = 0
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        for number, values in enumerate(READERS[extension](file)):
+            if number < start:
+                continue
+            if shard and number % shard[1] != shard[0]:
+                continue
+            if limit is not None and yielded >= limit:
+                return
+            yielded += 1
+            yield DataRow(number, values)
@@ -0,0 +1,105 @@
+import glob
+import os
+import time
+
+from utils.file_lock import FileLock
+from utils.json_file import load_json, dump_json
+from utils.paths import cache_path
+
+
+CACHE_FILE = cache_path("chromedriver", "resolved.json")
+LOCK_FILE = CACHE_FILE + ".lock"
+WDM_DRIVERS_DIR = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver")
+
+# Per-process memo so repeated lookups never touch the disk again
+_resolved = {}
+
+
+class DriverResolutionError(RuntimeError):
+    """Raised when no usable chromedriver can be found"""
+
+
+def resolve_chromedriver(offline=False, recheck_browser_secs=3600):
+    """Return the path to a chromedriver matching the installed Chrome
+
+    Results are cached on disk keyed by Chrome major version. A cache hit
+    with the binary still present returns without any network access or
+    webdriver_manager call. The installed Chrome version itself is only
+    re-probed every ``recheck_browser_secs`` seconds.
+
+    Args:
+        offline: Never make an HTTP call; only use drivers already on disk
+        recheck_browser_secs: How long a probed Chrome version is trusted
+    """
+    memo_key = (offline,)
+    if memo_key in _resolved and os.path.isfile(_resolved[memo_key]):
+        return _resolved[memo_key]
+
+    path = _lookup(recheck_browser_secs)
+    if path is None:
+        # Slow path - serialise probing/downloading across processes
+        with FileLock(LOCK_FILE, timeout=300):
+            path = _lookup(recheck_browser_secs)
+            if path is None:
+                path = _resolve_and_store(offline)
+
+    _resolved[memo_key] = path
+    return path
+
+
+def _lookup(recheck_browser_secs):
+    """Return the cached driver for the last known Chrome major, if valid"""
+    cache = load_json(CACHE_FILE, default={})
+    browser = cache.get("browser", {})
+    if time.time() - browser.get("probed_at", 0) > recheck_browser_secs:
+        return None
+
+    path = cache.get("drivers", {}).get(str(browser.get("major")))
+    if path and os.path.isfile(path):
+        return path
+    return None
+
+
+def _resolve_and_store(offline):
+    major = _probe_chrome_major()
+    cache = load_json(CACHE_FILE, default={})
+    drivers = cache.setdefault("drivers", {})
+
+    path = drivers.get(str(major))
+    if not (path and os.path.isfile(path)):
+        path = _find_local_driver(major)
+    if path is None:
+        if offline:
+            raise DriverResolutionError(
+                f"Offline mode: no chromedriver for Chrome {major} in {WDM_DRIVERS_DIR} "
+                f"or {CACHE_FILE}. Run once online or pre-seed the driver cache."
+            )
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+
+    drivers[str(major)] = path
+    cache["browser"] = {"major": major, "probed_at": time.time()}
+    dump_json(CACHE_FILE, cache)
+    print(f"[OK] Resolved chromedriver for Chrome {major}: {path}")
+    return path
+
+
+def _probe_chrome_major():
+    """Read the installed Chrome major version from the local OS (no network)"""
+    from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+
+    version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    if not version:
+        raise DriverResolutionError("Could not detect the installed Chrome version")
+    return int(version.split(".")[0])
+
+
+def _find_local_driver(major):
+    """Find a chromedriver for ``major`` already downloaded by webdriver_manager"""
+    binary = "chromedriver.exe" if os.name == "nt" else "chromedriver"
+    pattern = os.path.join(WDM_DRIVERS_DIR, "*", f"{major}.*", "**", binary)
+    candidates = sorted(glob.glob(pattern, recursive=True), reverse=True)
+    for candidate in candidates:
+        if os.access(candidate, os.X_OK) or os.name == "nt":
+            return candidate
+    return None
@@ -0,0 +1,64 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+_sessions = {}
+_lock = threading.Lock()
+
+
+def get_http_session(pool_maxsize=10, retries=3, backoff_factor=0.3):
+    """Return the process-wide pooled ``requests.Session``
+
+    Connections are kept alive and reused across calls; idempotent
+    requests and 429/5xx responses are retried with backoff.
+
+    Args:
+        pool_maxsize: Connections kept open per host
+        retries: Retry attempts for failed requests
+        backoff_factor: Base delay between retries in seconds
+    """
+    key = (pool_maxsize, retries, backoff_factor)
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            retry = Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET", "PUT", "DELETE", "HEAD", "OPTIONS"),
+            )
+            adapter = HTTPAdapter(
+                pool_connections=pool_maxsize,
+                pool_maxsize=pool_maxsize,
+                max_retries=retry,
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[key] = session
+        return session
+
+
+def api_url(api_config, path):
+    """Join the configured API base URL and a route path"""
+    return api_config["base_url"].rstrip("/") + "/" + path.lstrip("/")
+
+
+def dig(data, dotted_path):
+    """Return ``data["a"]["b"]`` for ``dotted_path="a.b"``, or None"""
+    for key in dotted_path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def close_http_sessions():
+    """Close every pooled session (call once at the end of a run)"""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,128 @@
+import time
+
+from utils.file_lock import FileLock
+from utils.json_file import load_json, dump_json
+from utils.paths import cache_path
+
+
+# Smoothed success rate below which a candidate is considered broken
+DEMOTE_BELOW = 0.25
+
+
+def candidate_id(locator):
+    """Stable id of a (By, value) locator, e.g. "xpath=//span[text()='Manage']" """
+    return f"{locator[0]}={locator[1]}"
+
+
+class LocatorStats:
+    """Persistent hit/miss and latency statistics for fallback locators
+
+    Statistics are kept per page-object method (``key``) and candidate.
+    Hit and miss counts decay with a half-life. Candidates keep their
+    listed order (most specific first) until one keeps missing, e.g.
+    after a UI change, and is demoted behind the working fallbacks.
+
+    Usage:
+        order = stats.rank(key, locators)       # failing candidates last
+        stats.record(key, ordered, winner, latency)
+        stats.save()                             # merge into the on-disk store
+    """
+
+    def __init__(self, path=None, half_life_secs=7 * 86400):
+        self.path = path or cache_path("locator_stats.json")
+        self.half_life_secs = half_life_secs
+        self._data = load_json(self.path, default={})
+        # Changes made by this process, merged into the file on save()
+        self._deltas = {}
+
+    def rank(self, key, locators):
+        """Return indices of ``locators``, demoting candidates that keep failing
+
+        All candidates are polled together inside the page, so the order
+        only decides which one wins when several match in the same poll -
+        and there the most specific (first listed) one should. The listed
+        order is therefore kept, and a fallback that wins is never promoted
+        above a more specific candidate. Only a candidate whose smoothed
+        success rate drops below DEMOTE_BELOW (e.g. three misses and no
+        hits) moves behind the others; demoted candidates are ordered by
+        success rate, then by latency.
+        """
+        entries = self._data.get(key, {})
+        now = time.time()
+
+        def score(index):
+            entry = entries.get(candidate_id(locators[index]))
+            if not entry:
+                return 0.5, float("inf"), False
+            hits, misses = self._decayed(entry, now)
+            # Laplace smoothing keeps a single lucky hit or miss from dominating
+            rate = (hits + 1) / (hits + misses + 2)
+            latency = entry.get("latency")
+            return rate, float("inf") if latency is None else latency, rate < DEMOTE_BELOW
+
+        scores = [score(index) for index in range(len(locators))]
+        healthy = [index for index, (_, _, failing) in enumerate(scores) if not failing]
+        demoted = [index for index, (_, _, failing) in enumerate(scores) if failing]
+        return healthy + sorted(demoted, key=lambda index: (-scores[index][0], scores[index][1]))
+
+    def record(self, key, ordered_locators, winner, latency):
+        """Record the outcome of one resolve over ``ordered_locators``
+
+        Candidates tried before the winner count as misses; the winner
+        counts as a hit. ``winner=None`` means every candidate missed.
+
+        Args:
+            key: Page-object method the locators belong to
+            ordered_locators: Candidates in the order they were tried
+            winner: Position in ``ordered_locators`` that matched, or None
+            latency: Seconds the resolve took
+        """
+        tried = ordered_locators if winner is None else ordered_locators[:winner + 1]
+        for position, locator in enumerate(tried):
+            hit = position == winner
+            for store in (self._data, self._deltas):
+                entry = store.setdefault(key, {}).setdefault(candidate_id(locator), {})
+                self._apply(entry, hit, latency if hit else None)
+
+    def save(self):
+        """Merge this process's changes into the on-disk store"""
+        if not self._deltas:
+            return
+        with FileLock(self.path + ".lock"):
+            data = load_json(self.path, default={})
+            for key, candidates in self._deltas.items():
+                for cid, delta in candidates.items():
+                    entry = data.setdefault(key, {}).setdefault(cid, {})
+                    hits, misses = self._decayed(entry, time.time()) if entry else (0.0, 0.0)
+                    entry["hits"] = hits + delta.get("hits", 0.0)
+                    entry["misses"] = misses + delta.get("misses", 0.0)
+                    entry["updated"] = time.time()
+                    if "latency" in delta:
+                        entry["latency"] = delta["latency"]
+            dump_json(self.path, data)
+            self._data = data
+        self._deltas = {}
+
+    def summary(self, key):
+        """Per-candidate decayed hits/misses and latency for ``key``"""
+        now = time.time()
+        result = {}
+        for cid, entry in self._data.get(key, {}).items():
+            hits, misses = self._decayed(entry, now)
+            result[cid] = {"hits": hits, "misses": misses, "latency": entry.get("latency")}
+        return result
+
+    def _decayed(self, entry, now):
+        age = max(now - entry.get("updated", now), 0)
+        factor = 0.5 ** (age / self.half_life_secs)
+        return entry.get("hits", 0.0) * factor, entry.get("misses", 0.0) * factor
+
+    def _apply(self, entry, hit, latency):
+        now = time.time()
+        hits, misses = self._decayed(entry, now) if entry else (0.0, 0.0)
+        entry["hits"] = hits + (1 if hit else 0)
+        entry["misses"] = misses + (0 if hit else 1)
+        entry["updated"] = now
+        if latency is not None:
+            previous = entry.get("latency")
+            entry["latency"] = latency if previous is None else 0.7 * previous + 0.3 * latency
@@ -0,0 +1,123 @@
+import hashlib
+import time
+
+from utils.file_lock import FileLock
+from utils.json_file import load_json, dump_json
+from utils.paths import cache_path
+
+
+class UnknownOption(ValueError):
+    """Raised when a value is not among the known options of a dropdown"""
+
+
+def _norm(text):
+    return " ".join(str(text or "").split()).lower()
+
+
+def match_option(options, wanted):
+    """Index of the option matching ``wanted``, or -1
+
+    Same order as the in-browser matcher: data-value, exact label,
+    then label containing the wanted text (all case-insensitive).
+    """
+    target = _norm(wanted)
+    if not target:
+        return -1
+    tests = (
+        lambda option: _norm(option.get("value")) == target,
+        lambda option: _norm(option.get("label")) == target,
+        lambda option: target in _norm(option.get("label")),
+    )
+    for test in tests:
+        for index, option in enumerate(options):
+            if test(option):
+                return index
+    return -1
+
+
+class OptionCatalog:
+    """On-disk catalog of dropdown option lists, per base_url
+
+    Option lists are harvested the first time a dropdown is opened and
+    reused until they are older than ``ttl_secs``. While a list is fresh,
+    values can be checked without touching the browser.
+
+    Usage:
+        catalog = OptionCatalog("https://app.example.com", ttl_secs=86400)
+        catalog.update("role", [{"value": "qa", "label": "Quality Analyst"}])
+        catalog.resolve("role", "quality analyst")  # {"value": "qa", ...}
+        catalog.check({"role": "astronaut"})         # ["role"] - re-read from the page
+    """
+
+    def __init__(self, base_url, ttl_secs=86400, path=None):
+        self.base_url = base_url
+        self.ttl_secs = ttl_secs
+        url_hash = hashlib.sha1(base_url.encode("utf-8")).hexdigest()[:12]
+        self.path = path or cache_path("catalog", f"{url_hash}.json")
+        self._data = load_json(self.path, default={})
+
+    def options(self, name):
+        """Fresh option list for dropdown ``name``, or None if unknown/expired"""
+        entry = self._data.get(name)
+        if not entry or time.time() - entry.get("harvested", 0) > self.ttl_secs:
+            return None
+        return entry["options"]
+
+    def choices(self, name):
+        """Labels of the known options of ``name`` (empty if unknown)"""
+        return [option["label"] for option in self.options(name) or []]
+
+    def update(self, name, options):
+        """Store a freshly harvested option list for ``name``"""
+        options = [{"value": option.get("value"), "label": option.get("label")} for option in options]
+        if not options or self.options(name) == options:
+            return
+        entry = {"options": options, "harvested": time.time()}
+        with FileLock(self.path + ".lock"):
+            data = load_json(self.path, default={})
+            data[name] = entry
+            dump_json(self.path, data)
+            self._data = data
+
+    def resolve(self, name, wanted):
+        """Option matching ``wanted``
+
+        Returns:
+            The option dict, or None if ``name`` has no fresh option list
+
+        Raises:
+            UnknownOption: The list is known and nothing matches
+        """
+        options = self.options(name)
+        if options is None:
+            return None
+        index = match_option(options, wanted)
+        if index == -1:
+            raise UnknownOption(
+                f"'{wanted}' is not a valid {name}; known options: {', '.join(self.choices(name))}"
+            )
+        return options[index]
+
+    def check(self, values):
+        """Find values that are not among the known options, before the browser is touched
+
+        A list can be within its TTL and still miss options added in the
+        app since it was harvested, so a miss does not fail here. The list
+        of each such dropdown is dropped instead; MuiSelect then reads the
+        options from the page again and raises UnknownOption only if the
+        value is missing there too.
+
+        Args:
+            values: Mapping of dropdown name to wanted value
+
+        Returns:
+            Names of the dropdowns whose list did not contain the value
+        """
+        stale = []
+        for name, wanted in values.items():
+            try:
+                self.resolve(name, wanted)
+            except UnknownOption:
+                stale.append(name)
+                self._data.pop(name, None)
+        return stale
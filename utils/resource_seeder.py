@@ -0,0 +1,247 @@
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+import requests
+
+from utils.http_client import get_http_session, api_url, dig
+
+
+# Statuses worth retrying for a POST: the request was not processed
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class SeedError(Exception):
+    """Raised when a resource could not be created"""
+
+
+class SeedReport:
+    """Outcome and throughput of one seeding run"""
+
+    def __init__(self, requested):
+        self.requested = requested
+        self.created = []
+        self.failures = []
+        self.latencies = []
+        self.retries = 0
+        self.elapsed = 0.0
+
+    @property
+    def rate(self):
+        """Resources created per second"""
+        return len(self.created) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        ordered = sorted(self.latencies)
+        p50 = statistics.median(ordered) if ordered else 0.0
+        p90 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))] if ordered else 0.0
+        return (
+            f"{len(self.created)}/{self.requested} created in {self.elapsed:.1f}s "
+            f"({self.rate:.1f}/s, p50 {p50:.2f}s, p90 {p90:.2f}s, "
+            f"{self.retries} retries, {len(self.failures)} failed)"
+        )
+
+
+class ResourceSeeder:
+    """Create resources through the backend API instead of the UI modal
+
+    Requests go through the pooled ``requests.Session`` with the
+    credentials of a logged-in browser, ``concurrency`` at a time.
+    Throttled or unavailable responses (429/502/503/504) and connection
+    errors are retried with exponential backoff.
+
+    Created ids are recorded in ``ledger`` (when given) so they are
+    deleted again at the end of the session.
+
+    Both routes are off until configured: without ``create_path``
+    nothing is seeded, and without ``lookup_path`` nothing is tracked.
+
+    Usage:
+        seeder = ResourceSeeder.from_driver(driver, config, ledger=ledger)
+        report = seeder.seed(resources)
+        print(report.summary())
+    """
+
+    def __init__(self, api_config, seed_config, headers=None, cookies=None, session=None, ledger=None):
+        """
+        Args:
+            api_config: ``api`` section of the config
+            seed_config: ``seeding`` section of the config
+            headers: Auth headers sent with every request
+            cookies: Browser cookies sent with every request
+            session: HTTP session to use (defaults to the pooled one)
+            ledger: CleanupLedger recording created ids for deletion (or None)
+        """
+        self.api_config = api_config
+        self.concurrency = seed_config.get("concurrency", 8)
+        self.retries = seed_config.get("retries", 3)
+        self.backoff = seed_config.get("backoff_secs", 0.5)
+        self.create_path = seed_config.get("create_path", "")
+        self.id_field = seed_config.get("id_field", "data.id")
+        self.field_map = seed_config.get("field_map") or {}
+        self.lookup_path = seed_config.get("lookup_path", "")
+        self.lookup_items_field = seed_config.get("lookup_items_field", "data")
+        self.lookup_id_field = seed_config.get("lookup_id_field", "id")
+        self.headers = headers or {}
+        self.cookies = cookies or {}
+        self.session = session or get_http_session(
+            pool_maxsize=max(self.concurrency, api_config.get("pool_maxsize", 10))
+        )
+        self.ledger = ledger
+        self._lock = threading.Lock()
+        if self.ledger is not None and (self.headers or self.cookies):
+            self.ledger.authorize(self.headers, self.cookies)
+
+    @classmethod
+    def from_driver(cls, driver, config, session=None, ledger=None):
+        """Seeder authenticated as the user logged in to ``driver``
+
+        The token is read from localStorage (``auth.token_storage_key``)
+        and sent as ``seeding.auth_header``; cookies are sent as well.
+        """
+        auth_config = config.get("auth", {})
+        seed_config = config.get("seeding", {})
+        token = driver.execute_script(
+            "return window.localStorage.getItem(arguments[0]);",
+            auth_config.get("token_storage_key", "token"),
+        )
+        headers = {}
+        if token:
+            # Tokens are sometimes stored JSON-encoded, e.g. "\"eyJ...\""
+            try:
+                decoded = json.loads(token)
+                token = decoded if isinstance(decoded, str) else token
+            except ValueError:
+                pass
+            scheme = seed_config.get("auth_scheme", "Bearer")
+            headers[seed_config.get("auth_header", "Authorization")] = f"{scheme} {token}".strip()
+        cookies = {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+        return cls(config["api"], seed_config, headers=headers, cookies=cookies, session=session, ledger=ledger)
+
+    def payload(self, resource):
+        """Request body for ``resource``, with keys renamed by ``field_map``"""
+        return {self.field_map.get(key, key): value for key, value in resource.items()}
+
+    def create(self, resource, report=None):
+        """Create one resource; returns its id (or the response body if it has none)
+
+        Raises:
+            SeedError: The API rejected the resource or stayed unavailable
+        """
+        timeout = self.api_config.get("timeout_secs", 15)
+        for attempt in range(self.retries + 1):
+            if attempt:
+                if report is not None:
+                    with self._lock:
+                        report.retries += 1
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                response = self.session.post(
+                    api_url(self.api_config, self.create_path),
+                    json=self.payload(resource),
+                    headers=self.headers,
+                    cookies=self.cookies,
+                    timeout=timeout,
+                )
+            except requests.ConnectionError as e:
+                error = e
+                continue
+            if response.status_code in RETRY_STATUSES:
+                error = f"HTTP {response.status_code}"
+                continue
+            if response.status_code >= 400:
+                raise SeedError(f"HTTP {response.status_code}: {response.text[:200]}")
+            try:
+                body = response.json()
+            except ValueError:
+                return None
+            resource_id = dig(body, self.id_field)
+            if resource_id is None:
+                return body
+            if self.ledger is not None:
+                self.ledger.record("resource", resource_id)
+            return resource_id
+        raise SeedError(f"Gave up after {self.retries + 1} attempts: {error}")
+
+    def find_id(self, email):
+        """Id of the resource registered with ``email``, or None if not found
+
+        Only an exact (case-insensitive) email match counts, so a fuzzy
+        search endpoint cannot return somebody else's resource. Returns
+        None without a request when ``lookup_path`` is not configured.
+        """
+        if not self.lookup_path:
+            return None
+        try:
+            response = self.session.get(
+                api_url(self.api_config, self.lookup_path.format(email=quote(email))),
+                headers=self.headers,
+                cookies=self.cookies,
+                timeout=self.api_config.get("timeout_secs", 15),
+            )
+            body = response.json() if response.status_code < 400 else None
+        except (requests.RequestException, ValueError) as e:
+            print(f"[WARNING] Could not look up resource {email}: {e.__class__.__name__}")
+            return None
+        if body is None:
+            print(f"[WARNING] Could not look up resource {email}: HTTP {response.status_code}")
+            return None
+        items = dig(body, self.lookup_items_field) if self.lookup_items_field else body
+        if isinstance(items, dict):
+            items = [items]
+        email_key = self.field_map.get("email", "email")
+        for item in items or []:
+            if isinstance(item, dict) and str(item.get(email_key, "")).lower() == email.lower():
+                return dig(item, self.lookup_id_field)
+        return None
+
+    def track(self, email):
+        """Record a resource created elsewhere, e.g. through the UI, for cleanup
+
+        Returns:
+            Its id, or None if it could not be found
+        """
+        resource_id = self.find_id(email)
+        if resource_id is not None and self.ledger is not None:
+            self.ledger.record("resource", resource_id)
+        return resource_id
+
+    def seed(self, resources, concurrency=None):
+        """Create many resources, ``concurrency`` requests at a time
+
+        Returns:
+            SeedReport with the created ids in input order (failed ones omitted);
+            empty when ``create_path`` is not configured
+        """
+        resources = list(resources)
+        if not self.create_path:
+            print(f"[WARNING] seeding.create_path is not set; {len(resources)} resources not seeded")
+            return SeedReport(0)
+        report = SeedReport(len(resources))
+        results = [None] * len(resources)
+
+        def create(index):
+            start = time.monotonic()
+            try:
+                results[index] = self.create(resources[index], report)
+            except SeedError as e:
+                with self._lock:
+                    report.failures.append((index, str(e)))
+                return
+            with self._lock:
+                report.latencies.append(time.monotonic() - start)
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency or self.concurrency) as pool:
+            list(pool.map(create, range(len(resources))))
+        report.elapsed = time.monotonic() - start
+
+        failed = {index for index, _ in report.failures}
+        report.created = [result for index, result in enumerate(results) if index not in failed]
+        print(f"[SEED] {report.summary()}")
+        for index, error in report.failures[:5]:
+            print(f"[WARNING] Resource {index} not created: {error}")
+        return report
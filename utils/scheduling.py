@@ -0,0 +1,126 @@
+import glob
+import heapq
+import json
+import os
+import statistics
+
+
+class DurationModel:
+    """Expected test durations learned from allure ``*-result.json`` files
+
+    Each test's duration is an exponentially weighted moving average over
+    its runs in start order, so recent runs count more than old ones.
+    """
+
+    def __init__(self, estimates=None, default=1.0):
+        self.estimates = estimates or {}
+        self.default = default
+        # Exact keys win; otherwise the shortest key sharing the suffix
+        self._by_suffix = {key: key for key in self.estimates}
+        for key in sorted(self.estimates, key=len):
+            for suffix in _key_suffixes(key):
+                self._by_suffix.setdefault(suffix, key)
+
+    @classmethod
+    def from_allure_results(cls, results_dir, alpha=0.3):
+        """Build the model from an allure results directory
+
+        Args:
+            results_dir: Directory holding ``*-result.json`` files
+            alpha: Weight of the newest run in the moving average (0-1]
+        """
+        runs = {}
+        for path in glob.glob(os.path.join(results_dir, "*-result.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    result = json.load(file)
+                if result.get("status") == "skipped":
+                    # Skipped runs say nothing about how long the test takes
+                    continue
+                key = _allure_key(result)
+                seconds = (result["stop"] - result["start"]) / 1000.0
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+            runs.setdefault(key, []).append((result["start"], seconds))
+
+        estimates = {}
+        for key, samples in runs.items():
+            samples.sort()
+            average = samples[0][1]
+            for _, seconds in samples[1:]:
+                average = alpha * seconds + (1 - alpha) * average
+            estimates[key] = average
+
+        default = statistics.median(estimates.values()) if estimates else 1.0
+        return cls(estimates, default=default)
+
+    def estimate(self, nodeid):
+        """Expected duration in seconds of a pytest node id"""
+        key = self._by_suffix.get(nodeid_key(nodeid))
+        return self.estimates[key] if key else self.default
+
+    def known(self, nodeid):
+        """Whether the model has run history for a pytest node id"""
+        return nodeid_key(nodeid) in self._by_suffix
+
+
+def nodeid_key(nodeid):
+    """Convert a pytest node id to allure's ``module.Class#name`` form
+
+    ``tests/test_a.py::TestX::test_y[1]`` -> ``tests.test_a.TestX#test_y[1]``
+    """
+    parts = nodeid.split("::")
+    module = parts[0][:-3] if parts[0].endswith(".py") else parts[0]
+    path = ".".join([module.replace("/", ".").replace("\\", ".")] + parts[1:-1])
+    return f"{path}#{parts[-1]}"
+
+
+def _allure_key(result):
+    """``fullName`` plus any parametrisation carried in the test name"""
+    full_name = result["fullName"]
+    name = result.get("name", "")
+    if "[" in name:
+        full_name = f"{full_name.split('#')[0]}#{name}"
+    return full_name
+
+
+def _key_suffixes(key):
+    """``a.b.c#t`` -> ``a.b.c#t``, ``b.c#t``, ``c#t`` (for package-prefix drift)"""
+    path, _, name = key.partition("#")
+    components = path.split(".")
+    return [".".join(components[i:]) + "#" + name for i in range(len(components))]
+
+
+def order_longest_first(nodeids, model):
+    """Return ``nodeids`` sorted by expected duration, slowest first"""
+    return sorted(nodeids, key=model.estimate, reverse=True)
+
+
+def bin_pack(nodeids, model, count):
+    """Split tests across ``count`` workers with longest-processing-time-first
+
+    Each test, slowest first, goes to the worker with the least expected
+    work so far, which keeps the predicted finish times close together.
+    When fewer than half of the tests have run history the estimates are
+    mostly guesses, so the tests are dealt round-robin (slowest first)
+    to give every worker the same number of tests.
+
+    Returns:
+        (shards, loads): per-worker test id lists (slowest first) and
+        their predicted total durations in seconds
+    """
+    shards = [[] for _ in range(count)]
+    loads = [0.0] * count
+    if 2 * sum(1 for nodeid in nodeids if model.known(nodeid)) < len(nodeids):
+        for position, nodeid in enumerate(order_longest_first(nodeids, model)):
+            shards[position % count].append(nodeid)
+            loads[position % count] += model.estimate(nodeid)
+        return shards, loads
+
+    heap = [(0.0, index) for index in range(count)]
+    for nodeid in order_longest_first(nodeids, model):
+        load, index = heapq.heappop(heap)
+        shards[index].append(nodeid)
+        loads[index] = load + model.estimate(nodeid)
+        heapq.heappush(heap, (loads[index], index))
+    return shards, loads
@@ -0,0 +1,157 @@
+import base64
+import hashlib
+import json
+import time
+
+from utils.json_file import load_json, dump_json
+from utils.paths import cache_path
+from utils.worker import get_worker_id
+
+
+CAPTURE_STORAGE_SCRIPT = """
+function dump(storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+}
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+RESTORE_STORAGE_SCRIPT = """
+var local = arguments[0], session = arguments[1];
+Object.keys(local).forEach(function (k) { window.localStorage.setItem(k, local[k]); });
+Object.keys(session).forEach(function (k) { window.sessionStorage.setItem(k, session[k]); });
+"""
+
+
+class SessionSnapshot:
+    """Cookies plus local/session storage of an authenticated browser"""
+
+    def __init__(self, cookies, local_storage, session_storage, captured_at=None, expires_at=None):
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.session_storage = session_storage
+        self.captured_at = captured_at or time.time()
+        self.expires_at = expires_at
+
+    @classmethod
+    def capture(cls, driver, max_age=3600):
+        """Capture the authentication state of ``driver``
+
+        Args:
+            driver: WebDriver on a page of the logged-in application
+            max_age: Upper bound in seconds on how long the snapshot is trusted
+        """
+        storage = driver.execute_script(CAPTURE_STORAGE_SCRIPT)
+        snapshot = cls(
+            cookies=driver.get_cookies(),
+            local_storage=storage["local"],
+            session_storage=storage["session"],
+        )
+        snapshot.expires_at = min(
+            [snapshot.captured_at + max_age] + snapshot._credential_expiries()
+        )
+        return snapshot
+
+    def restore(self, driver, base_url):
+        """Inject the snapshot into ``driver`` and reload ``base_url``"""
+        # Cookies and storage can only be set for the origin currently loaded
+        if not driver.current_url.startswith(base_url):
+            driver.get(base_url)
+
+        for cookie in self.cookies:
+            cookie = dict(cookie)
+            if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                cookie.pop("sameSite", None)
+            driver.add_cookie(cookie)
+        driver.execute_script(RESTORE_STORAGE_SCRIPT, self.local_storage, self.session_storage)
+        driver.get(base_url)
+
+    def is_expired(self, margin=60):
+        """True if the snapshot expires within ``margin`` seconds"""
+        return self.expires_at is not None and time.time() + margin >= self.expires_at
+
+    def _credential_expiries(self):
+        """Expiry times of cookies and of JWTs kept in web storage"""
+        expiries = [c["expiry"] for c in self.cookies if c.get("expiry")]
+        for value in list(self.local_storage.values()) + list(self.session_storage.values()):
+            exp = _jwt_expiry(value)
+            if exp:
+                expiries.append(exp)
+        return expiries
+
+    def to_dict(self):
+        return {
+            "cookies": self.cookies,
+            "local_storage": self.local_storage,
+            "session_storage": self.session_storage,
+            "captured_at": self.captured_at,
+            "expires_at": self.expires_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+class SessionStore:
+    """Per-worker, per-base_url cache of session snapshots (memory + disk)"""
+
+    _memory = {}
+
+    def __init__(self, base_url, worker_id=None):
+        self.base_url = base_url
+        self.worker_id = worker_id or get_worker_id()
+        url_hash = hashlib.sha1(base_url.encode("utf-8")).hexdigest()[:12]
+        self.key = (self.worker_id, base_url)
+        self.path = cache_path("sessions", self.worker_id, f"{url_hash}.json")
+
+    def load(self):
+        """Return a cached, unexpired snapshot or None"""
+        snapshot = self._memory.get(self.key)
+        if snapshot is None:
+            data = load_json(self.path)
+            snapshot = SessionSnapshot.from_dict(data) if data else None
+        if snapshot is None or snapshot.is_expired():
+            self.invalidate()
+            return None
+        self._memory[self.key] = snapshot
+        return snapshot
+
+    def save(self, snapshot):
+        self._memory[self.key] = snapshot
+        dump_json(self.path, snapshot.to_dict())
+
+    def invalidate(self):
+        self._memory.pop(self.key, None)
+        dump_json(self.path, {})
+
+
+def _jwt_expiry(value):
+    """Return the ``exp`` claim of a JWT-looking string, else None"""
+    if not isinstance(value, str):
+        return None
+    # Tokens are often stored wrapped in JSON, e.g. {"token": "..."}
+    candidates = [value]
+    try:
+        parsed = json.loads(value)
+        if isinstance(parsed, dict):
+            candidates.extend(v for v in parsed.values() if isinstance(v, str))
+    except ValueError:
+        pass
+
+    for candidate in candidates:
+        parts = candidate.split(".")
+        if len(parts) != 3:
+            continue
+        try:
+            payload = parts[1] + "=" * (-len(parts[1]) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload))
+        except (ValueError, TypeError):
+            continue
+        if isinstance(claims, dict) and isinstance(claims.get("exp"), (int, float)):
+            return claims["exp"]
+    return None
@@ -0,0 +1,259 @@
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+from _pytest.reports import TestReport
+
+from utils.scheduling import DurationModel, bin_pack, order_longest_first
+from utils.worker import get_run_id
+
+
+WORKER_ENV = "TEST_WORKER_ID"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("sharding", "multi-process test sharding")
+    group.addoption(
+        "--workers",
+        action="store",
+        default="1",
+        help="Number of worker processes to split tests across ('auto' = CPU count)",
+    )
+    group.addoption(
+        "--schedule",
+        action="store",
+        choices=("duration", "collection"),
+        default="duration",
+        help="Order/split tests by durations learned from allure results, or keep collection order",
+    )
+    group.addoption(
+        "--duration-alpha",
+        action="store",
+        type=float,
+        default=0.3,
+        help="Weight of the most recent run in the duration moving average",
+    )
+    # Internal options passed from the controller to its workers
+    group.addoption("--shard-file", action="store", default=None, help=argparse.SUPPRESS)
+    group.addoption("--shard-report", action="store", default=None, help=argparse.SUPPRESS)
+
+
+def worker_count(config):
+    value = config.getoption("--workers")
+    count = (os.cpu_count() or 1) if value == "auto" else int(value)
+    return max(1, count)
+
+
+def is_controller(config):
+    return (
+        worker_count(config) > 1
+        and not os.environ.get(WORKER_ENV)
+        and not config.getoption("collectonly")
+    )
+
+
+def load_duration_model(config):
+    """Duration model built from the allure results of previous runs"""
+    results_dir = getattr(config.option, "allure_report_dir", None) or "allure-results"
+    return DurationModel.from_allure_results(results_dir, alpha=config.getoption("--duration-alpha"))
+
+
+def split_round_robin(nodeids, count):
+    """Deal test ids across ``count`` shards in collection order"""
+    shards = [[] for _ in range(count)]
+    for index, nodeid in enumerate(nodeids):
+        shards[index % count].append(nodeid)
+    return shards
+
+
+# ==================== Worker side ====================
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep only the tests assigned to this worker, in shard order"""
+    shard_file = config.getoption("--shard-file")
+    if not shard_file:
+        if config.getoption("--schedule") == "duration" and not is_controller(config):
+            # Slowest tests first, so long flows never start last
+            model = load_duration_model(config)
+            order = {nodeid: index for index, nodeid in
+                     enumerate(order_longest_first([item.nodeid for item in items], model))}
+            items.sort(key=lambda item: order[item.nodeid])
+        return
+    with open(shard_file, "r", encoding="utf-8") as file:
+        order = {nodeid: index for index, nodeid in enumerate(json.load(file))}
+
+    selected = sorted((item for item in items if item.nodeid in order), key=lambda item: order[item.nodeid])
+    deselected = [item for item in items if item.nodeid not in order]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+def pytest_runtest_logreport(report):
+    """Stream serialised reports back to the controller"""
+    if _worker_config is None:
+        return
+    config = _worker_config
+    data = config.hook.pytest_report_to_serializable(config=config, report=report)
+    with open(config.getoption("--shard-report"), "a", encoding="utf-8") as file:
+        file.write(json.dumps(data) + "\n")
+
+
+_worker_config = None
+
+
+def pytest_configure(config):
+    global _worker_config
+    if config.getoption("--shard-report"):
+        _worker_config = config
+
+
+# ==================== Controller side ====================
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session):
+    """Run collected tests in worker processes and replay their results"""
+    config = session.config
+    if not is_controller(config) or not session.items:
+        return None
+
+    count = min(worker_count(config), len(session.items))
+    nodeids = [item.nodeid for item in session.items]
+    if config.getoption("--schedule") == "duration":
+        shards, loads = bin_pack(nodeids, load_duration_model(config), count)
+    else:
+        shards, loads = split_round_robin(nodeids, count), None
+
+    run_id = get_run_id()
+    workdir = tempfile.mkdtemp(prefix=f"shards-{run_id}-")
+    workers = []
+    for index, shard in enumerate(shards):
+        if shard:
+            workers.append(_start_worker(config, run_id, workdir, index, len(shards), shard))
+
+    terminal = config.pluginmanager.get_plugin("terminalreporter")
+    terminal.write_line(f"[SHARD] Running {len(nodeids)} tests on {len(workers)} workers (run {run_id})")
+    if loads:
+        predicted = ", ".join(f"w{index}={load:.0f}s" for index, load in enumerate(loads))
+        terminal.write_line(f"[SHARD] Predicted worker durations: {predicted}")
+    start = time.monotonic()
+
+    items_by_id = {item.nodeid: item for item in session.items}
+    summary = []
+    keep_workdir = False
+    for worker in workers:
+        returncode = worker["process"].wait()
+        reported = _replay_reports(config, worker["report"])
+        _merge_allure_results(config, worker["alluredir"])
+        lost = [nodeid for nodeid in worker["shard"] if nodeid not in reported]
+        for nodeid in lost:
+            _report_lost_test(config, items_by_id[nodeid], worker, returncode)
+        line = f"[SHARD] {worker['id']}: {len(worker['shard'])} tests, exit code {returncode}"
+        if lost:
+            # The lost-test reports point at the worker log - keep it
+            keep_workdir = True
+            line += f", log: {worker['log']}"
+        summary.append(line)
+    if not keep_workdir:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    terminal.write_line("")
+    for line in summary:
+        terminal.write_line(line)
+    terminal.write_line(f"[SHARD] All workers done in {time.monotonic() - start:.1f}s")
+    return True
+
+
+def _start_worker(config, run_id, workdir, index, count, shard):
+    worker_id = f"w{index}"
+    shard_file = os.path.join(workdir, f"{worker_id}-tests.json")
+    report = os.path.join(workdir, f"{worker_id}-reports.jsonl")
+    alluredir = os.path.join(workdir, f"{worker_id}-allure")
+    log = os.path.join(workdir, f"{worker_id}.log")
+    with open(shard_file, "w", encoding="utf-8") as file:
+        json.dump(shard, file)
+
+    args = [
+        sys.executable, "-m", "pytest",
+        *_passthrough_args(config.invocation_params.args),
+        "--workers=1",
+        f"--shard-file={shard_file}",
+        f"--shard-report={report}",
+        "-p", "no:cacheprovider",
+    ]
+    if getattr(config.option, "allure_report_dir", None):
+        args.append(f"--alluredir={alluredir}")
+    env = dict(os.environ)
+    env.update({
+        WORKER_ENV: worker_id,
+        "TEST_WORKER_INDEX": str(index),
+        "TEST_WORKER_COUNT": str(count),
+        "TEST_RUN_ID": run_id,
+    })
+    log_file = open(log, "w", encoding="utf-8")
+    process = subprocess.Popen(
+        args, cwd=str(config.invocation_params.dir), env=env,
+        stdout=log_file, stderr=subprocess.STDOUT,
+    )
+    log_file.close()
+    return {"id": worker_id, "process": process, "shard": shard,
+            "report": report, "alluredir": alluredir, "log": log}
+
+
+def _passthrough_args(args):
+    """Drop controller-only options from the original command line"""
+    passthrough = []
+    skip_next = False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg in ("--workers", "--alluredir"):
+            skip_next = True
+            continue
+        if arg.startswith(("--workers=", "--alluredir=")):
+            continue
+        passthrough.append(arg)
+    return passthrough
+
+
+def _replay_reports(config, report_path):
+    """Feed worker reports to this session's hooks; return the test ids seen"""
+    reported = set()
+    if not os.path.exists(report_path):
+        return reported
+    with open(report_path, "r", encoding="utf-8") as file:
+        for line in file:
+            report = config.hook.pytest_report_from_serializable(config=config, data=json.loads(line))
+            if isinstance(report.longrepr, list):
+                # Skip reasons are (path, lineno, reason) tuples; JSON turns them into lists
+                report.longrepr = tuple(report.longrepr)
+            config.hook.pytest_runtest_logreport(report=report)
+            reported.add(report.nodeid)
+    return reported
+
+
+def _report_lost_test(config, item, worker, returncode):
+    report = TestReport(
+        item.nodeid, item.location, {}, "failed",
+        f"Worker {worker['id']} exited with code {returncode} before reporting this test. "
+        f"See {worker['log']}",
+        "call",
+    )
+    config.hook.pytest_runtest_logreport(report=report)
+
+
+def _merge_allure_results(config, worker_alluredir):
+    target = getattr(config.option, "allure_report_dir", None)
+    if not target or not os.path.isdir(worker_alluredir):
+        return
+    os.makedirs(target, exist_ok=True)
+    for name in os.listdir(worker_alluredir):
+        shutil.move(os.path.join(worker_alluredir, name), os.path.join(target, name))
@@ -0,0 +1,44 @@
+import statistics
+
+from utils.file_lock import FileLock
+from utils.json_file import load_json, dump_json
+from utils.paths import cache_path
+
+
+class TimingLog:
+    """Rolling on-disk log of duration samples, grouped by key
+
+    Usage:
+        log = TimingLog("browser_startup")
+        log.record("ci-fast", 1.42)
+        log.summary("ci-fast")  # {"count": ..., "mean": ..., ...}
+    """
+
+    def __init__(self, name, max_samples=50):
+        self.path = cache_path("timings", f"{name}.json")
+        self.max_samples = max_samples
+
+    def record(self, key, seconds):
+        with FileLock(self.path + ".lock"):
+            data = load_json(self.path, default={})
+            samples = data.setdefault(key, [])
+            samples.append(round(seconds, 4))
+            del samples[:-self.max_samples]
+            dump_json(self.path, data)
+
+    def samples(self, key=None):
+        data = load_json(self.path, default={})
+        return data if key is None else data.get(key, [])
+
+    def summary(self, key):
+        samples = self.samples(key)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return {
+            "count": len(samples),
+            "last": samples[-1],
+            "mean": statistics.mean(samples),
+            "median": statistics.median(samples),
+            "p90": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+        }
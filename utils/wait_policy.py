@@ -0,0 +1,104 @@
+import time
+from contextlib import contextmanager
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class WaitBudgetExceeded(BaseException):
+    """Raised when a test or step has used up its wait budget
+
+    Like pytest's own outcome exceptions this is not an ``Exception``, so
+    the ``except TimeoutException``/``except Exception`` fallbacks in page
+    objects let it through and the test fails with the budget report.
+    """
+
+
+class WaitPolicy:
+    """Time budget for one test, shared by every wait it performs
+
+    Each wait asks the policy for its timeout; the policy caps the
+    requested value by what is left of the step and test budgets, so
+    waits can no longer add up past the budget. Time spent waiting is
+    charged to the current step and to the page method that waited.
+
+    Usage:
+        policy = WaitPolicy(test_budget=300, step_budget=60)
+        with policy.step("Fill basic info"):
+            WebDriverWait(driver, policy.timeout(5))...
+    """
+
+    # Policy of the running test, installed by the wait_policy fixture
+    current = None
+
+    def __init__(self, test_budget, step_budget=None):
+        self.test_budget = test_budget
+        self.step_budget = step_budget
+        self.started = time.monotonic()
+        # Outside named steps only the test budget applies
+        self._step = ("test", self.started, None)
+        self.steps = {}
+        self.waits = {}
+
+    @contextmanager
+    def step(self, name, budget=None):
+        """Run a block as a named step with its own budget"""
+        previous = self._step
+        self._step = (name, time.monotonic(), budget or self.step_budget)
+        try:
+            yield self
+        finally:
+            self.steps[name] = self.steps.get(name, 0.0) + time.monotonic() - self._step[1]
+            self._step = previous
+
+    def remaining(self):
+        """Seconds left before the test or current step budget runs out"""
+        now = time.monotonic()
+        left = self.test_budget - (now - self.started)
+        name, step_start, step_budget = self._step
+        if step_budget:
+            left = min(left, step_budget - (now - step_start))
+        return left
+
+    def timeout(self, requested):
+        """Timeout for a single wait: ``requested`` capped by the budget"""
+        left = self.remaining()
+        if left <= 0:
+            raise WaitBudgetExceeded(self.report(f"Wait budget exhausted in step '{self._step[0]}'"))
+        return min(requested, left)
+
+    def charge(self, label, seconds):
+        """Account ``seconds`` of waiting to ``label`` within the current step"""
+        key = f"{self._step[0]} / {label}"
+        self.waits[key] = self.waits.get(key, 0.0) + seconds
+
+    def report(self, headline="Wait budget usage", top=5):
+        elapsed = time.monotonic() - self.started
+        lines = [f"{headline} ({elapsed:.1f}s of {self.test_budget}s used)"]
+        for name, seconds in sorted(self.steps.items(), key=lambda item: -item[1])[:top]:
+            lines.append(f"  step  {seconds:7.2f}s  {name}")
+        for name, seconds in sorted(self.waits.items(), key=lambda item: -item[1])[:top]:
+            lines.append(f"  wait  {seconds:7.2f}s  {name}")
+        return "\n".join(lines)
+
+
+class BudgetedWait(WebDriverWait):
+    """WebDriverWait that charges its waiting time to the current policy"""
+
+    def __init__(self, driver, timeout, label, policy=None, **kwargs):
+        super().__init__(driver, timeout, **kwargs)
+        self.label = label
+        self.policy = policy
+
+    def until(self, method, message=""):
+        return self._measure(super().until, method, message)
+
+    def until_not(self, method, message=""):
+        return self._measure(super().until_not, method, message)
+
+    def _measure(self, wait, method, message):
+        start = time.monotonic()
+        try:
+            return wait(method, message)
+        finally:
+            if self.policy is not None:
+                self.policy.charge(self.label, time.monotonic() - start)
@@ -0,0 +1,23 @@
+import os
+import uuid
+
+
+def get_worker_id():
+    """Return the id of the current test worker ("main" when not sharded)"""
+    return (
+        os.environ.get("TEST_WORKER_ID")
+        or os.environ.get("PYTEST_XDIST_WORKER")
+        or "main"
+    )
+
+
+def get_run_id():
+    """Return the id shared by all workers of the current run"""
+    if not os.environ.get("TEST_RUN_ID"):
+        os.environ["TEST_RUN_ID"] = uuid.uuid4().hex[:8]
+    return os.environ["TEST_RUN_ID"]
+
+
+def get_data_namespace():
+    """Return a namespace unique to this run and worker, e.g. "3fa2c1d0-w1" """
+    return f"{get_run_id()}-{get_worker_id()}"